@@ -0,0 +1,334 @@
+import math
+import os
+import random
+import subprocess
+import sys
+
+import pygame
+import src.core.settings as settings
+from src.core.profiler import Profiler
+from src.core.particles import ParticleSystem
+from src.core.runtime import SimulatedClock
+from src.core.replay import read_replay, play_replay, seed_session
+from src.core.rng import reseed
+from src.headless import create_headless_game, create_replay_game, WanderInput, run_ticks
+from src.world.map_format import load_location
+from world.level_manager import Map
+from entities.friendly_npc import NPC
+from entities.enemies.deep_one import DeepOne
+from entities.enemies.men_of_leng import ManOfLeng
+from entities.enemies.ghast import Ghast
+from entities.enemies.shoggoth import Shoggoth
+from entities.enemies.hound_of_tindalos import HoundOfTindalos
+from entities.enemies.night_gaunt import NightGaunt
+from entities.enemies.shantak import Shantak
+from entities.enemies.nameless_city_dweller import NamelessCityDweller
+from benchmarks.harness import Benchmark
+
+LOCATION_NAMES = ("port", "village")
+ENEMY_TYPES = (DeepOne, ManOfLeng, Ghast, Shoggoth, HoundOfTindalos, NightGaunt, Shantak, NamelessCityDweller)
+ENEMY_COUNTS = (10, 50, 100)
+PATH_QUERIES = 32
+SCREEN_SIZE = (1280, 720)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPLAY_DIR = os.path.join(ROOT, "benchmarks", "replays")
+
+STARTUP_SNIPPET = """
+import os, runpy
+import pygame
+import src.core.settings as settings
+settings.startup_log = False
+def flip():
+    os._exit(0)
+pygame.display.flip = flip
+runpy.run_path("src/main.py", run_name="__main__")
+"""
+
+
+def walkable_tiles(game_map):
+    return [(x, y) for y in range(game_map.height_tiles) for x in range(game_map.width_tiles) if game_map.is_walkable(x, y)]
+
+
+def camera_path(game_map, view_size, steps=32):
+    max_x = max(0, game_map.width - view_size[0])
+    max_y = max(0, game_map.height - view_size[1])
+    return [
+        (int(max_x * (0.5 + 0.5 * math.sin(i * 2 * math.pi / steps))),
+         int(max_y * (0.5 + 0.5 * math.cos(i * 2 * math.pi / steps))))
+        for i in range(steps)
+    ]
+
+
+def setup_map_construct(name):
+    def setup():
+        def run():
+            Map(load_location(name))
+        return run
+    return setup
+
+
+def setup_map_draw(name, size):
+    def setup():
+        game_map = Map(load_location(name))
+        surface = pygame.Surface(size)
+        cameras = camera_path(game_map, size)
+        state = {"i": 0}
+
+        def run():
+            cam_x, cam_y = cameras[state["i"] % len(cameras)]
+            state["i"] += 1
+            game_map.draw(surface, cam_x, cam_y)
+        return run
+    return setup
+
+
+def create_game_with_enemies(count, seed=0):
+    seed_session({"random": seed})
+    game = create_headless_game("port", SCREEN_SIZE, clock=SimulatedClock(),
+                                input_source=WanderInput(SCREEN_SIZE, seed=seed))
+    game.clear_enemies()
+
+    rng = random.Random(seed)
+    tiles = walkable_tiles(game.map)
+    for i in range(count):
+        x, y = rng.choice(tiles)
+        game.add_enemy(ENEMY_TYPES[i % len(ENEMY_TYPES)](game, (x + 0.5, y + 0.5)))
+    # The wandering player walks into fights, and a respawn resets the roster to the map's own enemies, so it gets a
+    # health pool that outlasts every repeat.
+    game.player.max_health = game.player.health = 10 ** 9
+    return game
+
+
+def setup_game_update(count):
+    def setup():
+        game = create_game_with_enemies(count)
+
+        def run():
+            run_ticks(game, 1)
+        return run
+    return setup
+
+
+def setup_game_draw(count):
+    def setup():
+        game = create_game_with_enemies(count)
+        run_ticks(game, 30)
+
+        def run():
+            game.draw()
+        return run
+    return setup
+
+
+def setup_find_path(name):
+    def setup():
+        game = create_headless_game(name, SCREEN_SIZE, clock=SimulatedClock())
+        game.set_map(Map(load_location(name)), 20, 20)
+        npc = NPC(game, pos=(20.5, 20.5))
+        rng = random.Random(1)
+        tiles = walkable_tiles(game.map)
+        queries = [(rng.choice(tiles), rng.choice(tiles)) for _ in range(PATH_QUERIES)]
+        pathfinder = game.map.pathfinder
+
+        def run():
+            for start, goal in queries:
+                pathfinder.invalidate()
+                pathfinder.begin_frame()
+                npc.find_path(start, goal)
+        return run
+    return setup
+
+
+def setup_replay(name):
+    def setup():
+        replay = read_replay(os.path.join(REPLAY_DIR, name + ".grpl"))
+
+        def run():
+            play_replay(create_replay_game(replay))
+        return run
+    return setup
+
+
+def fill_particles(particles, rng):
+    while particles.count < particles.capacity:
+        angle = rng.uniform(0, 2 * math.pi)
+        speed = rng.uniform(2, 6)
+        particles.emit(640, 360, math.cos(angle) * speed, math.sin(angle) * speed,
+                       rng.randint(20, 40), rng.randint(2, 5), (rng.randint(120, 200), 0, 0))
+
+
+def setup_particles_update():
+    particles = ParticleSystem(capacity=512, gravity=0.2, shrink=0.05)
+    rng = random.Random(2)
+
+    def run():
+        fill_particles(particles, rng)
+        particles.update()
+    return run
+
+
+def setup_particles_draw():
+    particles = ParticleSystem(capacity=512, gravity=0.2, shrink=0.05)
+    fill_particles(particles, random.Random(3))
+    screen = pygame.Surface(SCREEN_SIZE)
+
+    def run():
+        particles.draw(screen, 0, 0)
+    return run
+
+
+def setup_rain():
+    from src.ui.weather import Rain
+    reseed(4)
+    rain = Rain(pygame.Surface(SCREEN_SIZE), intensity=100)
+
+    def run():
+        rain.update()
+        rain.draw()
+    return run
+
+
+def setup_fog():
+    from src.ui.weather import Fog
+    reseed(5)
+    fog = Fog(pygame.Surface(SCREEN_SIZE), density=30)
+
+    def run():
+        fog.update()
+        fog.draw()
+    return run
+
+
+def setup_dialogue_box():
+    from src.ui.elements.dialogue_box import DialogueBox
+    screen = pygame.Surface(SCREEN_SIZE)
+    box = DialogueBox(screen)
+    box.start("Elder", {
+        "start": {
+            "text": "Знову ти? Твої кроки звучать занадто гучно для цього мертвого місця...",
+            "choices": [{"text": "Так", "next": "end"}, {"text": "Ні", "next": "end"}],
+        },
+    })
+    box.current_char = len(box.text_to_render)
+    box.is_text_complete = True
+
+    def run():
+        box.update(16)
+        box.draw()
+    return run
+
+
+def setup_toast():
+    from src.ui.elements.toast import Toast
+    from src.core.text_cache import get_font
+    screen = pygame.Surface(SCREEN_SIZE)
+    font_small = get_font(None, 28)
+    toast = Toast()
+
+    def run():
+        if not toast.message:
+            toast.show("Entered Village", 10 ** 9)
+        toast.draw(screen, font_small)
+    return run
+
+
+def setup_death_screen():
+    from src.ui.elements.death_screen import DeathScreen
+    screen = pygame.Surface(SCREEN_SIZE)
+    death_screen = DeathScreen(*SCREEN_SIZE)
+    death_screen.show()
+
+    def run():
+        death_screen.update()
+        death_screen.draw(screen)
+    return run
+
+
+def setup_pause_menu():
+    from ui.pause_menu.pause_menu import PauseMenu
+    screen = pygame.Surface(SCREEN_SIZE)
+    pause_menu = PauseMenu(screen)
+    pause_menu.show()
+
+    def run():
+        pause_menu.draw()
+    return run
+
+
+def setup_main_menu():
+    from ui.menu.menu import Menu
+    menu = Menu(pygame.Surface(SCREEN_SIZE))
+
+    def run():
+        menu.draw()
+    return run
+
+
+def setup_profiler_overlay():
+    screen = pygame.Surface(SCREEN_SIZE)
+    profiler = Profiler(history=240, refresh_every=1)
+    rng = random.Random(6)
+    for _ in range(240):
+        profiler.begin_frame()
+        for name in ("game.update", "game.draw", "rain", "fog", "ui", "flip"):
+            profiler.add_sample(name, rng.uniform(0.1, 4.0))
+        profiler.end_frame()
+    profiler.toggle_overlay()
+
+    def run():
+        profiler.overlay_surface = None
+        profiler.draw(screen)
+    return run
+
+
+def setup_brightness():
+    from src.core.surface_pool import get_scrim
+    screen = pygame.Surface(SCREEN_SIZE)
+
+    def run():
+        screen.blit(get_scrim(SCREEN_SIZE, (0, 0, 0), 76), (0, 0))
+    return run
+
+
+def setup_startup():
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([ROOT, os.path.join(ROOT, "src"), env.get("PYTHONPATH", "")])
+
+    def run():
+        subprocess.run([sys.executable, "-c", STARTUP_SNIPPET], cwd=ROOT, env=env, capture_output=True, check=True)
+    return run
+
+
+def collect_benchmarks(include_startup=True):
+    benchmarks = []
+    if include_startup:
+        benchmarks.append(Benchmark("startup.process_to_first_frame", setup_startup, repeat=5, warmup=1))
+
+    for name in LOCATION_NAMES:
+        benchmarks.append(Benchmark(f"map.construct.{name}", setup_map_construct(name), number=5, repeat=20))
+    for width, height in settings.screen_resolutions:
+        benchmarks.append(Benchmark(f"map.draw.{width}x{height}", setup_map_draw("port", (width, height)), number=10))
+
+    for count in ENEMY_COUNTS:
+        benchmarks.append(Benchmark(f"game.update.enemies_{count}", setup_game_update(count), number=10))
+    benchmarks.append(Benchmark("game.draw.enemies_50", setup_game_draw(50), number=10))
+
+    for name in sorted(os.path.splitext(entry)[0] for entry in os.listdir(REPLAY_DIR) if entry.endswith(".grpl")):
+        benchmarks.append(Benchmark(f"replay.{name}", setup_replay(name), number=1, repeat=10, warmup=1))
+
+    for name in LOCATION_NAMES:
+        benchmarks.append(Benchmark(f"npc.find_path.{name}", setup_find_path(name), number=1, repeat=20))
+
+    benchmarks.append(Benchmark("particles.update", setup_particles_update, number=20))
+    benchmarks.append(Benchmark("particles.draw", setup_particles_draw, number=20))
+    benchmarks.append(Benchmark("weather.rain", setup_rain, number=20))
+    benchmarks.append(Benchmark("weather.fog", setup_fog, number=20))
+
+    benchmarks.append(Benchmark("ui.main_menu", setup_main_menu, number=10))
+    benchmarks.append(Benchmark("ui.dialogue_box", setup_dialogue_box, number=20))
+    benchmarks.append(Benchmark("ui.toast", setup_toast, number=20))
+    benchmarks.append(Benchmark("ui.death_screen", setup_death_screen, number=20))
+    benchmarks.append(Benchmark("ui.pause_menu", setup_pause_menu, number=20))
+    benchmarks.append(Benchmark("ui.profiler_overlay", setup_profiler_overlay, number=10))
+    benchmarks.append(Benchmark("ui.brightness", setup_brightness, number=20))
+    return benchmarks
@@ -0,0 +1,110 @@
+import json
+import os
+import platform
+import statistics
+import time
+
+import pygame
+
+
+class Benchmark:
+    def __init__(self, name, setup, number=1, repeat=30, warmup=3):
+        self.name = name
+        self.setup = setup
+        self.number = number
+        self.repeat = repeat
+        self.warmup = warmup
+
+
+def measure(run, number=1, repeat=30, warmup=3):
+    for _ in range(warmup):
+        run()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        samples.append((time.perf_counter() - start) * 1000.0 / number)
+    return samples
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "median_ms": round(statistics.median(ordered), 4),
+        "mean_ms": round(statistics.fmean(ordered), 4),
+        "min_ms": round(ordered[0], 4),
+        "max_ms": round(ordered[-1], 4),
+        "stdev_ms": round(statistics.stdev(ordered), 4) if len(ordered) > 1 else 0.0,
+        "runs": len(ordered),
+    }
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(str(part) for part in pygame.get_sdl_version()),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "video_driver": os.environ.get("SDL_VIDEODRIVER", ""),
+    }
+
+
+def run_benchmarks(benchmarks, name_filter=None, repeat_scale=1.0, log=print):
+    results = {}
+    for bench in benchmarks:
+        if name_filter and name_filter not in bench.name:
+            continue
+        run = bench.setup()
+        repeat = max(3, int(bench.repeat * repeat_scale))
+        samples = measure(run, bench.number, repeat, bench.warmup)
+        results[bench.name] = summarize(samples)
+        if log is not None:
+            log(f"{bench.name:<40}{results[bench.name]['median_ms']:10.3f} ms")
+    return {"environment": environment(), "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "results": results}
+
+
+def save_results(path, report):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(report, baseline, threshold=0.3, min_delta_ms=0.05):
+    rows = []
+    base_results = baseline.get("results", {})
+    for name, result in sorted(report["results"].items()):
+        base = base_results.get(name)
+        if base is None:
+            rows.append({"name": name, "baseline_ms": None, "current_ms": result["median_ms"], "ratio": None, "status": "new"})
+            continue
+
+        base_ms = base["median_ms"]
+        current_ms = result["median_ms"]
+        ratio = current_ms / base_ms if base_ms > 0 else float("inf")
+        status = "ok"
+        if current_ms - base_ms > min_delta_ms and ratio > 1.0 + threshold:
+            status = "regression"
+        elif base_ms - current_ms > min_delta_ms and ratio < 1.0 / (1.0 + threshold):
+            status = "improved"
+        rows.append({"name": name, "baseline_ms": base_ms, "current_ms": current_ms, "ratio": round(ratio, 3), "status": status})
+    return rows
+
+
+def format_comparison(rows):
+    lines = [f"{'benchmark':<40}{'baseline':>12}{'current':>12}{'ratio':>8}  status"]
+    for row in rows:
+        base = f"{row['baseline_ms']:.3f}" if row["baseline_ms"] is not None else "-"
+        ratio = f"{row['ratio']:.2f}" if row["ratio"] is not None else "-"
+        lines.append(f"{row['name']:<40}{base:>12}{row['current_ms']:>12.3f}{ratio:>8}  {row['status']}")
+    return "\n".join(lines)
@@ -0,0 +1,70 @@
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (os.path.join(ROOT, "src"), ROOT):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+os.chdir(ROOT)
+
+import argparse
+import contextlib
+import json
+import pygame
+from benchmarks.harness import run_benchmarks, save_results, load_results, compare, format_comparison
+from benchmarks.cases import collect_benchmarks
+
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+DEFAULT_OUTPUT = os.path.join("benchmarks", "results", "latest.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the headless performance benchmarks.")
+    parser.add_argument("--filter", default=None, help="only run benchmarks whose name contains this text")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write the JSON results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.3,
+                        help="allowed slowdown before a benchmark counts as a regression (0.3 = 30%%)")
+    parser.add_argument("--min-delta", type=float, default=0.05,
+                        help="ignore differences smaller than this many milliseconds")
+    parser.add_argument("--repeat-scale", type=float, default=1.0, help="scale the number of timed repeats")
+    parser.add_argument("--no-startup", action="store_true", help="skip the subprocess startup benchmark")
+    parser.add_argument("--update-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--json", action="store_true", help="print the comparison as JSON instead of a table")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1280, 720))
+
+    with contextlib.redirect_stdout(sys.stderr if args.json else sys.stdout):
+        report = run_benchmarks(collect_benchmarks(include_startup=not args.no_startup), args.filter,
+                                args.repeat_scale, log=print)
+    save_results(args.output, report)
+
+    if args.update_baseline:
+        save_results(args.baseline, report)
+        if not args.json:
+            print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        if not args.json:
+            print(f"no baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    rows = compare(report, load_results(args.baseline), args.threshold, args.min_delta)
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if args.json:
+        print(json.dumps({"results": report["results"], "comparison": rows, "regressions": len(regressions)}, indent=2))
+    else:
+        print()
+        print(format_comparison(rows))
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%} threshold")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+import pygame
+from src.core.settings import tile_size
+
+NEAR = "near"
+MID = "mid"
+FAR = "far"
+DORMANT = "dormant"
+TIERS = (NEAR, MID, FAR, DORMANT)
+
+
+class AILodScheduler:
+    def __init__(self, near_range=12, mid_range=24, far_range=48, mid_interval=2, far_interval=6,
+                 regroup_interval=10, view_margin=tile_size * 2, max_dt=250):
+        self.near_range_sq = near_range * near_range
+        self.mid_range_sq = mid_range * mid_range
+        self.far_range_sq = far_range * far_range
+        self.intervals = {MID: mid_interval, FAR: far_interval}
+        self.regroup_interval = regroup_interval
+        self.view_margin = view_margin
+        self.max_dt = max_dt
+
+        self.tiers = {}
+        self.pending_dt = {}
+        self.phases = {}
+        self.next_phase = 0
+        self.frame = 0
+
+        self.counts = dict.fromkeys(TIERS, 0)
+        self.ticks_run = 0
+        self.ticks_skipped = 0
+
+    def classify(self, enemy, player_x, player_y, view):
+        if view is not None and view.colliderect(enemy.rect):
+            return NEAR
+
+        dx = enemy.pos.x - player_x
+        dy = enemy.pos.y - player_y
+        dist_sq = dx * dx + dy * dy
+        if dist_sq <= self.near_range_sq:
+            return NEAR
+        if dist_sq <= self.mid_range_sq:
+            return MID
+        if dist_sq <= self.far_range_sq:
+            return FAR
+        return DORMANT
+
+    def assign(self, enemy, tier):
+        self.tiers[enemy] = tier
+        if enemy not in self.phases:
+            self.phases[enemy] = self.next_phase
+            self.next_phase += 1
+        if tier == DORMANT:
+            self.pending_dt.pop(enemy, None)
+
+    def wake(self, enemy):
+        self.assign(enemy, NEAR)
+
+    def regroup(self, enemies, player_x, player_y, view):
+        alive = set(enemies)
+        self.tiers = {enemy: tier for enemy, tier in self.tiers.items() if enemy in alive}
+        self.phases = {enemy: phase for enemy, phase in self.phases.items() if enemy in alive}
+        self.pending_dt = {enemy: dt for enemy, dt in self.pending_dt.items() if enemy in alive}
+
+        for enemy in enemies:
+            self.assign(enemy, self.classify(enemy, player_x, player_y, view))
+
+        counts = dict.fromkeys(TIERS, 0)
+        for tier in self.tiers.values():
+            counts[tier] += 1
+        self.counts = counts
+
+    def snapshot(self, enemies):
+        return {
+            "frame": self.frame,
+            "next_phase": self.next_phase,
+            "enemies": [[self.tiers.get(enemy), self.phases.get(enemy), self.pending_dt.get(enemy)]
+                        for enemy in enemies],
+        }
+
+    def apply(self, enemies, state):
+        self.frame = state["frame"]
+        self.next_phase = state["next_phase"]
+        self.tiers = {}
+        self.phases = {}
+        self.pending_dt = {}
+        for enemy, (tier, phase, pending) in zip(enemies, state["enemies"]):
+            if tier is not None:
+                self.tiers[enemy] = tier
+            if phase is not None:
+                self.phases[enemy] = phase
+            if pending is not None:
+                self.pending_dt[enemy] = pending
+
+    def view_rect(self, camera_x, camera_y, size):
+        margin = self.view_margin
+        return pygame.Rect(int(camera_x) - margin, int(camera_y) - margin, size[0] + margin * 2, size[1] + margin * 2)
+
+    def update(self, enemies, dt, player_x, player_y, view=None):
+        enemies = enemies.sprites() if hasattr(enemies, "sprites") else list(enemies)
+        if self.frame % self.regroup_interval == 0:
+            self.regroup(enemies, player_x, player_y, view)
+        self.frame += 1
+
+        for enemy in enemies:
+            tier = self.tiers.get(enemy)
+            if tier is None:
+                tier = self.classify(enemy, player_x, player_y, view)
+                self.assign(enemy, tier)
+
+            if tier == DORMANT:
+                self.ticks_skipped += 1
+                continue
+
+            pending = self.pending_dt.get(enemy, 0.0) + dt
+            interval = self.intervals.get(tier, 1)
+            if interval > 1 and (self.frame + self.phases[enemy]) % interval:
+                self.pending_dt[enemy] = pending
+                self.ticks_skipped += 1
+                continue
+
+            self.pending_dt[enemy] = 0.0
+            self.ticks_run += 1
+            enemy.update(dt=min(pending, self.max_dt))
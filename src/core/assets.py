@@ -0,0 +1,143 @@
+import os
+import threading
+
+import pygame
+from src.core.runtime import prepare_surface
+
+
+class AssetManager:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.raw = {}
+        self.images = {}
+        self.variants = {}
+        self.missing = set()
+        self.preload_threads = []
+        self.loads = 0
+        self.hits = 0
+
+    def decode(self, path):
+        with self.lock:
+            if path in self.raw or path in self.missing:
+                return self.raw.get(path)
+
+        surface = None
+        if os.path.exists(path):
+            try:
+                surface = pygame.image.load(path)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Failed to load image: {path}. Error: {e}")
+
+        with self.lock:
+            if surface is None:
+                self.missing.add(path)
+            elif path not in self.raw:
+                self.raw[path] = surface
+                self.loads += 1
+            return self.raw.get(path)
+
+    def get_image(self, path, alpha=True, size=None):
+        key = (path, alpha)
+        image = self.images.get(key)
+        if image is None:
+            source = self.images.get((path, not alpha))
+            if source is None:
+                source = self.decode(path)
+            if source is None:
+                return None
+            image = prepare_surface(source, alpha)
+            self.images[key] = image
+            if image is not source:
+                with self.lock:
+                    self.raw.pop(path, None)
+        else:
+            self.hits += 1
+
+        if size is None:
+            return image
+
+        size = (int(size[0]), int(size[1]))
+        if size == image.get_size():
+            return image
+
+        variant_key = (path, alpha, size)
+        variant = self.variants.get(variant_key)
+        if variant is None:
+            variant = pygame.transform.scale(image, size)
+            self.variants[variant_key] = variant
+        return variant
+
+    def is_loaded(self, path):
+        return path in self.raw or (path, True) in self.images or (path, False) in self.images
+
+    def preload(self, paths):
+        paths = [path for path in paths if not self.is_loaded(path) and path not in self.missing]
+        if not paths:
+            return None
+
+        def worker():
+            for path in paths:
+                self.decode(path)
+
+        thread = threading.Thread(target=worker, name="asset-preload", daemon=True)
+        self.preload_threads = [t for t in self.preload_threads if t.is_alive()]
+        self.preload_threads.append(thread)
+        thread.start()
+        return thread
+
+    def is_preloading(self):
+        return any(thread.is_alive() for thread in self.preload_threads)
+
+    def wait(self, timeout=None):
+        for thread in self.preload_threads:
+            thread.join(timeout)
+        self.preload_threads = [t for t in self.preload_threads if t.is_alive()]
+
+    def drop_variants(self, path=None, keep_size=None):
+        self.variants = {
+            key: surface for key, surface in self.variants.items()
+            if (path is not None and key[0] != path) or key[2] == keep_size
+        }
+
+    def unload(self, path):
+        with self.lock:
+            self.raw.pop(path, None)
+            self.missing.discard(path)
+        self.images = {key: surface for key, surface in self.images.items() if key[0] != path}
+        self.drop_variants(path)
+
+    def clear(self):
+        with self.lock:
+            self.raw.clear()
+            self.missing.clear()
+        self.images.clear()
+        self.variants.clear()
+
+    def memory_report(self):
+        def total(surfaces):
+            return sum(s.get_width() * s.get_height() * s.get_bytesize() for s in surfaces)
+
+        with self.lock:
+            raw = list(self.raw.values())
+        images = list(self.images.values())
+        variants = list(self.variants.values())
+        return {
+            "raw": {"count": len(raw), "bytes": total(raw)},
+            "images": {"count": len(images), "bytes": total(images)},
+            "variants": {"count": len(variants), "bytes": total(variants)},
+            "total_bytes": total(raw) + total(images) + total(variants),
+            "missing": len(self.missing),
+            "loads": self.loads,
+            "hits": self.hits,
+        }
+
+    def format_memory_report(self):
+        report = self.memory_report()
+        mb = 1024 * 1024
+        return (f"assets: {report['raw']['count']} decoded ({report['raw']['bytes'] / mb:.1f} MB), "
+                f"{report['images']['count']} converted ({report['images']['bytes'] / mb:.1f} MB), "
+                f"{report['variants']['count']} scaled ({report['variants']['bytes'] / mb:.1f} MB), "
+                f"total {report['total_bytes'] / mb:.1f} MB, {report['loads']} disk loads, {report['hits']} hits")
+
+
+assets = AssetManager()
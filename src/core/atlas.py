@@ -0,0 +1,98 @@
+import pygame
+from src.core.runtime import prepare_surface
+
+
+class TextureAtlas:
+    def __init__(self, page_size=(1024, 1024), padding=1):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []
+        self.regions = {}
+
+        self.shelf_page = None
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def __contains__(self, key):
+        return key in self.regions
+
+    def new_page(self, size):
+        page = prepare_surface(pygame.Surface(size, pygame.SRCALPHA))
+        page.fill((0, 0, 0, 0))
+        self.pages.append(page)
+        return len(self.pages) - 1
+
+    def new_shelf_page(self):
+        self.shelf_page = self.new_page(self.page_size)
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def allocate(self, width, height):
+        page_w, page_h = self.page_size
+        if width > page_w or height > page_h:
+            return self.new_page((width, height)), pygame.Rect(0, 0, width, height)
+
+        if self.shelf_page is None:
+            self.new_shelf_page()
+
+        if self.shelf_x + width > page_w:
+            self.shelf_y += self.shelf_height + self.padding
+            self.shelf_x = 0
+            self.shelf_height = 0
+
+        if self.shelf_y + height > page_h:
+            self.new_shelf_page()
+
+        rect = pygame.Rect(self.shelf_x, self.shelf_y, width, height)
+        self.shelf_x += width + self.padding
+        self.shelf_height = max(self.shelf_height, height)
+        return self.shelf_page, rect
+
+    def bake(self, surface):
+        alpha = surface.get_alpha()
+        if surface.get_flags() & pygame.SRCALPHA and alpha in (None, 255):
+            return surface
+
+        opaque = surface.copy()
+        opaque.set_alpha(None)
+        baked = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        baked.blit(opaque, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        if alpha is not None and alpha != 255:
+            baked.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        return baked
+
+    def add(self, key, surface):
+        region = self.regions.get(key)
+        if region is not None:
+            return region
+
+        page_index, rect = self.allocate(surface.get_width(), surface.get_height())
+        self.pages[page_index].blit(self.bake(surface), rect, special_flags=pygame.BLEND_RGBA_MAX)
+
+        region = (page_index, rect)
+        self.regions[key] = region
+        return region
+
+    def get(self, key):
+        region = self.regions.get(key)
+        if region is None:
+            return None
+        page_index, rect = region
+        return self.pages[page_index], rect
+
+    def render_item(self, key, dest):
+        page_index, rect = self.regions[key]
+        return self.pages[page_index], dest, rect
+
+    def clear(self):
+        self.pages = []
+        self.regions = {}
+        self.shelf_page = None
+        self.shelf_x = 0
+        self.shelf_y = 0
+        self.shelf_height = 0
+
+    def memory_bytes(self):
+        return sum(page.get_width() * page.get_height() * page.get_bytesize() for page in self.pages)
@@ -0,0 +1,128 @@
+import pygame
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+VECTOR_MIN = 32
+
+
+class ParticleSystem:
+    def __init__(self, capacity=512, gravity=0.0, shrink=0.0):
+        self.capacity = capacity
+        self.gravity = gravity
+        self.shrink = shrink
+        self.count = 0
+
+        self.x = array("f", [0.0]) * capacity
+        self.y = array("f", [0.0]) * capacity
+        self.vx = array("f", [0.0]) * capacity
+        self.vy = array("f", [0.0]) * capacity
+        self.life = array("i", [0]) * capacity
+        self.size = array("f", [0.0]) * capacity
+        self.r = array("B", [0]) * capacity
+        self.g = array("B", [0]) * capacity
+        self.b = array("B", [0]) * capacity
+
+        self.columns = (self.x, self.y, self.vx, self.vy, self.life, self.size, self.r, self.g, self.b)
+        # The columns never reallocate, so the NumPy views share their memory for the whole lifetime of the system.
+        self.views = tuple(np.frombuffer(column, dtype=column.typecode) for column in self.columns) if np else None
+
+        self.sprites = {}
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, vx, vy, life, size, color):
+        if self.count >= self.capacity:
+            return False
+
+        i = self.count
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.life[i] = life
+        self.size[i] = size
+        self.r[i], self.g[i], self.b[i] = color
+        self.count += 1
+        return True
+
+    def clear(self):
+        self.count = 0
+
+    def update(self):
+        if self.views is not None and self.count >= VECTOR_MIN:
+            self.update_vectorized()
+            return
+
+        xs, ys, vxs, vys, lives, sizes = self.x, self.y, self.vx, self.vy, self.life, self.size
+        gravity = self.gravity
+        shrink = self.shrink
+
+        i = 0
+        while i < self.count:
+            life = lives[i] - 1
+            if life <= 0:
+                self.swap_remove(i)
+                continue
+
+            lives[i] = life
+            xs[i] += vxs[i]
+            ys[i] += vys[i]
+            vys[i] += gravity
+            if shrink:
+                size = sizes[i] - shrink
+                sizes[i] = size if size > 0 else 0.0
+            i += 1
+
+    def update_vectorized(self):
+        n = self.count
+        views = self.views
+        lives = views[4][:n]
+        lives -= 1
+        alive = lives > 0
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            n = len(keep)
+            for view in views:
+                view[:n] = view[keep]
+            self.count = n
+
+        x, y, vx, vy, life, size = (view[:n] for view in views[:6])
+        x += vx
+        y += vy
+        vy += self.gravity
+        if self.shrink:
+            size -= self.shrink
+            np.maximum(size, 0.0, out=size)
+
+    def swap_remove(self, i):
+        last = self.count - 1
+        if i != last:
+            for column in self.columns:
+                column[i] = column[last]
+        self.count = last
+
+    def get_sprite(self, color, radius):
+        key = (color, radius)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (radius, radius), radius)
+            self.sprites[key] = sprite
+        return sprite
+
+    def draw(self, screen, cam_x, cam_y):
+        blit_list = []
+        for i in range(self.count):
+            radius = int(self.size[i])
+            if radius <= 0:
+                continue
+            sprite = self.get_sprite((self.r[i], self.g[i], self.b[i]), radius)
+            blit_list.append((sprite, (int(self.x[i] - cam_x) - radius, int(self.y[i] - cam_y) - radius)))
+
+        if blit_list:
+            screen.blits(blit_list, doreturn=False)
@@ -0,0 +1,208 @@
+import csv
+import json
+import time
+from collections import deque
+
+import pygame
+from src.core.text_cache import get_font
+
+
+class ProfileScope:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.add_sample(self.name, (time.perf_counter() - self.start) * 1000.0)
+        return False
+
+
+class NullScope:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NULL_SCOPE = NullScope()
+
+
+class Profiler:
+    def __init__(self, history=240, enabled=True, refresh_every=15, budget_ms=1000.0 / 60):
+        self.history = history
+        self.enabled = enabled
+        self.refresh_every = refresh_every
+        self.budget_ms = budget_ms
+
+        self.frames = deque(maxlen=history)
+        self.frame_index = 0
+        self.frame_start = None
+        self.current = {}
+        self.scope_names = []
+        self.scopes = {}
+
+        self.overlay_visible = False
+        self.overlay_surface = None
+        self.font = None
+
+    def scope(self, name):
+        if not self.enabled:
+            return NULL_SCOPE
+        scope = self.scopes.get(name)
+        if scope is None:
+            scope = ProfileScope(self, name)
+            self.scopes[name] = scope
+        return scope
+
+    def add_sample(self, name, ms):
+        if name not in self.current:
+            self.current[name] = ms
+            if name not in self.scope_names:
+                self.scope_names.append(name)
+        else:
+            self.current[name] += ms
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.frame_start = time.perf_counter()
+        self.current = {}
+
+    def end_frame(self):
+        if not self.enabled or self.frame_start is None:
+            return
+        self.current["frame"] = (time.perf_counter() - self.frame_start) * 1000.0
+        self.frames.append((self.frame_index, self.current))
+        self.frame_index += 1
+        self.frame_start = None
+
+        if self.overlay_visible and self.frame_index % self.refresh_every == 0:
+            self.overlay_surface = None
+
+    def samples(self, name):
+        return [frame.get(name, 0.0) for _, frame in self.frames]
+
+    def stats(self, name):
+        values = sorted(self.samples(name))
+        if not values:
+            return {"avg": 0.0, "min": 0.0, "max": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0}
+        last = len(values) - 1
+        return {
+            "avg": sum(values) / len(values),
+            "min": values[0],
+            "max": values[last],
+            "p50": values[int(last * 0.5)],
+            "p95": values[int(last * 0.95)],
+            "p99": values[int(last * 0.99)],
+        }
+
+    def histogram(self, name, bins=16, max_ms=None):
+        values = self.samples(name)
+        if max_ms is None:
+            max_ms = max(values) if values else 0.0
+        counts = [0] * bins
+        if max_ms <= 0:
+            counts[0] = len(values)
+            return counts, max_ms
+        for value in values:
+            index = int(value / max_ms * bins)
+            counts[index if index < bins else bins - 1] += 1
+        return counts, max_ms
+
+    def reset(self):
+        self.frames.clear()
+        self.current = {}
+        self.overlay_surface = None
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        self.overlay_surface = None
+
+    def handle_events(self, events, dump_path="profile"):
+        for event in events:
+            if event.type != pygame.KEYDOWN:
+                continue
+            if event.key == pygame.K_F3:
+                self.toggle_overlay()
+            elif event.key == pygame.K_F4 and self.enabled:
+                stamp = time.strftime("%Y%m%d_%H%M%S")
+                self.dump_csv(f"{dump_path}_{stamp}.csv")
+                self.dump_json(f"{dump_path}_{stamp}.json")
+
+    def ordered_names(self):
+        return ["frame"] + [name for name in self.scope_names if name != "frame"]
+
+    def dump_csv(self, path):
+        names = self.ordered_names()
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame_index"] + names)
+            for index, frame in self.frames:
+                writer.writerow([index] + [round(frame.get(name, 0.0), 4) for name in names])
+
+    def dump_json(self, path):
+        data = {
+            "frames": len(self.frames),
+            "budget_ms": self.budget_ms,
+            "scopes": {},
+        }
+        for name in self.ordered_names():
+            counts, max_ms = self.histogram(name)
+            data["scopes"][name] = {
+                "stats": {key: round(value, 4) for key, value in self.stats(name).items()},
+                "histogram": {"max_ms": round(max_ms, 4), "counts": counts},
+                "samples": [round(value, 4) for value in self.samples(name)],
+            }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def build_overlay(self):
+        if self.font is None:
+            self.font = get_font("consolas", 14)
+
+        names = self.ordered_names()
+        line_height = self.font.get_linesize()
+        bins = 24
+        bar_width = 3
+        text_width = 330
+        width = text_width + bins * bar_width + 16
+        height = (len(names) + 1) * line_height + 12
+
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 170))
+
+        header = self.font.render(f"{'scope':<18}{'avg':>7}{'p95':>7}{'max':>7}  ms", True, (200, 200, 200))
+        surface.blit(header, (6, 6))
+
+        frame_max = max(self.stats("frame")["max"], self.budget_ms)
+        for row, name in enumerate(names, start=1):
+            stats = self.stats(name)
+            y = 6 + row * line_height
+            color = (255, 120, 120) if stats["p95"] > self.budget_ms else (220, 220, 220)
+            line = f"{name[:17]:<18}{stats['avg']:>7.2f}{stats['p95']:>7.2f}{stats['max']:>7.2f}"
+            surface.blit(self.font.render(line, True, color), (6, y))
+
+            counts, _ = self.histogram(name, bins=bins, max_ms=frame_max)
+            peak = max(counts) if counts else 0
+            if peak:
+                for i, count in enumerate(counts):
+                    bar_height = max(1, int(count / peak * (line_height - 2))) if count else 0
+                    if bar_height:
+                        pygame.draw.rect(surface, (120, 200, 255),
+                                         (text_width + i * bar_width, y + line_height - 1 - bar_height,
+                                          bar_width - 1, bar_height))
+
+        return surface
+
+    def draw(self, screen):
+        if not self.overlay_visible or not self.enabled:
+            return
+        if self.overlay_surface is None:
+            self.overlay_surface = self.build_overlay()
+        screen.blit(self.overlay_surface, (8, 8))
@@ -0,0 +1,68 @@
+import pygame
+
+
+def render_depth(entity):
+    return entity.render_bounds().bottom
+
+
+class EntityRenderPass:
+    def __init__(self, margin=0):
+        self.margin = margin
+        self.entries = []
+        self.members = set()
+        self.dirty = False
+
+        self.drawn = 0
+        self.culled = 0
+
+    def add(self, entity):
+        if entity in self.members:
+            return
+        if self.dirty:
+            self.compact()
+        self.members.add(entity)
+        self.entries.append(entity)
+
+    def remove(self, entity):
+        if entity in self.members:
+            self.members.discard(entity)
+            self.dirty = True
+
+    def compact(self):
+        self.entries = [entity for entity in self.entries if entity in self.members]
+        self.dirty = False
+
+    def clear(self):
+        self.entries = []
+        self.members = set()
+        self.dirty = False
+
+    def view_rect(self, cam_x, cam_y, size):
+        margin = self.margin
+        return pygame.Rect(int(cam_x) - margin, int(cam_y) - margin, size[0] + margin * 2, size[1] + margin * 2)
+
+    def draw(self, screen, view, camera_for):
+        if self.dirty:
+            self.compact()
+        # The list stays sorted from the previous frame, so timsort only has to fix up the few entities that moved.
+        self.entries.sort(key=render_depth)
+
+        items = []
+        overlays = []
+        culled = 0
+        for entity in self.entries:
+            if not view.colliderect(entity.render_bounds()):
+                culled += 1
+                continue
+            cam_x, cam_y = camera_for(entity)
+            items.extend(entity.render_items(cam_x, cam_y))
+            if entity.has_overlay():
+                overlays.append((entity, cam_x, cam_y))
+
+        if items:
+            screen.blits(items, doreturn=False)
+        for entity, cam_x, cam_y in overlays:
+            entity.draw_overlay(screen, cam_x, cam_y)
+
+        self.drawn = len(self.entries) - culled
+        self.culled = culled
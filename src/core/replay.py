@@ -0,0 +1,384 @@
+import copy
+import json
+import os
+import random
+import struct
+import time
+import zlib
+
+import pygame
+from src.core.runtime import ManualClock, ScriptedInput
+from src.core.save_manager import SaveManager
+from src.core.rng import reseed, get_state, set_state, random_state
+
+MAGIC = b"GRPL"
+VERSION = 3
+HEADER = struct.Struct("<4sHHHHIdd")
+NAME_SIZE = 16
+SEED = struct.Struct("<16sQ")
+FRAME = struct.Struct("<IHhhBd")
+RECORDED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d, pygame.K_SPACE, pygame.K_q, pygame.K_f)
+
+MOUSE_BUTTONS = 3
+MOUSE_CLICKED = 1 << 3
+SHOOT = 1 << 4
+SHOOT_DIR_RIGHT = 1 << 5
+LOCK_PRESSED = 1 << 6
+RESTART = 1 << 7
+
+GAME_FIELDS = ("camera_x", "camera_y", "time_scale", "hit_stop_timer", "shake_timer", "shake_strength")
+
+
+class ReplayFormatError(ValueError):
+    pass
+
+
+class ReplayFrame:
+    def __init__(self, ticks, keys, mouse_pos, mouse_pressed, mouse_clicked, shoot, shoot_dir_right, lock_pressed, dt,
+                 restart=False):
+        self.ticks = ticks
+        self.keys = keys
+        self.mouse_pos = mouse_pos
+        self.mouse_pressed = mouse_pressed
+        self.mouse_clicked = mouse_clicked
+        self.shoot = shoot
+        self.shoot_dir_right = shoot_dir_right
+        self.lock_pressed = lock_pressed
+        self.dt = dt
+        self.restart = restart
+
+
+def pack_name(name):
+    return name.encode("utf-8")[:NAME_SIZE].ljust(NAME_SIZE, b"\0")
+
+
+def unpack_name(data):
+    return data.rstrip(b"\0").decode("utf-8")
+
+
+def encode_frame(ticks, keys, mouse_pos, mouse_pressed, mouse_clicked, shoot, shoot_dir_right, lock_pressed, dt,
+                 restart=False):
+    key_mask = 0
+    for bit, key in enumerate(RECORDED_KEYS):
+        if keys[key]:
+            key_mask |= 1 << bit
+
+    flags = 0
+    for bit in range(MOUSE_BUTTONS):
+        if mouse_pressed[bit]:
+            flags |= 1 << bit
+    if mouse_clicked:
+        flags |= MOUSE_CLICKED
+    if shoot:
+        flags |= SHOOT
+    if shoot_dir_right:
+        flags |= SHOOT_DIR_RIGHT
+    if lock_pressed:
+        flags |= LOCK_PRESSED
+    if restart:
+        flags |= RESTART
+
+    return FRAME.pack(int(ticks) & 0xFFFFFFFF, key_mask, int(mouse_pos[0]), int(mouse_pos[1]), flags, dt)
+
+
+def decode_frame(buffer, offset):
+    ticks, key_mask, mouse_x, mouse_y, flags, dt = FRAME.unpack_from(buffer, offset)
+    keys = [key for bit, key in enumerate(RECORDED_KEYS) if key_mask & (1 << bit)]
+    mouse_pressed = tuple(bool(flags & (1 << bit)) for bit in range(MOUSE_BUTTONS))
+    return ReplayFrame(ticks, keys, (mouse_x, mouse_y), mouse_pressed, bool(flags & MOUSE_CLICKED), bool(flags & SHOOT),
+                       bool(flags & SHOOT_DIR_RIGHT), bool(flags & LOCK_PRESSED), dt, bool(flags & RESTART))
+
+
+class Replay:
+    def __init__(self, map_name, screen_size, tick_rate, seeds=None, player_state=None, start=(0.0, 0.0), enemies=(),
+                 rng_state=None, game_state=None):
+        self.map_name = map_name
+        self.screen_size = (int(screen_size[0]), int(screen_size[1]))
+        self.tick_rate = int(tick_rate)
+        self.seeds = dict(seeds or {})
+        self.player_state = dict(player_state or {})
+        self.start = (float(start[0]), float(start[1]))
+        self.enemies = [list(enemy) for enemy in enemies]
+        self.rng_state = rng_state
+        self.game_state = game_state
+        self.frames = bytearray()
+
+    def __len__(self):
+        return len(self.frames) // FRAME.size
+
+    def append(self, *frame):
+        self.frames += encode_frame(*frame)
+
+    def frame(self, index):
+        return decode_frame(self.frames, index * FRAME.size)
+
+    def iter_frames(self):
+        for offset in range(0, len(self.frames), FRAME.size):
+            yield decode_frame(self.frames, offset)
+
+    def duration_ms(self):
+        return sum(FRAME.unpack_from(self.frames, offset)[5] for offset in range(0, len(self.frames), FRAME.size))
+
+    def encode(self):
+        state = json.dumps({"player": self.player_state, "enemies": self.enemies, "rng": self.rng_state,
+                            "game": self.game_state}, separators=(",", ":")).encode("utf-8")
+        state = zlib.compress(state, 6)
+        parts = [
+            HEADER.pack(MAGIC, VERSION, self.tick_rate, self.screen_size[0], self.screen_size[1], len(self),
+                        self.start[0], self.start[1]),
+            pack_name(self.map_name),
+            struct.pack("<H", len(self.seeds)),
+        ]
+        for name, seed in sorted(self.seeds.items()):
+            parts.append(SEED.pack(pack_name(name), seed & 0xFFFFFFFFFFFFFFFF))
+        parts.append(struct.pack("<I", len(state)))
+        parts.append(state)
+        parts.append(zlib.compress(bytes(self.frames), 6))
+        return b"".join(parts)
+
+    @classmethod
+    def decode(cls, buffer):
+        if len(buffer) < HEADER.size + NAME_SIZE:
+            raise ReplayFormatError("file is too short for a replay header")
+
+        magic, version, tick_rate, width, height, frame_count, start_x, start_y = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ReplayFormatError(f"bad magic {magic!r}")
+        if version != VERSION:
+            raise ReplayFormatError(f"unsupported replay version {version}")
+
+        offset = HEADER.size
+        map_name = unpack_name(buffer[offset:offset + NAME_SIZE])
+        offset += NAME_SIZE
+
+        seed_count, = struct.unpack_from("<H", buffer, offset)
+        offset += 2
+        seeds = {}
+        for _ in range(seed_count):
+            name, seed = SEED.unpack_from(buffer, offset)
+            seeds[unpack_name(name)] = seed
+            offset += SEED.size
+
+        state_size, = struct.unpack_from("<I", buffer, offset)
+        offset += 4
+        try:
+            state = json.loads(zlib.decompress(buffer[offset:offset + state_size]).decode("utf-8"))
+            offset += state_size
+            frames = zlib.decompress(buffer[offset:])
+        except zlib.error as e:
+            raise ReplayFormatError(f"corrupt replay data: {e}")
+        if len(frames) != frame_count * FRAME.size:
+            raise ReplayFormatError(f"truncated replay: {len(frames) // FRAME.size} frames, expected {frame_count}")
+
+        replay = cls(map_name, (width, height), tick_rate, seeds, state["player"], (start_x, start_y), state["enemies"],
+                     state["rng"], state["game"])
+        replay.frames = bytearray(frames)
+        return replay
+
+
+def write_replay(path, replay):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(replay.encode())
+
+
+def read_replay(path):
+    with open(path, "rb") as f:
+        return Replay.decode(f.read())
+
+
+def new_seed():
+    return random.SystemRandom().getrandbits(63)
+
+
+def seed_session(seeds=None):
+    seeds = dict(seeds or {})
+    seeds.setdefault("random", new_seed())
+    random.seed(seeds["random"])
+    reseed(seeds["random"])
+    return seeds
+
+
+def capture_rng_state():
+    return {"random": random.getstate(), "streams": get_state()}
+
+
+def restore_rng_state(state):
+    random.setstate(random_state(state["random"]))
+    set_state(state["streams"])
+
+
+def is_plain(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return True
+    if isinstance(value, list):
+        return all(is_plain(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and is_plain(item) for key, item in value.items())
+    return False
+
+
+def snapshot_state(obj, enemy_index):
+    fields = {}
+    vectors = {}
+    rects = {}
+    refs = {}
+    for name, value in vars(obj).items():
+        if isinstance(value, pygame.math.Vector2):
+            vectors[name] = [value.x, value.y]
+        elif isinstance(value, pygame.Rect):
+            rects[name] = [value.x, value.y, value.width, value.height]
+        elif isinstance(value, pygame.sprite.Sprite):
+            if value in enemy_index:
+                refs[name] = enemy_index[value]
+        elif is_plain(value):
+            fields[name] = copy.deepcopy(value)
+    return {"fields": fields, "vectors": vectors, "rects": rects, "refs": refs}
+
+
+def apply_state(obj, state, enemies):
+    for name, value in state["fields"].items():
+        setattr(obj, name, copy.deepcopy(value))
+    for name, value in state["vectors"].items():
+        vector = getattr(obj, name, None)
+        if isinstance(vector, pygame.math.Vector2):
+            vector.update(value)
+        else:
+            setattr(obj, name, pygame.math.Vector2(value))
+    for name, value in state["rects"].items():
+        rect = getattr(obj, name, None)
+        if isinstance(rect, pygame.Rect):
+            rect.update(value)
+        else:
+            setattr(obj, name, pygame.Rect(value))
+    for name, index in state["refs"].items():
+        setattr(obj, name, enemies[index])
+
+
+def replay_path(directory, map_name):
+    stem = os.path.join(directory, f"{map_name}-{time.strftime('%Y%m%d-%H%M%S')}")
+    path = stem + ".grpl"
+    index = 1
+    while os.path.exists(path):
+        path = f"{stem}-{index}.grpl"
+        index += 1
+    return path
+
+
+class ReplayRecorder:
+    def __init__(self, replay, path=None):
+        self.replay = replay
+        self.path = path
+        self.restart_pending = False
+
+    @classmethod
+    def start(cls, game, map_name, seeds, path=None):
+        # Everything the update reads from the player, the enemies, the AI LOD schedule and the RNG is stored, so a
+        # segment can start mid-session. Projectiles in flight, friendly NPCs and path searches still pending in the
+        # pathfinder are not, so a segment is exact when it starts with none of those in progress, as on a map load.
+        player = game.player
+        enemies = game.enemies.sprites()
+        enemy_index = {enemy: i for i, enemy in enumerate(enemies)}
+        player_state = snapshot_state(player, enemy_index)
+        player_state["save"] = SaveManager().snapshot(player)
+        ai_lod = getattr(game, "ai_lod", None)
+        flow_field = game.flow_field
+        game_state = {
+            "fields": {name: getattr(game, name) for name in GAME_FIELDS},
+            "ai_lod": ai_lod.snapshot(enemies) if ai_lod is not None else None,
+            "flow_field": [flow_field.target, flow_field.built_at] if flow_field.map is game.map else None,
+        }
+        enemy_states = [[type(enemy).__name__, snapshot_state(enemy, enemy_index)] for enemy in enemies]
+        replay = Replay(map_name, game.screen.get_size(), round(1000.0 / game.tick_ms), seeds, player_state,
+                        (player.x, player.y), enemy_states, capture_rng_state(), game_state)
+        recorder = cls(replay, path)
+        game.recorder = recorder
+        return recorder
+
+    def capture(self, game, keys, mouse_clicked, shoot, shoot_dir_right, lock_pressed, dt):
+        source = game.input
+        self.replay.append(game.clock.get_ticks(), keys, source.get_mouse_pos(), source.get_mouse_pressed(),
+                           mouse_clicked, shoot, shoot_dir_right, lock_pressed, dt, self.restart_pending)
+        self.restart_pending = False
+
+    def mark_restart(self):
+        self.restart_pending = True
+
+    def stop(self, game):
+        if getattr(game, "recorder", None) is self:
+            game.recorder = None
+        if self.path is not None and len(self.replay):
+            write_replay(self.path, self.replay)
+
+
+class ReplayInput(ScriptedInput):
+    def __init__(self, replay):
+        super().__init__()
+        self.replay = replay
+        self.index = 0
+        self.frame = None
+
+    def finished(self):
+        return self.index >= len(self.replay)
+
+    def step(self):
+        self.frame = self.replay.frame(self.index)
+        self.index += 1
+        self.set_state(keys=self.frame.keys, mouse_pos=self.frame.mouse_pos, mouse_pressed=self.frame.mouse_pressed)
+        return self.frame
+
+
+def prepare_playback(game, replay, enemy_types):
+    game.clear_enemies()
+    enemies = [enemy_types[name](game, state["vectors"]["pos"]) for name, state in replay.enemies]
+    for enemy, (name, state) in zip(enemies, replay.enemies):
+        apply_state(enemy, state, enemies)
+        game.add_enemy(enemy)
+
+    if replay.player_state:
+        SaveManager().apply(game.player, replay.player_state["save"])
+        apply_state(game.player, replay.player_state, enemies)
+    game.player.x, game.player.y = replay.start
+    game.player.target_x, game.player.target_y = replay.start
+
+    if replay.game_state is not None:
+        for name, value in replay.game_state["fields"].items():
+            setattr(game, name, value)
+        ai_lod = getattr(game, "ai_lod", None)
+        if ai_lod is not None and replay.game_state["ai_lod"] is not None:
+            ai_lod.apply(enemies, replay.game_state["ai_lod"])
+        if replay.game_state.get("flow_field") is not None:
+            (target_x, target_y), built_at = replay.game_state["flow_field"]
+            game.flow_field.update(game.map, target_x, target_y)
+            game.flow_field.built_at = built_at
+    game.input = ReplayInput(replay)
+    if replay.rng_state is not None:
+        restore_rng_state(replay.rng_state)
+    # Frames store the tick the update saw, so the clock is pinned to it instead of advanced by dt.
+    game.clock = ManualClock()
+
+
+def play_replay(game, realtime=False, draw=False, on_frame=None):
+    source = game.input
+    start = time.perf_counter()
+    elapsed_ms = 0.0
+    while not source.finished():
+        frame = source.step()
+        if frame.restart:
+            game.restart()
+        game.clock.ticks = frame.ticks
+        game.update(source.get_keys(), mouse_clicked=frame.mouse_clicked, shoot=frame.shoot,
+                    shoot_dir_right=frame.shoot_dir_right, lock_pressed=frame.lock_pressed, dt=frame.dt)
+        if draw:
+            game.draw()
+        if on_frame is not None:
+            on_frame(game, frame)
+
+        if realtime:
+            elapsed_ms += frame.dt
+            delay = elapsed_ms / 1000.0 - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+    return source.index
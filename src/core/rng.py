@@ -0,0 +1,162 @@
+import random
+import zlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SEED_MASK = (1 << 64) - 1
+GOLDEN = 0x9E3779B97F4A7C15
+
+
+def derive_seed(seed, name):
+    # Python's hash() is salted per process, so streams are keyed by a stable checksum of their name instead.
+    return (seed ^ (zlib.crc32(name.encode("utf-8")) * GOLDEN)) & SEED_MASK
+
+
+def random_state(state):
+    # States that went through JSON come back as lists, but Random.setstate only accepts tuples.
+    version, internal, gauss_next = state
+    return version, tuple(internal), gauss_next
+
+
+class BatchSampler:
+    def __init__(self, seed, block=1024):
+        self.block = block
+        self.reseed(seed)
+
+    def reseed(self, seed):
+        if np is not None:
+            self.generator = np.random.default_rng(seed)
+        else:
+            self.generator = random.Random(seed)
+        self.buffer = []
+        self.index = 0
+
+    def refill(self):
+        if np is not None:
+            self.buffer = self.generator.random(self.block).tolist()
+        else:
+            generate = self.generator.random
+            self.buffer = [generate() for _ in range(self.block)]
+        self.index = 0
+
+    def take(self, count):
+        if self.index + count > len(self.buffer):
+            rest = self.buffer[self.index:]
+            while len(rest) < count:
+                self.refill()
+                rest += self.buffer
+            self.buffer = rest
+            self.index = 0
+        values = self.buffer[self.index:self.index + count]
+        self.index += count
+        return values
+
+    def random(self):
+        if self.index >= len(self.buffer):
+            self.refill()
+        value = self.buffer[self.index]
+        self.index += 1
+        return value
+
+    def getstate(self):
+        if np is not None:
+            generator = self.generator.bit_generator.state
+        else:
+            generator = self.generator.getstate()
+        return {"block": self.block, "generator": generator, "buffer": self.buffer[self.index:]}
+
+    def setstate(self, state):
+        self.block = state["block"]
+        if np is not None:
+            self.generator.bit_generator.state = state["generator"]
+        else:
+            self.generator.setstate(random_state(state["generator"]))
+        self.buffer = list(state["buffer"])
+        self.index = 0
+
+    def uniform(self, low, high):
+        return low + (high - low) * self.random()
+
+    def randint(self, low, high):
+        return low + int(self.random() * (high - low + 1))
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+    def uniforms(self, low, high, count):
+        span = high - low
+        return [low + span * value for value in self.take(count)]
+
+    def randints(self, low, high, count):
+        span = high - low + 1
+        return [low + int(value * span) for value in self.take(count)]
+
+
+class RandomStreams:
+    def __init__(self, seed=None):
+        self.streams = {}
+        self.samplers = {}
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed & SEED_MASK
+        for name, stream in self.streams.items():
+            stream.seed(derive_seed(self.seed, name))
+        for name, sampler in self.samplers.items():
+            sampler.reseed(derive_seed(self.seed, name))
+
+    def getstate(self):
+        return {
+            "seed": self.seed,
+            "streams": {name: stream.getstate() for name, stream in self.streams.items()},
+            "samplers": {name: sampler.getstate() for name, sampler in self.samplers.items()},
+        }
+
+    def setstate(self, state):
+        self.seed = state["seed"]
+        for name, stream_state in state["streams"].items():
+            self.stream(name).setstate(random_state(stream_state))
+        for name, sampler_state in state["samplers"].items():
+            self.sampler(name).setstate(sampler_state)
+
+    def stream(self, name):
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = random.Random(derive_seed(self.seed, name))
+            self.streams[name] = stream
+        return stream
+
+    def sampler(self, name, block=1024):
+        sampler = self.samplers.get(name)
+        if sampler is None:
+            sampler = BatchSampler(derive_seed(self.seed, name), block)
+            self.samplers[name] = sampler
+        return sampler
+
+
+rng = RandomStreams()
+
+
+def get_stream(name):
+    return rng.stream(name)
+
+
+def get_sampler(name, block=1024):
+    return rng.sampler(name, block)
+
+
+def reseed(seed=None):
+    rng.reseed(seed)
+
+
+def get_state():
+    return rng.getstate()
+
+
+def set_state(state):
+    rng.setstate(state)
@@ -0,0 +1,80 @@
+import pygame
+
+
+class PygameClock:
+    def get_ticks(self):
+        return pygame.time.get_ticks()
+
+    def advance(self, dt):
+        pass
+
+
+class SimulatedClock:
+    def __init__(self, start_ms=0):
+        self.ticks = float(start_ms)
+
+    def get_ticks(self):
+        return int(self.ticks)
+
+    def advance(self, dt):
+        self.ticks += dt
+
+
+class ManualClock:
+    def __init__(self, start_ms=0):
+        self.ticks = int(start_ms)
+
+    def get_ticks(self):
+        return self.ticks
+
+    def advance(self, dt):
+        pass
+
+
+class KeyState:
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class PygameInput:
+    def get_keys(self):
+        return pygame.key.get_pressed()
+
+    def get_mouse_pos(self):
+        return pygame.mouse.get_pos()
+
+    def get_mouse_pressed(self):
+        return pygame.mouse.get_pressed()
+
+
+class ScriptedInput:
+    def __init__(self, keys=(), mouse_pos=(0, 0), mouse_pressed=(False, False, False)):
+        self.keys = KeyState(keys)
+        self.mouse_pos = tuple(mouse_pos)
+        self.mouse_pressed = tuple(mouse_pressed)
+
+    def set_state(self, keys=None, mouse_pos=None, mouse_pressed=None):
+        if keys is not None:
+            self.keys = KeyState(keys)
+        if mouse_pos is not None:
+            self.mouse_pos = tuple(mouse_pos)
+        if mouse_pressed is not None:
+            self.mouse_pressed = tuple(mouse_pressed)
+
+    def get_keys(self):
+        return self.keys
+
+    def get_mouse_pos(self):
+        return self.mouse_pos
+
+    def get_mouse_pressed(self):
+        return self.mouse_pressed
+
+
+def prepare_surface(surface, alpha=True):
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
@@ -6,7 +6,15 @@ class SaveManager :
         self .path =path 
 
     def save (self ,player ):
-        data ={
+        data =self .snapshot (player )
+        try :
+            with open (self .path ,"w")as f :
+                json .dump (data ,f )
+        except :
+            pass 
+
+    def snapshot (self ,player ):
+        return {
         "death_x":getattr (player ,"death_x",0 ),
         "death_y":getattr (player ,"death_y",0 ),
         "respawn_x":getattr (player ,"respawn_x",0 ),
@@ -22,11 +30,6 @@ class SaveManager :
         "currency":getattr (player ,"currency",getattr (player ,"souls",0 )),
         "equipped":getattr (player ,"equipped",{})
         }
-        try :
-            with open (self .path ,"w")as f :
-                json .dump (data ,f )
-        except :
-            pass 
 
     def load (self ,player ):
         if not os .path .exists (self .path ):
@@ -36,6 +39,10 @@ class SaveManager :
                 data =json .load (f )
         except :
             return False 
+        self .apply (player ,data )
+        return True 
+
+    def apply (self ,player ,data ):
         player .death_x =data .get ("death_x",0 )
         player .death_y =data .get ("death_y",0 )
 
@@ -60,4 +67,3 @@ class SaveManager :
         elif hasattr (player ,"souls"):
             player .souls =data .get ("currency",0 )
         player .equipped =data .get ("equipped",{})
-        return True 
@@ -1,14 +1,20 @@
-import pygame
-
-pygame.init()
-
 screen_resolutions = [(800, 600), (1024, 768), (1280, 720), (1540, 800), (1920, 1080)]
 current_resolution_index = 3
 
 screen_width, screen_height = screen_resolutions[current_resolution_index]
-SCREEN = pygame.display.set_mode((screen_width, screen_height))
 
 fps = 60
+sim_tick_rate = 60
+max_sim_steps = 5
+ai_lod_enabled = True
+
+profiler_enabled = True
+profiler_history = 240
+
+startup_log = True
+
+record_replays = False
+replay_dir = "replays"
 
 Black_color = (0, 0, 0)
 White_color = (255, 255, 255)
@@ -24,8 +30,6 @@ ASSETS_DIR = "../assets"
 ICONS_DIR = ASSETS_DIR + "/images/icons"
 FONTS_NAME = "arial"
 
-Primary_font = pygame.font.SysFont("georgia", 24)
-
 tile_size = 32
 
 ENEMIES_ENABLED = True
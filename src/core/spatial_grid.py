@@ -0,0 +1,78 @@
+import math
+
+
+class SpatialGrid:
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entity_cells = {}
+
+    def cell_range(self, rect):
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size if rect.width > 0 else rect.left // size,
+            (rect.bottom - 1) // size if rect.height > 0 else rect.top // size,
+        )
+
+    def move(self, entity, rect):
+        new_range = self.cell_range(rect)
+        old_range = self.entity_cells.get(entity)
+        if old_range == new_range:
+            return
+
+        if old_range is not None:
+            self._unlink(entity, old_range)
+
+        x0, y0, x1, y1 = new_range
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                self.cells.setdefault((cx, cy), {})[entity] = None
+        self.entity_cells[entity] = new_range
+
+    def remove(self, entity):
+        old_range = self.entity_cells.pop(entity, None)
+        if old_range is not None:
+            self._unlink(entity, old_range)
+
+    def clear(self):
+        self.cells.clear()
+        self.entity_cells.clear()
+
+    def _unlink(self, entity, cell_range):
+        x0, y0, x1, y1 = cell_range
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell is not None:
+                    cell.pop(entity, None)
+                    if not cell:
+                        del self.cells[(cx, cy)]
+
+    def query_rect(self, rect):
+        x0, y0, x1, y1 = self.cell_range(rect)
+        found = {}
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        return list(found)
+
+    def query_range(self, x, y, radius):
+        size = self.cell_size
+        found = {}
+        for cy in range(int(math.floor((y - radius) / size)), int(math.floor((y + radius) / size)) + 1):
+            for cx in range(int(math.floor((x - radius) / size)), int(math.floor((x + radius) / size)) + 1):
+                cell = self.cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+
+        radius_sq = radius * radius
+        result = []
+        for entity in found:
+            ex, ey = entity.rect.center
+            if (ex - x) ** 2 + (ey - y) ** 2 <= radius_sq:
+                result.append(entity)
+        return result
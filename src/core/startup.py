@@ -0,0 +1,80 @@
+import time
+
+
+class StartupTimer:
+    def __init__(self, start=None, enabled=True):
+        self.start = start if start is not None else time.perf_counter()
+        self.last = self.start
+        self.enabled = enabled
+        self.phases = []
+        self.lazy = []
+        self.first_frame_ms = None
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.phases.append((name, (now - self.last) * 1000.0))
+        self.last = now
+
+    def record_lazy(self, name, ms):
+        self.lazy.append((name, ms))
+        if self.enabled and self.first_frame_ms is not None:
+            print(f"startup: built {name} on first use in {ms:.1f} ms")
+
+    def first_frame(self):
+        if self.first_frame_ms is not None:
+            return
+        self.mark("first frame")
+        self.first_frame_ms = (self.last - self.start) * 1000.0
+        if self.enabled:
+            print(self.format_report())
+
+    def report(self):
+        return {
+            "phases": [{"name": name, "ms": round(ms, 3)} for name, ms in self.phases],
+            "lazy": [{"name": name, "ms": round(ms, 3)} for name, ms in self.lazy],
+            "first_frame_ms": round(self.first_frame_ms, 3) if self.first_frame_ms is not None else None,
+        }
+
+    def format_report(self):
+        lines = [f"startup: first frame after {self.first_frame_ms:.1f} ms"]
+        for name, ms in self.phases:
+            lines.append(f"  {name:<20}{ms:8.1f} ms")
+        return "\n".join(lines)
+
+
+class LazyComponents:
+    def __init__(self, timer=None):
+        self.timer = timer
+        self.factories = {}
+        self.resize_handlers = {}
+        self.objects = {}
+
+    def register(self, name, factory, on_resize=None):
+        self.factories[name] = factory
+        if on_resize is not None:
+            self.resize_handlers[name] = on_resize
+
+    def get(self, name):
+        if name not in self.objects:
+            start = time.perf_counter()
+            component = self.factories[name]()
+            self.objects[name] = component
+            setattr(self, name, component)
+            if self.timer is not None:
+                self.timer.record_lazy(name, (time.perf_counter() - start) * 1000.0)
+        return self.objects[name]
+
+    def __getattr__(self, name):
+        factories = self.__dict__.get("factories")
+        if factories is None or name not in factories:
+            raise AttributeError(name)
+        return self.get(name)
+
+    def is_loaded(self, name):
+        return name in self.objects
+
+    def resize(self, screen):
+        for name, component in list(self.objects.items()):
+            handler = self.resize_handlers.get(name)
+            if handler is not None:
+                handler(component, screen)
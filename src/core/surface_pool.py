@@ -0,0 +1,79 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class SurfacePool:
+    def __init__(self, max_panel_bytes=4 * 1024 * 1024):
+        self.max_panel_bytes = max_panel_bytes
+        self.scrims = {}
+        self.panels = OrderedDict()
+        self.panel_bytes = 0
+        self.shadows = {}
+
+    def scrim(self, size, color=(0, 0, 0), alpha=255):
+        size = (int(size[0]), int(size[1]))
+        key = (size, tuple(color))
+        surface = self.scrims.get(key)
+        if surface is None:
+            surface = pygame.Surface(size)
+            surface.fill(color)
+            self.scrims[key] = surface
+        surface.set_alpha(int(alpha))
+        return surface
+
+    def panel(self, size, rgba):
+        size = (int(size[0]), int(size[1]))
+        key = (size, tuple(rgba))
+        surface = self.panels.get(key)
+        if surface is not None:
+            self.panels.move_to_end(key)
+            return surface
+
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill(rgba)
+        self.panels[key] = surface
+        self.panel_bytes += size[0] * size[1] * surface.get_bytesize()
+        # Toasts and prompts size their panel from the text, so every new message adds a key; drop the least recently
+        # used panels once they pass the cap.
+        while self.panel_bytes > self.max_panel_bytes and len(self.panels) > 1:
+            _, old = self.panels.popitem(last=False)
+            self.panel_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+        return surface
+
+    def shadow(self, radius, alpha=100):
+        key = (int(radius), int(alpha))
+        surface = self.shadows.get(key)
+        if surface is None:
+            size = key[0] * 2
+            surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(surface, (0, 0, 0, key[1]), (key[0], key[0]), key[0])
+            self.shadows[key] = surface
+        return surface
+
+    def invalidate(self):
+        self.scrims.clear()
+        self.panels.clear()
+        self.panel_bytes = 0
+        self.shadows.clear()
+
+    def memory_bytes(self):
+        total = 0
+        for surface in list(self.scrims.values()) + list(self.panels.values()) + list(self.shadows.values()):
+            total += surface.get_width() * surface.get_height() * surface.get_bytesize()
+        return total
+
+
+surface_pool = SurfacePool()
+
+
+def get_scrim(size, color=(0, 0, 0), alpha=255):
+    return surface_pool.scrim(size, color, alpha)
+
+
+def get_panel(size, rgba):
+    return surface_pool.panel(size, rgba)
+
+
+def get_shadow(radius, alpha=100):
+    return surface_pool.shadow(radius, alpha)
@@ -0,0 +1,125 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class FontRegistry:
+    def __init__(self):
+        self.fonts = {}
+
+    def get(self, name=None, size=24, bold=False, italic=False):
+        key = (name, size, bold, italic)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            if name and name.lower().endswith((".ttf", ".otf")):
+                font = pygame.font.Font(name, size)
+                font.set_bold(bold)
+                font.set_italic(italic)
+            else:
+                font = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+            self.fonts[key] = font
+        return font
+
+    def clear(self):
+        self.fonts.clear()
+
+
+class TextCache:
+    def __init__(self, max_bytes=8 * 1024 * 1024, max_layouts=256):
+        self.max_bytes = max_bytes
+        self.max_layouts = max_layouts
+        self.entries = OrderedDict()
+        self.layouts = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None, alpha=None):
+        key = (font, text, antialias, tuple(color), tuple(background) if background is not None else None)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            surface = entry[0]
+        else:
+            self.misses += 1
+            surface = font.render(text, antialias, color, background)
+            size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+            self.entries[key] = (surface, size)
+            self.bytes_used += size
+            self.evict()
+
+        surface.set_alpha(255 if alpha is None else alpha)
+        return surface
+
+    def wrap(self, font, text, max_width):
+        key = (font, text, max_width)
+        lines = self.layouts.get(key)
+        if lines is not None:
+            self.layouts.move_to_end(key)
+            return lines
+
+        lines = []
+        current_line = []
+        for word in text.split(' '):
+            test_line = ' '.join(current_line + [word])
+            w, h = font.size(test_line)
+            if w < max_width:
+                current_line.append(word)
+            else:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+        lines.append(' '.join(current_line))
+
+        lines = tuple(lines)
+        self.layouts[key] = lines
+        if len(self.layouts) > self.max_layouts:
+            self.layouts.popitem(last=False)
+        return lines
+
+    def evict(self):
+        while self.bytes_used > self.max_bytes and len(self.entries) > 1:
+            _, (_, size) = self.entries.popitem(last=False)
+            self.bytes_used -= size
+
+    def clear(self):
+        self.entries.clear()
+        self.layouts.clear()
+        self.bytes_used = 0
+
+    def stats(self):
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes_used,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+fonts = FontRegistry()
+text_cache = TextCache()
+
+
+def get_font(name=None, size=24, bold=False, italic=False):
+    return fonts.get(name, size, bold, italic)
+
+
+def render_text(font, text, antialias, color, background=None, alpha=None):
+    return text_cache.render(font, text, antialias, color, background, alpha)
+
+
+def wrap_text(font, text, max_width):
+    return text_cache.wrap(font, text, max_width)
+
+
+def reveal_lines(font, lines, count):
+    visible = []
+    for line in lines:
+        if count <= 0:
+            break
+        width = font.size(line[:count])[0] if count < len(line) else None
+        visible.append((line, width))
+        count -= len(line) + 1
+    return visible
@@ -1,5 +1,4 @@
 import pygame
-import random
 import math
 from entities.player import Player
 from entities.enemies.base_enemy import BaseEnemy
@@ -14,37 +13,24 @@ from entities.enemies.shantak import Shantak
 from entities.friendly_npc import NPC
 from entities.base_npc import FriendlyNPC
 from world.level_manager import Map
-from src.core.settings import tile_size, ENEMIES_ENABLED
-
-
-class BloodParticle:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.size = random.randint(2, 6)
-        self.color = (random.randint(150, 255), 0, 0)
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(1, 5)
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-        self.life = random.randint(20, 50)
-        self.gravity = 0.2
-
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity
-        self.life -= 1
-        self.size = max(0, self.size - 0.05)
-
-    def draw(self, screen, cam_x, cam_y):
-        if self.life > 0 and self.size > 0:
-            pygame.draw.circle(screen, self.color, (int(self.x - cam_x), int(self.y - cam_y)), int(self.size))
+from src.world.flow_field import FlowField
+from src.core.spatial_grid import SpatialGrid
+from src.core.particles import ParticleSystem
+from src.core.runtime import PygameClock, PygameInput
+from src.core.profiler import Profiler
+from src.core.atlas import TextureAtlas
+from src.core.ai_lod import AILodScheduler
+from src.core.render_pass import EntityRenderPass
+from src.core.rng import get_stream, get_sampler
+from src.core.settings import tile_size, ENEMIES_ENABLED, sim_tick_rate, max_sim_steps, ai_lod_enabled
 
 
 class Game:
-    def __init__(self, screen, mini_map):
+    def __init__(self, screen, mini_map, clock=None, input_source=None, profiler=None):
         self.screen = screen
+        self.profiler = profiler if profiler is not None else Profiler(enabled=False)
+        self.clock = clock if clock is not None else PygameClock()
+        self.input = input_source if input_source is not None else PygameInput()
         self.mini_map = mini_map
         self.map = Map(mini_map)
 
@@ -53,9 +39,21 @@ class Game:
         self.player = Player(player_start_x, player_start_y, self.map)
         self.player.game_instance = self
 
+        self.flow_field = FlowField(max_distance=30, min_interval=100)
+        self.spatial_grid = SpatialGrid(cell_size=tile_size * 4)
+
         self.camera_x = 0
         self.camera_y = 0
 
+        self.tick_ms = 1000.0 / sim_tick_rate
+        self.max_sim_steps = max_sim_steps
+        self.accumulator = 0.0
+        self.render_alpha = 1.0
+        self.prev_positions = {}
+        self.prev_camera = (0, 0)
+        self.pending_input = {"mouse_clicked": False, "shoot": False, "lock_pressed": False}
+        self.recorder = None
+
         self.time_scale = 1.0
         self.hit_stop_timer = 0
 
@@ -64,13 +62,19 @@ class Game:
         self.shake_offset_x = 0
         self.shake_offset_y = 0
 
-        self.blood_particles = []
+        self.blood_particles = ParticleSystem(capacity=512, gravity=0.2, shrink=0.05)
+        self.blood_rng = get_sampler("particles.blood")
+        self.shake_rng = get_stream("camera.shake")
 
         self.dialogue_box = None
         self.quest_system = None
         self.notification = None
         self.task_panel = None
 
+        self.entity_atlas = TextureAtlas(page_size=(512, 512))
+        self.ai_lod = AILodScheduler() if ai_lod_enabled else None
+        self.render_pass = EntityRenderPass(margin=tile_size * 2)
+        self.render_pass.add(self.player)
         self.enemies = pygame.sprite.Group()
         self.spawn_enemies()
 
@@ -79,23 +83,51 @@ class Game:
         elder = FriendlyNPC(self, name="Elder", pos=(22, 15), scale=1.0)
         self.friendly_npcs.append(villager)
         self.friendly_npcs.append(elder)
+        for fnpc in self.friendly_npcs:
+            self.spatial_grid.move(fnpc, fnpc.rect)
+            self.render_pass.add(fnpc)
 
     def spawn_enemies(self):
         if not ENEMIES_ENABLED:
             return
 
-        self.enemies.add(DeepOne(self, (18, 28)))
-        self.enemies.add(DeepOne(self, (22, 32)))
+        self.add_enemy(DeepOne(self, (18, 28)))
+        self.add_enemy(DeepOne(self, (22, 32)))
+
+        self.add_enemy(ManOfLeng(self, (15, 15)))
+        self.add_enemy(ManOfLeng(self, (25, 18)))
+        self.add_enemy(Ghast(self, (30, 10)))
+
+        self.add_enemy(Shoggoth(self, (10, 5)))
+        self.add_enemy(HoundOfTindalos(self, (35, 5)))
+        self.add_enemy(NightGaunt(self, (20, 2)))
+        self.add_enemy(Shantak(self, (5, 5)))
+        self.add_enemy(NamelessCityDweller(self, (30, 2)))
+
+    def add_enemy(self, enemy):
+        self.enemies.add(enemy)
+        self.spatial_grid.move(enemy, enemy.rect)
+        self.render_pass.add(enemy)
 
-        self.enemies.add(ManOfLeng(self, (15, 15)))
-        self.enemies.add(ManOfLeng(self, (25, 18)))
-        self.enemies.add(Ghast(self, (30, 10)))
+    def remove_enemy(self, enemy):
+        enemy.kill()
+        self.spatial_grid.remove(enemy)
+        self.render_pass.remove(enemy)
 
-        self.enemies.add(Shoggoth(self, (10, 5)))
-        self.enemies.add(HoundOfTindalos(self, (35, 5)))
-        self.enemies.add(NightGaunt(self, (20, 2)))
-        self.enemies.add(Shantak(self, (5, 5)))
-        self.enemies.add(NamelessCityDweller(self, (30, 2)))
+    def clear_enemies(self):
+        for enemy in self.enemies:
+            self.spatial_grid.remove(enemy)
+            self.render_pass.remove(enemy)
+        self.enemies.empty()
+
+    def set_map(self, new_map, spawn_x, spawn_y):
+        self.map = new_map
+        self.player.map = new_map
+        self.player.x = spawn_x
+        self.player.y = spawn_y
+        self.player.target_x = spawn_x
+        self.player.target_y = spawn_y
+        self.prev_positions = {}
 
     def set_dialogue_system(self, db):
         self.dialogue_box = db
@@ -113,8 +145,11 @@ class Game:
         self.shake_strength = strength
 
     def spawn_blood(self, x, y, count=10):
-        for _ in range(count):
-            self.blood_particles.append(BloodParticle(x, y))
+        rng = self.blood_rng
+        columns = zip(rng.randints(2, 6, count), rng.randints(150, 255, count), rng.uniforms(0, 2 * math.pi, count),
+                      rng.uniforms(1, 5, count), rng.randints(20, 50, count))
+        for size, red, angle, speed, life in columns:
+            self.blood_particles.emit(x, y, math.cos(angle) * speed, math.sin(angle) * speed, life, size, (red, 0, 0))
 
     def update_juice(self, real_dt):
         if self.hit_stop_timer > 0:
@@ -126,16 +161,13 @@ class Game:
 
         if self.shake_timer > 0:
             self.shake_timer -= real_dt
-            self.shake_offset_x = random.uniform(-self.shake_strength, self.shake_strength)
-            self.shake_offset_y = random.uniform(-self.shake_strength, self.shake_strength)
+            self.shake_offset_x = self.shake_rng.uniform(-self.shake_strength, self.shake_strength)
+            self.shake_offset_y = self.shake_rng.uniform(-self.shake_strength, self.shake_strength)
         else:
             self.shake_offset_x = 0
             self.shake_offset_y = 0
 
-        for bp in self.blood_particles[:]:
-            bp.update()
-            if bp.life <= 0:
-                self.blood_particles.remove(bp)
+        self.blood_particles.update()
 
     def update_camera(self):
         screen_w, screen_h = self.screen.get_size()
@@ -162,39 +194,122 @@ class Game:
                     return "pause"
         return None
 
-    def update(self, keys, mouse_clicked=False, shoot=False, shoot_dir_right=True, lock_pressed=False):
-        raw_dt = 16.0
+    def run_frame(self, frame_dt, keys, mouse_clicked=False, shoot=False, shoot_dir_right=True, lock_pressed=False):
+        self.pending_input["mouse_clicked"] |= mouse_clicked
+        self.pending_input["shoot"] |= shoot
+        self.pending_input["lock_pressed"] |= lock_pressed
+
+        self.accumulator = min(self.accumulator + frame_dt, self.tick_ms * self.max_sim_steps)
+
+        steps = 0
+        while self.accumulator >= self.tick_ms:
+            self.update(keys, shoot_dir_right=shoot_dir_right, **self.pending_input)
+            for name in self.pending_input:
+                self.pending_input[name] = False
+            self.accumulator -= self.tick_ms
+            steps += 1
+
+        self.render_alpha = self.accumulator / self.tick_ms
+        return steps
+
+    def snapshot_positions(self):
+        self.prev_camera = (self.camera_x, self.camera_y)
+        self.prev_positions = {self.player: (self.player.x, self.player.y)}
+        for enemy in self.enemies:
+            self.prev_positions[enemy] = (enemy.pos[0], enemy.pos[1])
+
+    def update(self, keys, mouse_clicked=False, shoot=False, shoot_dir_right=True, lock_pressed=False, dt=None):
+        raw_dt = self.tick_ms if dt is None else dt
+        self.snapshot_positions()
+        self.clock.advance(raw_dt)
+        if self.recorder is not None:
+            self.recorder.capture(self, keys, mouse_clicked, shoot, shoot_dir_right, lock_pressed, raw_dt)
         self.update_juice(raw_dt)
         game_dt = raw_dt * self.time_scale
 
-        self.player.update(keys, npc_group=self.enemies, mouse_clicked=mouse_clicked, dt=game_dt)
-        self.enemies.update(dt=game_dt)
+        profiler = self.profiler
 
-        for fnpc in self.friendly_npcs:
-            fnpc.update()
+        self.map.pathfinder.begin_frame()
+        with profiler.scope("flow_field"):
+            self.flow_field.update(self.map, self.player.x, self.player.y, self.clock.get_ticks())
+
+        with profiler.scope("update.player"):
+            self.player.update(keys, npc_group=self.enemies, mouse_clicked=mouse_clicked, dt=game_dt)
+
+        with profiler.scope("update.enemies"):
+            if self.ai_lod is not None:
+                view = self.ai_lod.view_rect(self.camera_x, self.camera_y, self.screen.get_size())
+                self.ai_lod.update(self.enemies, game_dt, self.player.x, self.player.y, view)
+            else:
+                self.enemies.update(dt=game_dt)
+
+        with profiler.scope("update.npcs"):
+            player_center = (self.player.x * tile_size, self.player.y * tile_size)
+            interact_range = max((getattr(fnpc, "interact_range", 0) for fnpc in self.friendly_npcs), default=0)
+            radius = (math.ceil(interact_range) + 1) * tile_size
+            near_player = set(self.spatial_grid.query_range(player_center[0], player_center[1], radius))
+            for fnpc in self.friendly_npcs:
+                fnpc.update(near_player)
 
         self.update_camera()
 
-    def draw(self):
+    def interpolated_camera(self, alpha):
+        prev_x, prev_y = self.prev_camera
+        if abs(self.camera_x - prev_x) > tile_size * 2 or abs(self.camera_y - prev_y) > tile_size * 2:
+            return self.camera_x, self.camera_y
+        return prev_x + (self.camera_x - prev_x) * alpha, prev_y + (self.camera_y - prev_y) * alpha
+
+    def entity_camera(self, entity, x, y, cam_x, cam_y, alpha):
+        prev = self.prev_positions.get(entity)
+        if prev is None:
+            return int(cam_x), int(cam_y)
+
+        dx = x - prev[0]
+        dy = y - prev[1]
+        if abs(dx) > 2 or abs(dy) > 2:
+            return int(cam_x), int(cam_y)
+        return int(cam_x + dx * (1 - alpha) * tile_size), int(cam_y + dy * (1 - alpha) * tile_size)
+
+    def render_camera(self, entity, cam_x, cam_y, alpha):
+        if entity is self.player:
+            return self.entity_camera(entity, entity.x, entity.y, cam_x, cam_y, alpha)
+        if entity not in self.prev_positions:
+            return int(cam_x), int(cam_y)
+        pos = entity.pos
+        return self.entity_camera(entity, pos[0], pos[1], cam_x, cam_y, alpha)
+
+    def draw(self, alpha=None):
+        if alpha is None:
+            alpha = self.render_alpha
+
         self.screen.fill((30, 30, 30))
 
-        cam_x_int = int(self.camera_x)
-        cam_y_int = int(self.camera_y)
+        cam_x, cam_y = self.interpolated_camera(alpha)
+        cam_x_int = int(cam_x)
+        cam_y_int = int(cam_y)
 
-        self.map.draw(self.screen, cam_x_int, cam_y_int)
+        profiler = self.profiler
 
-        for enemy in self.enemies:
-            enemy.draw(self.screen, cam_x_int, cam_y_int)
+        with profiler.scope("draw.map"):
+            self.map.draw(self.screen, cam_x_int, cam_y_int)
 
-        for fnpc in self.friendly_npcs:
-            fnpc.draw(self.screen, cam_x_int, cam_y_int)
+        with profiler.scope("draw.entities"):
+            view = self.render_pass.view_rect(cam_x, cam_y, self.screen.get_size())
+            self.render_pass.draw(self.screen, view, lambda entity: self.render_camera(entity, cam_x, cam_y, alpha))
 
-        self.player.draw(self.screen, cam_x_int, cam_y_int)
+        with profiler.scope("draw.particles"):
+            self.blood_particles.draw(self.screen, cam_x_int, cam_y_int)
 
-        for bp in self.blood_particles:
-            bp.draw(self.screen, cam_x_int, cam_y_int)
+        with profiler.scope("draw.hud"):
+            self.player.draw_hud(self.screen)
+
+    def restart(self):
+        self.player.restart()
+        self.respawn_enemies()
+        if self.recorder is not None:
+            self.recorder.mark_restart()
 
     def respawn_enemies(self):
-        self.enemies.empty()
+        self.clear_enemies()
         if ENEMIES_ENABLED:
             self.spawn_enemies()
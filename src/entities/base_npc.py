@@ -1,6 +1,8 @@
 import pygame
 import math
 from src.core.settings import tile_size
+from src.core.runtime import prepare_surface
+from src.core.text_cache import get_font, render_text
 
 
 class FriendlyNPC(pygame.sprite.Sprite):
@@ -13,7 +15,7 @@ class FriendlyNPC(pygame.sprite.Sprite):
         self.animation_time = int(animation_time)
 
         size = (int(tile_size * self.scale), int(tile_size * self.scale))
-        self.idle_image = [pygame.Surface(size, pygame.SRCALPHA).convert_alpha()]
+        self.idle_image = [prepare_surface(pygame.Surface(size, pygame.SRCALPHA))]
         pygame.draw.rect(self.idle_image[0], (180, 180, 0), self.idle_image[0].get_rect())
 
         self.image = self.idle_image[0]
@@ -62,11 +64,17 @@ class FriendlyNPC(pygame.sprite.Sprite):
                 }
             }
 
-    def update(self):
-        self.check_proximity()
+    def update(self, near_player=None):
+        self.check_proximity(near_player)
         self.rect.center = (int(self.pos[0] * tile_size), int(self.pos[1] * tile_size))
+        if hasattr(self.game, "spatial_grid"):
+            self.game.spatial_grid.move(self, self.rect)
+
+    def check_proximity(self, near_player=None):
+        if near_player is not None and self not in near_player:
+            self.is_player_near = False
+            return
 
-    def check_proximity(self):
         player_pos = (self.game.player.x, self.game.player.y)
         dist = math.dist(self.pos, player_pos)
         self.is_player_near = dist <= self.interact_range
@@ -79,17 +87,30 @@ class FriendlyNPC(pygame.sprite.Sprite):
                 if hasattr(self.game, "start_dialogue"):
                     self.game.start_dialogue(self.name, self.dialogue_tree, None)
 
-    def draw(self, screen, camera_x, camera_y):
+    def screen_position(self, camera_x, camera_y):
         screen_x = self.pos[0] * tile_size - camera_x - (self.rect.width / 2)
         screen_y = self.pos[1] * tile_size - camera_y - (self.rect.height / 2)
-        screen.blit(self.image, (screen_x, screen_y))
+        return screen_x, screen_y
+
+    def render_bounds(self):
+        return self.rect
+
+    def render_items(self, camera_x, camera_y):
+        return ((self.image, self.screen_position(camera_x, camera_y)),)
 
-        if self.is_player_near:
-            self.draw_hint(screen, screen_x, screen_y)
+    def has_overlay(self):
+        return self.is_player_near
+
+    def draw_overlay(self, screen, camera_x, camera_y):
+        self.draw_hint(screen, *self.screen_position(camera_x, camera_y))
+
+    def draw(self, screen, camera_x, camera_y):
+        screen.blits(self.render_items(camera_x, camera_y), doreturn=False)
+        if self.has_overlay():
+            self.draw_overlay(screen, camera_x, camera_y)
 
     def draw_hint(self, screen, x, y):
-        font = pygame.font.SysFont(None, 24)
-        text = font.render("E", True, (255, 255, 255))
+        text = render_text(get_font(None, 24), "E", True, (255, 255, 255))
         pygame.draw.circle(screen, (0, 0, 0), (int(x + self.rect.width / 2), int(y - 20)), 15)
         pygame.draw.circle(screen, (255, 255, 255), (int(x + self.rect.width / 2), int(y - 20)), 15, 2)
         screen.blit(text, (x + self.rect.width / 2 - text.get_width() / 2, y - 28))
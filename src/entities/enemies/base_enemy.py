@@ -1,7 +1,9 @@
 import pygame
 import math
-import random
 from src.core.settings import tile_size
+from src.core.rng import get_stream
+
+dodge_rng = get_stream("enemy.dodge")
 
 
 class BaseEnemy(pygame.sprite.Sprite):
@@ -11,6 +13,7 @@ class BaseEnemy(pygame.sprite.Sprite):
         self.pos = pygame.math.Vector2(pos)
         self.image = pygame.Surface(size, pygame.SRCALPHA)
         self.rect = self.image.get_rect(center=(self.pos.x * tile_size, self.pos.y * tile_size))
+        self.sprite_key = None
 
         self.max_health = health
         self.health = health
@@ -39,6 +42,7 @@ class BaseEnemy(pygame.sprite.Sprite):
         self.run_ai(dt)
 
         self.rect.center = (self.pos.x * tile_size, self.pos.y * tile_size)
+        self.game.spatial_grid.move(self, self.rect)
 
     def run_ai(self, dt):
         player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
@@ -57,8 +61,21 @@ class BaseEnemy(pygame.sprite.Sprite):
             self.state = "IDLE"
 
     def chase_player(self, dt):
-        player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
-        direction = (player_pos - self.pos).normalize()
+        flow_field = getattr(self.game, "flow_field", None)
+        # Flyers cross walls and water, so they keep heading straight for the player.
+        if getattr(self, "is_flying", False):
+            flow_field = None
+        step = flow_field.direction_from(self.pos.x, self.pos.y) if flow_field else None
+
+        if step:
+            direction = pygame.math.Vector2(step)
+        else:
+            player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
+            direction = player_pos - self.pos
+            if direction.length_squared() == 0:
+                return
+            direction = direction.normalize()
+
         self.pos += direction * self.speed * (dt / 16.0)
 
     def start_attack(self):
@@ -70,6 +87,10 @@ class BaseEnemy(pygame.sprite.Sprite):
         self.health -= amount
         self.rally_timer = self.rally_duration
 
+        ai_lod = getattr(self.game, "ai_lod", None)
+        if ai_lod is not None:
+            ai_lod.wake(self)
+
         if self.health <= 0:
             self.die()
         else:
@@ -95,19 +116,48 @@ class BaseEnemy(pygame.sprite.Sprite):
 
     def die(self):
         self.alive = False
-        self.kill()
+        self.game.remove_enemy(self)
         self.game.player.add_currency(5000)
 
     def step_dodge(self):
-        now = pygame.time.get_ticks()
+        now = self.game.clock.get_ticks()
         if now - self.last_dodge > self.step_dodge_cooldown:
             self.last_dodge = now
             self.state = "DODGE"
             self.state_timer = 300
             player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
             direction = (player_pos - self.pos).normalize()
-            self.dodge_dir = direction.rotate(random.choice([-90, 90]))
+            self.dodge_dir = direction.rotate(dodge_rng.choice([-90, 90]))
+
+    def set_sprite_color(self, color):
+        self.image.fill(color)
+        self.sprite_key = ("enemy", self.image.get_size(), tuple(color))
+        atlas = getattr(self.game, "entity_atlas", None)
+        if atlas is not None:
+            atlas.add(self.sprite_key, self.image)
+
+    def render_item(self, cam_x, cam_y):
+        dest = self.rect.move(-cam_x, -cam_y)
+        atlas = getattr(self.game, "entity_atlas", None)
+        if atlas is None or self.sprite_key not in atlas or self.image.get_alpha() != 255:
+            return self.image, dest, None
+        return atlas.render_item(self.sprite_key, dest)
+
+    def render_bounds(self):
+        return self.rect
+
+    def render_items(self, cam_x, cam_y):
+        if not self.alive:
+            return ()
+        return (self.render_item(cam_x, cam_y),)
+
+    def has_overlay(self):
+        return False
+
+    def draw_overlay(self, screen, cam_x, cam_y):
+        pass
 
     def draw(self, screen, cam_x, cam_y):
-        if self.alive:
-            screen.blit(self.image, self.rect.move(-cam_x, -cam_y))
+        screen.blits(self.render_items(cam_x, cam_y), doreturn=False)
+        if self.alive and self.has_overlay():
+            self.draw_overlay(screen, cam_x, cam_y)
@@ -7,7 +7,7 @@ from .base_enemy import BaseEnemy
 class DeepOne(BaseEnemy):
     def __init__(self, game, pos):
         super().__init__(game, pos, (32, 48), 80, 0.08)
-        self.image.fill((0, 100, 120))
+        self.set_sprite_color((0, 100, 120))
 
         self.attack_range = 1.2
         self.leap_range = 7.0
@@ -21,7 +21,7 @@ class DeepOne(BaseEnemy):
     def run_ai(self, dt):
         player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
         player_dist = self.pos.distance_to(player_pos)
-        now = pygame.time.get_ticks()
+        now = self.game.clock.get_ticks()
 
         if self.state in ["STAGGER", "ATTACK", "LEAP"]:
             return
@@ -30,7 +30,7 @@ class DeepOne(BaseEnemy):
             self.is_enraged = True
             self.speed *= 1.5
             self.attack_cooldown *= 0.5
-            self.image.fill((100, 150, 180))
+            self.set_sprite_color((100, 150, 180))
 
         if player_dist < self.attack_range:
             if now - self.last_attack > self.attack_cooldown:
@@ -45,7 +45,7 @@ class DeepOne(BaseEnemy):
 
     def start_attack(self):
         self.state = "ATTACK"
-        self.last_attack = pygame.time.get_ticks()
+        self.last_attack = self.game.clock.get_ticks()
         self.combo_count = 0
         self.attack_timer = 0
         self.attack_phase = "STARTUP"
@@ -85,6 +85,3 @@ class DeepOne(BaseEnemy):
         if self.state_timer <= 0:
             self.state = "IDLE"
             self.start_attack()
-
-    def draw(self, screen, cam_x, cam_y):
-        super().draw(screen, cam_x, cam_y)
@@ -1,13 +1,15 @@
 import pygame
 import math
-import random
+from src.core.rng import get_stream
 from .base_enemy import BaseEnemy
 
+attack_rng = get_stream("enemy.ghast")
+
 
 class Ghast(BaseEnemy):
     def __init__(self, game, pos):
         super().__init__(game, pos, (80, 80), 250, 0.02)
-        self.image.fill((100, 80, 80))
+        self.set_sprite_color((100, 80, 80))
 
         self.attack_range = 2.5
         self.attack_cooldown = 4000
@@ -18,13 +20,13 @@ class Ghast(BaseEnemy):
     def run_ai(self, dt):
         player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
         player_dist = self.pos.distance_to(player_pos)
-        now = pygame.time.get_ticks()
+        now = self.game.clock.get_ticks()
 
         if self.state in ["STAGGER", "ATTACK"]:
             return
 
         if player_dist < self.attack_range and now - self.last_attack > self.attack_cooldown:
-            if random.random() > 0.4:
+            if attack_rng.random() > 0.4:
                 self.start_attack()
             else:
                 self.start_stomp()
@@ -36,13 +38,13 @@ class Ghast(BaseEnemy):
 
     def start_attack(self):
         self.state = "ATTACK"
-        self.last_attack = pygame.time.get_ticks()
+        self.last_attack = self.game.clock.get_ticks()
         self.state_timer = 1200
         self.attack_phase = "STARTUP"
 
     def start_stomp(self):
         self.state = "ATTACK"
-        self.last_attack = pygame.time.get_ticks()
+        self.last_attack = self.game.clock.get_ticks()
         self.state_timer = 1500
         self.attack_phase = "STOMP_STARTUP"
 
@@ -65,8 +67,7 @@ class Ghast(BaseEnemy):
                     if hasattr(self.game.player, "trigger_stagger"):
                         self.game.player.trigger_stagger(500)
 
-                if self.game.game_instance:
-                    self.game.game_instance.trigger_screen_shake(300, 10)
+                self.game.trigger_screen_shake(300, 10)
 
                 self.attack_phase = "RECOVERY"
 
@@ -1,13 +1,15 @@
 import pygame
 import math
-import random
+from src.core.rng import get_stream
 from .base_enemy import BaseEnemy
 
+teleport_rng = get_stream("enemy.hound")
+
 
 class HoundOfTindalos(BaseEnemy):
     def __init__(self, game, pos):
         super().__init__(game, pos, (40, 40), 60, 0.15)
-        self.image.fill((50, 50, 150))
+        self.set_sprite_color((50, 50, 150))
 
         self.teleport_cooldown = 4000
         self.last_teleport = 0
@@ -16,7 +18,7 @@ class HoundOfTindalos(BaseEnemy):
     def run_ai(self, dt):
         player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
         player_dist = self.pos.distance_to(player_pos)
-        now = pygame.time.get_ticks()
+        now = self.game.clock.get_ticks()
 
         if self.state in ["STAGGER", "TELEPORTING"]:
             return
@@ -34,7 +36,7 @@ class HoundOfTindalos(BaseEnemy):
         self.state = "TELEPORTING"
         self.state_timer = 500
         self.is_visible = False
-        self.last_teleport = pygame.time.get_ticks()
+        self.last_teleport = self.game.clock.get_ticks()
 
     def update(self, dt):
         super().update(dt)
@@ -45,8 +47,8 @@ class HoundOfTindalos(BaseEnemy):
         self.state = "IDLE"
         self.is_visible = True
 
-        angle = random.uniform(0, 360)
-        dist = random.uniform(3, 6)
+        angle = teleport_rng.uniform(0, 360)
+        dist = teleport_rng.uniform(3, 6)
         rad = math.radians(angle)
 
         player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
@@ -59,6 +61,7 @@ class HoundOfTindalos(BaseEnemy):
         player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
         self.attack_dir = (player_pos - self.pos).normalize()
 
-    def draw(self, screen, cam_x, cam_y):
-        if self.is_visible:
-            super().draw(screen, cam_x, cam_y)
+    def render_items(self, cam_x, cam_y):
+        if not self.is_visible:
+            return ()
+        return super().render_items(cam_x, cam_y)
@@ -7,7 +7,7 @@ from .base_enemy import BaseEnemy
 class ManOfLeng(BaseEnemy):
     def __init__(self, game, pos):
         super().__init__(game, pos, (32, 48), 70, 0.1)
-        self.image.fill((150, 120, 100))
+        self.set_sprite_color((150, 120, 100))
 
         self.attack_range = 1.0
         self.attack_cooldown = 1800
@@ -23,7 +23,7 @@ class ManOfLeng(BaseEnemy):
     def run_ai(self, dt):
         player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
         player_dist = self.pos.distance_to(player_pos)
-        now = pygame.time.get_ticks()
+        now = self.game.clock.get_ticks()
 
         if self.state in ["STAGGER", "ATTACK"]:
             return
@@ -49,7 +49,7 @@ class ManOfLeng(BaseEnemy):
 
     def start_attack(self, is_backstab=False):
         self.state = "ATTACK"
-        self.last_attack = pygame.time.get_ticks()
+        self.last_attack = self.game.clock.get_ticks()
         self.state_timer = 500
 
         if is_backstab:
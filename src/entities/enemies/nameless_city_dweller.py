@@ -1,13 +1,15 @@
 import pygame
 import math
-import random
+from src.core.rng import get_stream
 from .base_enemy import BaseEnemy
 
+damage_rng = get_stream("enemy.nameless")
+
 
 class NamelessCityDweller(BaseEnemy):
     def __init__(self, game, pos):
         super().__init__(game, pos, (40, 60), 120, 0.04)
-        self.image.fill((100, 100, 80))
+        self.set_sprite_color((100, 100, 80))
 
         self.magic_cooldown = 5000
         self.last_magic = 0
@@ -16,7 +18,7 @@ class NamelessCityDweller(BaseEnemy):
     def run_ai(self, dt):
         player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
         player_dist = self.pos.distance_to(player_pos)
-        now = pygame.time.get_ticks()
+        now = self.game.clock.get_ticks()
 
         if self.state in ["STAGGER", "CASTING"]:
             return
@@ -29,7 +31,7 @@ class NamelessCityDweller(BaseEnemy):
     def start_casting(self):
         self.state = "CASTING"
         self.state_timer = 2000
-        self.last_magic = pygame.time.get_ticks()
+        self.last_magic = self.game.clock.get_ticks()
 
     def update(self, dt):
         super().update(dt)
@@ -43,17 +45,18 @@ class NamelessCityDweller(BaseEnemy):
         for i in range(12):
             angle = i * 30
 
-        if self.game.game_instance:
-            self.game.game_instance.trigger_screen_shake(100, 2)
+        self.game.trigger_screen_shake(100, 2)
 
     def take_damage(self, amount):
-        if random.random() > 0.7:
+        if damage_rng.random() > 0.7:
             super().take_damage(amount)
         else:
             self.health -= amount
             if self.health <= 0:
                 self.die()
 
-    def draw(self, screen, cam_x, cam_y):
-        super().draw(screen, cam_x, cam_y)
-        self.aoe_projectiles.draw(screen)
+    def render_items(self, cam_x, cam_y):
+        items = list(super().render_items(cam_x, cam_y))
+        for projectile in self.aoe_projectiles:
+            items.append((projectile.image, projectile.rect.move(-cam_x, -cam_y)))
+        return items
@@ -1,13 +1,14 @@
 import pygame
 import math
 import random
+from src.core.surface_pool import get_shadow
 from .base_enemy import BaseEnemy
 
 
 class NightGaunt(BaseEnemy):
     def __init__(self, game, pos):
         super().__init__(game, pos, (50, 50), 90, 0.07)
-        self.image.fill((30, 30, 40))
+        self.set_sprite_color((30, 30, 40))
         self.is_flying = True
         self.altitude = 50
 
@@ -17,20 +18,23 @@ class NightGaunt(BaseEnemy):
     def run_ai(self, dt):
         player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
         player_dist = self.pos.distance_to(player_pos)
-        now = pygame.time.get_ticks()
+        now = self.game.clock.get_ticks()
 
         if self.state in ["STAGGER", "GRABBING"]:
             return
 
         if player_dist < 2.0 and now - self.last_grab > self.grab_cooldown:
             self.start_grab()
-        else:
+        elif player_dist < self.vision_range:
+            self.state = "CHASE"
             self.chase_player(dt)
+        else:
+            self.state = "IDLE"
 
     def start_grab(self):
         self.state = "GRABBING"
         self.state_timer = 1500
-        self.last_grab = pygame.time.get_ticks()
+        self.last_grab = self.game.clock.get_ticks()
 
     def update(self, dt):
         super().update(dt)
@@ -43,9 +47,12 @@ class NightGaunt(BaseEnemy):
         direction = (target_pos - self.pos).normalize()
         self.pos += direction * self.speed * (dt / 16.0)
 
-    def draw(self, screen, cam_x, cam_y):
-        shadow_pos = (self.pos.x - cam_x, self.pos.y - cam_y)
-        pygame.draw.circle(screen, (0, 0, 0, 100), shadow_pos, 15)
+    def render_bounds(self):
+        return self.rect.union(self.rect.move(0, -int(self.altitude)))
 
-        draw_pos = (self.pos.x - cam_x, self.pos.y - cam_y - self.altitude)
-        screen.blit(self.image, self.rect.move(draw_pos))
+    def render_items(self, cam_x, cam_y):
+        if not self.alive:
+            return ()
+        shadow = get_shadow(15)
+        shadow_dest = shadow.get_rect(center=(self.rect.centerx - cam_x, self.rect.centery - cam_y))
+        return (shadow, shadow_dest), self.render_item(cam_x, cam_y + int(self.altitude))
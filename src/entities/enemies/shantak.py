@@ -1,13 +1,14 @@
 import pygame
 import math
 import random
+from src.core.surface_pool import get_shadow
 from .base_enemy import BaseEnemy
 
 
 class Shantak(BaseEnemy):
     def __init__(self, game, pos):
         super().__init__(game, pos, (128, 128), 500, 0.06)
-        self.image.fill((120, 100, 80))
+        self.set_sprite_color((120, 100, 80))
         self.is_flying = True
         self.altitude = 100
 
@@ -17,20 +18,23 @@ class Shantak(BaseEnemy):
     def run_ai(self, dt):
         player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
         player_dist = self.pos.distance_to(player_pos)
-        now = pygame.time.get_ticks()
+        now = self.game.clock.get_ticks()
 
         if self.state in ["STAGGER", "DIVING"]:
             return
 
         if player_dist < 10 and now - self.last_dive > self.dive_cooldown:
             self.start_dive()
-        else:
+        elif player_dist < self.vision_range:
+            self.state = "CHASE"
             self.chase_player(dt)
+        else:
+            self.state = "IDLE"
 
     def start_dive(self):
         self.state = "DIVING"
         self.state_timer = 2000
-        self.last_dive = pygame.time.get_ticks()
+        self.last_dive = self.game.clock.get_ticks()
         self.dive_target = pygame.math.Vector2(self.game.player.x, self.game.player.y)
 
     def update(self, dt):
@@ -49,10 +53,12 @@ class Shantak(BaseEnemy):
             self.state = "IDLE"
             self.altitude = 100
 
-    def draw(self, screen, cam_x, cam_y):
-        shadow_size = 15 + (1 - self.altitude / 100) * 30
-        shadow_pos = (self.pos.x - cam_x, self.pos.y - cam_y)
-        pygame.draw.circle(screen, (0, 0, 0, 100), shadow_pos, int(shadow_size))
+    def render_bounds(self):
+        return self.rect.union(self.rect.move(0, -int(self.altitude)))
 
-        draw_pos = (self.pos.x - cam_x, self.pos.y - cam_y - self.altitude)
-        screen.blit(self.image, self.rect.move(draw_pos))
+    def render_items(self, cam_x, cam_y):
+        if not self.alive:
+            return ()
+        shadow = get_shadow(15 + (1 - self.altitude / 100) * 30)
+        shadow_dest = shadow.get_rect(center=(self.rect.centerx - cam_x, self.rect.centery - cam_y))
+        return (shadow, shadow_dest), self.render_item(cam_x, cam_y + int(self.altitude))
@@ -1,13 +1,15 @@
 import pygame
 import math
-import random
+from src.core.rng import get_stream
 from .base_enemy import BaseEnemy
 
+tentacle_rng = get_stream("enemy.shoggoth")
+
 
 class Shoggoth(BaseEnemy):
     def __init__(self, game, pos):
         super().__init__(game, pos, (64, 64), 200, 0.03)
-        self.image.fill((50, 100, 50))
+        self.set_sprite_color((50, 100, 50))
 
         self.attack_range = 3.0
         self.attack_cooldown = 2500
@@ -18,7 +20,7 @@ class Shoggoth(BaseEnemy):
     def run_ai(self, dt):
         player_pos = pygame.math.Vector2(self.game.player.x, self.game.player.y)
         player_dist = self.pos.distance_to(player_pos)
-        now = pygame.time.get_ticks()
+        now = self.game.clock.get_ticks()
 
         if self.state in ["STAGGER", "ATTACK"]:
             return
@@ -33,13 +35,13 @@ class Shoggoth(BaseEnemy):
 
     def start_attack(self):
         self.state = "ATTACK"
-        self.last_attack = pygame.time.get_ticks()
+        self.last_attack = self.game.clock.get_ticks()
 
         self.tentacles = []
-        for _ in range(random.randint(3, 6)):
-            angle = random.uniform(0, 360)
-            length = random.uniform(50, 120)
-            duration = random.uniform(500, 1000)
+        for _ in range(tentacle_rng.randint(3, 6)):
+            angle = tentacle_rng.uniform(0, 360)
+            length = tentacle_rng.uniform(50, 120)
+            duration = tentacle_rng.uniform(500, 1000)
             self.tentacles.append({"angle": angle, "length": length, "timer": duration, "max_timer": duration})
 
     def update(self, dt):
@@ -54,19 +56,24 @@ class Shoggoth(BaseEnemy):
             if not self.tentacles:
                 self.state = "IDLE"
 
-    def draw(self, screen, cam_x, cam_y):
-        super().draw(screen, cam_x, cam_y)
-
+    def render_bounds(self):
         if self.state == "ATTACK":
-            for tentacle in self.tentacles:
-                progress = tentacle["timer"] / tentacle["max_timer"]
-                current_len = tentacle["length"] * math.sin(progress * math.pi)
-
-                rad = math.radians(tentacle["angle"])
-                end_pos = (
-                    self.pos.x + math.cos(rad) * current_len,
-                    self.pos.y + math.sin(rad) * current_len
-                )
-
-                pygame.draw.line(screen, (80, 150, 80), self.pos - pygame.math.Vector2(cam_x, cam_y),
-                                 end_pos - pygame.math.Vector2(cam_x, cam_y), 8)
+            return self.rect.inflate(240, 240)
+        return self.rect
+
+    def has_overlay(self):
+        return self.state == "ATTACK"
+
+    def draw_overlay(self, screen, cam_x, cam_y):
+        center = pygame.math.Vector2(self.rect.center) - pygame.math.Vector2(cam_x, cam_y)
+        for tentacle in self.tentacles:
+            progress = tentacle["timer"] / tentacle["max_timer"]
+            current_len = tentacle["length"] * math.sin(progress * math.pi)
+
+            rad = math.radians(tentacle["angle"])
+            end_pos = (
+                center.x + math.cos(rad) * current_len,
+                center.y + math.sin(rad) * current_len
+            )
+
+            pygame.draw.line(screen, (80, 150, 80), center, end_pos, 8)
@@ -1,8 +1,8 @@
 import math
 import pygame
 from random import randint, choice
-from collections import deque
 from src.core.settings import tile_size
+from src.core.runtime import prepare_surface
 
 
 class NPC(pygame.sprite.Sprite):
@@ -14,12 +14,12 @@ class NPC(pygame.sprite.Sprite):
         self.animation_time = int(animation_time)
 
         size = (int(tile_size * self.scale), int(tile_size * self.scale))
-        self.idle_image = [pygame.Surface(size, pygame.SRCALPHA).convert_alpha()]
-        self.walk_image = [pygame.Surface(size, pygame.SRCALPHA).convert_alpha()]
-        self.attack_image = [pygame.Surface(size, pygame.SRCALPHA).convert_alpha()]
-        self.stagger_image = [pygame.Surface(size, pygame.SRCALPHA).convert_alpha()]
-        self.visceral_image = [pygame.Surface(size, pygame.SRCALPHA).convert_alpha()]
-        self.death_image = [pygame.Surface(size, pygame.SRCALPHA).convert_alpha()]
+        self.idle_image = [prepare_surface(pygame.Surface(size, pygame.SRCALPHA))]
+        self.walk_image = [prepare_surface(pygame.Surface(size, pygame.SRCALPHA))]
+        self.attack_image = [prepare_surface(pygame.Surface(size, pygame.SRCALPHA))]
+        self.stagger_image = [prepare_surface(pygame.Surface(size, pygame.SRCALPHA))]
+        self.visceral_image = [prepare_surface(pygame.Surface(size, pygame.SRCALPHA))]
+        self.death_image = [prepare_surface(pygame.Surface(size, pygame.SRCALPHA))]
 
         pygame.draw.rect(self.idle_image[0], (0, 200, 0), self.idle_image[0].get_rect())
         pygame.draw.rect(self.walk_image[0], (0, 0, 200), self.walk_image[0].get_rect())
@@ -69,6 +69,8 @@ class NPC(pygame.sprite.Sprite):
         self.run_logic(dt)
         self.animate()
         self.rect.center = (int(self.pos[0] * tile_size), int(self.pos[1] * tile_size))
+        if hasattr(self.game, "spatial_grid"):
+            self.game.spatial_grid.move(self, self.rect)
 
         if self.state_timer > 0:
             self.state_timer -= dt
@@ -84,7 +86,7 @@ class NPC(pygame.sprite.Sprite):
 
         player_pos = (self.game.player.x, self.game.player.y)
         dist_to_player = math.dist(self.pos, player_pos)
-        now = pygame.time.get_ticks()
+        now = self.game.clock.get_ticks()
 
         if self.state in ['STAGGERED', 'OPEN_FOR_VISCERAL', 'ATTACK']:
             self.handle_combat_state(dt)
@@ -116,7 +118,7 @@ class NPC(pygame.sprite.Sprite):
     def start_attack(self):
         self.attack_phase = 'STARTUP'
         self.state_timer = self.attack_startup_time + self.attack_active_time + self.attack_recovery_time
-        self.last_attack_time = pygame.time.get_ticks()
+        self.last_attack_time = self.game.clock.get_ticks()
         self.has_attacked_player = False
 
         self.attack_target_pos = (self.game.player.x, self.game.player.y)
@@ -178,14 +180,24 @@ class NPC(pygame.sprite.Sprite):
         self.has_attacked_player = False
 
     def move_towards_player(self, now, dt):
+        move_step = self.speed * (dt / 16.0)
+
+        flow_field = getattr(self.game, "flow_field", None)
+        step = flow_field.direction_from(self.pos[0], self.pos[1]) if flow_field else None
+        if step:
+            self.pos[0] += step[0] * move_step
+            self.pos[1] += step[1] * move_step
+            return
+
+        # Only reached without a flow field, i.e. from the pathfinding benchmarks; in the game the field drives pursuit.
         if now - self.last_path_update > self.path_update_delay:
             player_tile = (int(self.game.player.x), int(self.game.player.y))
             npc_tile = (int(self.pos[0]), int(self.pos[1]))
-            self.path = self.find_path(npc_tile, player_tile)
-            self.path_index = 0
-            self.last_path_update = now
-
-        move_step = self.speed * (dt / 16.0)
+            path = self.find_path(npc_tile, player_tile)
+            if path is not None:
+                self.path = path
+                self.path_index = 0
+                self.last_path_update = now
 
         if self.path and self.path_index < len(self.path):
             next_tile_center = (self.path[self.path_index][0] + 0.5, self.path[self.path_index][1] + 0.5)
@@ -218,31 +230,7 @@ class NPC(pygame.sprite.Sprite):
         return False
 
     def find_path(self, start, goal):
-        if start == goal: return []
-        queue = deque([start])
-        came_from = {start: None}
-        visited = set([start])
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-
-        while queue:
-            current = queue.popleft()
-            if current == goal: break
-            for dx, dy in directions:
-                neighbor = (current[0] + dx, current[1] + dy)
-                if self.check_wall(neighbor[0], neighbor[1]):
-                    if neighbor not in visited:
-                        queue.append(neighbor)
-                        visited.add(neighbor)
-                        came_from[neighbor] = current
-
-        if goal not in came_from: return []
-        path = []
-        current = goal
-        while current is not None:
-            path.append(current)
-            current = came_from[current]
-        path.reverse()
-        return path[1:]
+        return self.game.map.pathfinder.find_path(start, goal)
 
     def take_damage(self, damage):
         if not self.alive or self.invincible: return
@@ -303,8 +291,20 @@ class NPC(pygame.sprite.Sprite):
         if current_width > 0:
             pygame.draw.rect(screen, color, (bar_x, bar_y, current_width, bar_height))
 
-    def draw(self, screen, camera_x, camera_y):
+    def render_bounds(self):
+        return self.rect
+
+    def render_items(self, camera_x, camera_y):
         screen_x = self.pos[0] * tile_size - camera_x - (self.rect.width / 2)
         screen_y = self.pos[1] * tile_size - camera_y - (self.rect.height / 2)
-        screen.blit(self.image, (screen_x, screen_y))
+        return ((self.image, (screen_x, screen_y)),)
+
+    def has_overlay(self):
+        return self.alive
+
+    def draw_overlay(self, screen, camera_x, camera_y):
         self.draw_health_bar(screen, camera_x, camera_y)
+
+    def draw(self, screen, camera_x, camera_y):
+        screen.blits(self.render_items(camera_x, camera_y), doreturn=False)
+        self.draw_overlay(screen, camera_x, camera_y)
@@ -2,6 +2,8 @@ import pygame
 import math
 import random
 from src.core.settings import tile_size
+from src.core.runtime import PygameClock, PygameInput
+from src.core.text_cache import get_font, render_text
 
 
 class Bullet(pygame.sprite.Sprite):
@@ -171,6 +173,23 @@ class Player(pygame.sprite.Sprite):
         self.locked_target = None
         self.soul_anim_timer = 0
 
+    def get_ticks(self):
+        if self.game_instance:
+            return self.game_instance.clock.get_ticks()
+        return PygameClock().get_ticks()
+
+    def get_input(self):
+        if self.game_instance:
+            return self.game_instance.input
+        return PygameInput()
+
+    def get_screen_center(self):
+        if self.game_instance:
+            screen = self.game_instance.screen
+        else:
+            screen = pygame.display.get_surface()
+        return screen.get_width() // 2, screen.get_height() // 2
+
     def input(self, keys, mouse_buttons):
         if self.state in ["STUNNED", "VISCERAL"]:
             return
@@ -187,7 +206,7 @@ class Player(pygame.sprite.Sprite):
         if self.state == "DASH":
             return
 
-        now = pygame.time.get_ticks()
+        now = self.get_ticks()
         dx, dy = 0, 0
 
         if keys[pygame.K_w]: dy = -1
@@ -223,7 +242,7 @@ class Player(pygame.sprite.Sprite):
 
     def start_dash(self):
         self.state = "DASH"
-        self.dash_timer = pygame.time.get_ticks()
+        self.dash_timer = self.get_ticks()
         self.last_dash = self.dash_timer
         self.stamina -= self.dash_cost
         self.stamina_regen_delay = 1000
@@ -243,9 +262,8 @@ class Player(pygame.sprite.Sprite):
         else:
             self.combo_count = 1
 
-        mx, my = pygame.mouse.get_pos()
-        screen_center_x = pygame.display.get_surface().get_width() // 2
-        screen_center_y = pygame.display.get_surface().get_height() // 2
+        mx, my = self.get_input().get_mouse_pos()
+        screen_center_x, screen_center_y = self.get_screen_center()
         rel_x = mx - screen_center_x
         rel_y = my - screen_center_y
         self.facing_angle = math.degrees(math.atan2(rel_y, rel_x))
@@ -266,8 +284,8 @@ class Player(pygame.sprite.Sprite):
 
     def update(self, keys, npc_group, mouse_clicked, dt):
         if not self.alive: return
-        now = pygame.time.get_ticks()
-        mouse_buttons = pygame.mouse.get_pressed()
+        now = self.get_ticks()
+        mouse_buttons = self.get_input().get_mouse_pressed()
 
         if self.state == "DASH":
             self.update_dash(dt)
@@ -293,7 +311,7 @@ class Player(pygame.sprite.Sprite):
             dy = math.sin(rad) * self.dash_speed * (dt / 16.0)
             new_x = self.x + dx
             new_y = self.y + dy
-            if self.map.is_walkable(new_x, new_y):
+            if self.map.is_segment_walkable(self.x, self.y, new_x, new_y):
                 self.x = new_x
                 self.y = new_y
         else:
@@ -324,17 +342,23 @@ class Player(pygame.sprite.Sprite):
         else:
             self.state = "IDLE"
             self.attack_phase = "NONE"
-            self.last_attack_end = pygame.time.get_ticks()
+            self.last_attack_end = self.get_ticks()
 
     def update_visceral(self, dt):
         self.attack_timer += dt
         if self.attack_timer > 1000:
             self.state = "IDLE"
 
+    def nearby_targets(self, npc_group, rect):
+        grid = getattr(self.game_instance, "spatial_grid", None)
+        if grid is None:
+            return list(npc_group)
+        return [npc for npc in grid.query_rect(rect) if npc_group.has(npc)]
+
     def check_hit(self, npc_group):
         if not npc_group: return
         hit_poly = self.weapon.rect
-        for npc in npc_group:
+        for npc in self.nearby_targets(npc_group, hit_poly):
             if not getattr(npc, "alive", True): continue
             if hit_poly.colliderect(npc.rect):
                 if getattr(npc, "invincible", False): continue
@@ -371,8 +395,11 @@ class Player(pygame.sprite.Sprite):
 
     def check_bullet_collisions(self, npc_group):
         if not npc_group: return
-        hits = pygame.sprite.groupcollide(self.projectiles, npc_group, True, False)
-        for bullet, npcs in hits.items():
+        for bullet in self.projectiles.sprites():
+            npcs = [npc for npc in self.nearby_targets(npc_group, bullet.rect) if bullet.rect.colliderect(npc.rect)]
+            if not npcs:
+                continue
+            bullet.kill()
             for npc in npcs:
                 if getattr(npc, "alive", True):
                     npc.take_damage(self.gun_damage)
@@ -406,9 +433,8 @@ class Player(pygame.sprite.Sprite):
                 self.bullets -= 1
                 self.last_shot = now
 
-                mx, my = pygame.mouse.get_pos()
-                screen_center_x = pygame.display.get_surface().get_width() // 2
-                screen_center_y = pygame.display.get_surface().get_height() // 2
+                mx, my = self.get_input().get_mouse_pos()
+                screen_center_x, screen_center_y = self.get_screen_center()
 
                 direction = pygame.math.Vector2(mx - screen_center_x, my - screen_center_y)
                 if direction.length() > 0:
@@ -465,12 +491,25 @@ class Player(pygame.sprite.Sprite):
         elif self.stamina < self.max_stamina:
             self.stamina = min(self.max_stamina, self.stamina + self.stamina_regen * (dt / 16.0))
 
-    def draw(self, screen, cam_x, cam_y):
-        screen.blit(self.image, (self.x * tile_size - cam_x, self.y * tile_size - cam_y))
+    def render_bounds(self):
+        bounds = self.image.get_rect(topleft=(int(self.x * tile_size), int(self.y * tile_size)))
+        if self.state == "ATTACK":
+            bounds = bounds.union(self.weapon.rect)
+        return bounds
+
+    def render_items(self, cam_x, cam_y):
+        items = [(self.image, (self.x * tile_size - cam_x, self.y * tile_size - cam_y))]
         if self.state == "ATTACK":
-            screen.blit(self.weapon.image, (self.weapon.rect.x - cam_x, self.weapon.rect.y - cam_y))
+            items.append((self.weapon.image, (self.weapon.rect.x - cam_x, self.weapon.rect.y - cam_y)))
         for bullet in self.projectiles:
-            screen.blit(bullet.image, (bullet.rect.x - cam_x, bullet.rect.y - cam_y))
+            items.append((bullet.image, (bullet.rect.x - cam_x, bullet.rect.y - cam_y)))
+        return items
+
+    def has_overlay(self):
+        return False
+
+    def draw(self, screen, cam_x, cam_y):
+        screen.blits(self.render_items(cam_x, cam_y), doreturn=False)
         self.draw_hud(screen)
 
     def draw_hud(self, screen):
@@ -512,15 +551,15 @@ class Player(pygame.sprite.Sprite):
         bullet_y = vial_y + 30
         pygame.draw.circle(screen, (180, 180, 180), (bullet_x, bullet_y), 10)
 
-        font_sm = pygame.font.SysFont("timesnewroman", 20)
-        b_txt = font_sm.render(f"{self.bullets}", True, (255, 255, 255))
+        font_sm = get_font("timesnewroman", 20)
+        b_txt = render_text(font_sm, f"{self.bullets}", True, (255, 255, 255))
         screen.blit(b_txt, (bullet_x + 15, bullet_y - 10))
 
         self.draw_currency(screen)
 
     def draw_currency(self, screen):
-        font = pygame.font.SysFont("timesnewroman", 32)
-        text = font.render(f"{self.currency}", True, (255, 255, 255))
+        font = get_font("timesnewroman", 32)
+        text = render_text(font, f"{self.currency}", True, (255, 255, 255))
 
         padding_x = 30
         padding_y = 30
@@ -533,7 +572,7 @@ class Player(pygame.sprite.Sprite):
         pygame.draw.circle(screen, (200, 200, 255), (icon_x, icon_y), 8)
         pygame.draw.circle(screen, (255, 255, 255), (icon_x, icon_y), 4)
 
-        shadow = font.render(f"{self.currency}", True, (0, 0, 0))
+        shadow = render_text(font, f"{self.currency}", True, (0, 0, 0))
         screen.blit(shadow, (pos_x + 2, pos_y + 2))
         screen.blit(text, (pos_x, pos_y))
 
@@ -0,0 +1,143 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import random
+import time
+import pygame
+from src.core.runtime import SimulatedClock, ScriptedInput
+from src.core.replay import ReplayRecorder, read_replay, seed_session, prepare_playback, play_replay
+from src.world.spawn_points import get_spawn_point
+from engine import Game
+from entities.enemies.deep_one import DeepOne
+from entities.enemies.men_of_leng import ManOfLeng
+from entities.enemies.ghast import Ghast
+from entities.enemies.shoggoth import Shoggoth
+from entities.enemies.hound_of_tindalos import HoundOfTindalos
+from entities.enemies.night_gaunt import NightGaunt
+from entities.enemies.shantak import Shantak
+from entities.enemies.nameless_city_dweller import NamelessCityDweller
+
+MOVE_KEYS = [pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d]
+ENEMY_TYPES = {cls.__name__: cls for cls in (DeepOne, ManOfLeng, Ghast, Shoggoth, HoundOfTindalos, NightGaunt, Shantak,
+                                             NamelessCityDweller)}
+
+
+class WanderInput(ScriptedInput):
+    def __init__(self, screen_size, seed=0, change_every=30):
+        super().__init__()
+        self.screen_size = screen_size
+        self.rng = random.Random(seed)
+        self.change_every = change_every
+        self.tick = 0
+
+    def step(self):
+        if self.tick % self.change_every == 0:
+            keys = [key for key in MOVE_KEYS if self.rng.random() < 0.35]
+            if self.rng.random() < 0.1:
+                keys.append(pygame.K_SPACE)
+            if self.rng.random() < 0.05:
+                keys.append(pygame.K_q)
+            mouse_pos = (self.rng.randint(0, self.screen_size[0]), self.rng.randint(0, self.screen_size[1]))
+            attack = self.rng.random() < 0.3
+            self.set_state(keys=keys, mouse_pos=mouse_pos, mouse_pressed=(attack, False, False))
+        self.tick += 1
+
+
+def location_name(map_name):
+    return "village" if map_name == "village" else "port"
+
+
+def load_map_data(map_name):
+    from src.world.map_format import load_location
+    return load_location(location_name(map_name))
+
+
+def create_headless_game(map_name="port", size=(1280, 720), clock=None, input_source=None):
+    pygame.init()
+    screen = pygame.Surface(size)
+    if clock is None:
+        clock = SimulatedClock()
+    if input_source is None:
+        input_source = ScriptedInput()
+    game = Game(screen, load_map_data(map_name), clock=clock, input_source=input_source)
+
+    # Game starts the player at a fixed tile that is not walkable on every map, so place them the way load_map does.
+    spawn_x, spawn_y = get_spawn_point(location_name(map_name))
+    game.set_map(game.map, spawn_x, spawn_y)
+    game.player.respawn_x, game.player.respawn_y = spawn_x, spawn_y
+    return game
+
+
+def create_replay_game(replay):
+    seed_session(replay.seeds)
+    game = create_headless_game(replay.map_name, replay.screen_size)
+    prepare_playback(game, replay, ENEMY_TYPES)
+    return game
+
+
+def run_ticks(game, ticks, draw=False):
+    player = game.player
+    travelled = 0.0
+    for _ in range(ticks):
+        if hasattr(game.input, "step"):
+            game.input.step()
+
+        x, y = player.x, player.y
+        game.update(game.input.get_keys())
+        travelled += abs(player.x - x) + abs(player.y - y)
+
+        if draw:
+            game.draw()
+
+        if not game.player.alive:
+            game.restart()
+    return travelled
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game simulation without a display.")
+    parser.add_argument("--map", default="port", choices=["port", "village"])
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--draw", action="store_true", help="also render every tick to an offscreen surface")
+    parser.add_argument("--record", default=None, help="record the session to this replay file")
+    parser.add_argument("--replay", default=None, help="play back a recorded replay file instead of wandering")
+    parser.add_argument("--realtime", action="store_true", help="play the replay back at its recorded speed")
+    args = parser.parse_args()
+
+    if args.replay:
+        replay = read_replay(args.replay)
+        game = create_replay_game(replay)
+        start = time.perf_counter()
+        ticks = play_replay(game, realtime=args.realtime, draw=args.draw)
+        elapsed = time.perf_counter() - start
+    else:
+        size = (args.width, args.height)
+        seeds = seed_session({"random": args.seed})
+        game = create_headless_game(args.map, size, input_source=WanderInput(size, seed=args.seed))
+        recorder = ReplayRecorder.start(game, args.map, seeds, args.record) if args.record else None
+
+        start = time.perf_counter()
+        travelled = run_ticks(game, args.ticks, draw=args.draw)
+        elapsed = time.perf_counter() - start
+        ticks = args.ticks
+        if recorder is not None:
+            recorder.stop(game)
+        print(f"player travelled {travelled:.1f} tiles")
+        if ticks and travelled == 0:
+            parser.exit(1, "error: the player never moved; the wander run only exercised idle enemies\n")
+
+    print(f"{ticks} ticks in {elapsed:.3f}s ({ticks / elapsed:.0f} ticks/s), "
+          f"simulated {game.clock.get_ticks() / 1000:.1f}s, enemies alive: {len(game.enemies)}, "
+          f"player at ({game.player.x:.3f}, {game.player.y:.3f}) health {game.player.health}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,31 @@
+import time
+from functools import partial
+
+startup_begin = time.perf_counter()
+
 import pygame
-from src.core.settings import screen_resolutions, current_resolution_index, tile_size
-from ui.menu.main_option import MainOption
-from ui.menu.pause_option import PauseOption
-from ui.menu.menu import Menu
-from ui.pause_menu.pause_menu import PauseMenu
-from ui.pause_menu.task_panel import TasksPanel
-from ui.pause_menu.inventory_panel import InventoryPanel
-from src.ui.menu.sub_menus import BrightnessMenu, KeySettingsMenu, PlaceholderMenu, GameOptionsMenu
-from src.ui.elements.dialogue_box import DialogueBox
-
-from src.ui.cutscene import Cutscene
-from src.ui.weather import Rain, Fog
-from engine import Game
-from src.world.сheckpoint import Checkpoint
-from src.ui.menu.upgrade_menu import UpgradeMenu
-from core.save_manager import SaveManager
-from src.ui.elements.toast import Toast
-from src.ui.elements.death_screen import DeathScreen
-from src.world.locations.port import map_data as port_map
-from src.world.locations.village import map_data as village_map
-from src.world.level_manager import Map
 import src.core.settings as settings
-from src.entities.enemies.men_of_leng import ManOfLeng
+from src.core.settings import tile_size
+from src.core.startup import StartupTimer, LazyComponents
+from src.core.profiler import Profiler
+from src.core.text_cache import get_font
+from src.core.surface_pool import surface_pool, get_scrim
+from src.world.spawn_points import get_spawn_point
+from ui.menu.menu import Menu
+
+startup = StartupTimer(start=startup_begin, enabled=settings.startup_log)
+startup.mark("imports")
 
 pygame.init()
 if not pygame.display.get_init():
     pygame.display.init()
 
+try:
+    pygame.mixer.init()
+except Exception:
+    pass
+startup.mark("pygame init")
+
 initial_screen_width, initial_screen_height = settings.screen_resolutions[settings.current_resolution_index]
 
 
@@ -41,55 +40,19 @@ def safe_set_mode(size, flags=0):
 pygame.display.set_caption("Game")
 screen = safe_set_mode((initial_screen_width, initial_screen_height), pygame.RESIZABLE)
 clock = pygame.time.Clock()
-
-try:
-    pygame.mixer.init()
-except Exception:
-    pass
+startup.mark("display")
 
 menu = Menu(screen)
-main_option = MainOption(screen)
-pause_option = PauseOption(screen)
-pause_menu = PauseMenu(screen)
-tasks_panel = TasksPanel(screen)
-inventory_panel = InventoryPanel(screen)
-toast = Toast()
-death_screen = DeathScreen(screen.get_width(), screen.get_height())
-dialogue_box = DialogueBox(screen)
-
-rain = Rain(screen, intensity=100)
-fog = Fog(screen, density=30)
-
-brightness_menu = BrightnessMenu(screen)
-key_settings_menu = KeySettingsMenu(screen)
-game_options_menu = GameOptionsMenu(screen)
-network_menu = PlaceholderMenu(screen, "Network Settings")
-pc_menu = PlaceholderMenu(screen, "PC Settings")
+startup.mark("menu")
 
-current_map_name = "port"
-game = Game(screen, port_map)
-game.set_dialogue_system(dialogue_box)
-
-checkpoints = [
-    Checkpoint(5, 5),
-    Checkpoint(70, 5)
-]
-
-upgrade_menu = UpgradeMenu()
-save_manager = SaveManager()
+profiler = Profiler(history=settings.profiler_history, enabled=settings.profiler_enabled,
+                    budget_ms=1000.0 / settings.sim_tick_rate)
 
-font = pygame.font.SysFont(None, 48)
-font_small = pygame.font.SysFont(None, 28)
-
-try:
-    save_sound = pygame.mixer.Sound("save.wav")
-    level_sound = pygame.mixer.Sound("level.wav")
-except Exception:
-    save_sound = None
-    level_sound = None
+font = get_font(None, 48)
+font_small = get_font(None, 28)
 
-for cp in checkpoints:
-    cp.set_sounds(save_sound, level_sound)
+NEIGHBOURS = {"port": "village", "village": "port"}
+ENTRY_POINTS = {"port": "from_port", "village": "from_village"}
 
 cutscene_scenes = [
     {"text": "1866 рік. Світ потопає у хвилі незрозумілого насильства.", "image": "src/assets/images/cutscenes/1.jpg"},
@@ -98,95 +61,261 @@ cutscene_scenes = [
     {"text": "Громада закрита, доказів немає. Я — детектив-доброволець, моя мета — знайти істину.", "image": "src/assets/images/cutscenes/4.jpg"},
     {"text": "Я зберу матеріали для офіційної влади. Це мій шлях крізь тінь Грейт-Вас.", "image": "src/assets/images/cutscenes/5.jpg"}
 ]
-intro_cutscene = Cutscene(screen, cutscene_scenes)
 
 current_state = "menu"
 previous_state = None
 is_fullscreen = False
+current_map_name = "port"
 
+ui = LazyComponents(startup)
 
-def load_map(map_name, entry_point="default"):
-    global game, current_map_name
-    current_map_name = map_name
 
-    if map_name == "port":
-        new_map_data = port_map
-        if entry_point == "from_village":
-            spawn_x, spawn_y = 32, 2
-        else:
-            spawn_x, spawn_y = 32, 30
+def refresh_layout(component, new_screen):
+    component.screen = new_screen
+    if hasattr(component, "recalculate_layout"):
+        component.recalculate_layout()
 
-    elif map_name == "village":
-        new_map_data = village_map
-        if entry_point == "from_port":
-            spawn_x, spawn_y = 20, 38
-        else:
-            spawn_x, spawn_y = 20, 38
 
-    game.map = Map(new_map_data)
-    game.player.map = game.map
+def refresh_screen(component, new_screen):
+    component.screen = new_screen
 
-    game.player.x = spawn_x
-    game.player.y = spawn_y
-    game.player.target_x = spawn_x
-    game.player.target_y = spawn_y
 
-    game.enemies.empty()
+def refresh_death_screen(component, new_screen):
+    component.w = new_screen.get_width()
+    component.h = new_screen.get_height()
 
-    if map_name == "village":
-        enemy = ManOfLeng(game, (25, 25))
-        game.enemies.add(enemy)
-    elif map_name == "port":
-        pass
 
-    toast.show(f"Entered {map_name.capitalize()}", 2000)
+def refresh_dialogue_box(component, new_screen):
+    component.screen = new_screen
+    component.y = new_screen.get_height() - component.height
 
 
-def update_screen_references(new_screen):
-    global screen
-    screen = new_screen
+def create_main_option():
+    from ui.menu.main_option import MainOption
+    return MainOption(screen)
+
+
+def create_pause_option():
+    from ui.menu.pause_option import PauseOption
+    return PauseOption(screen)
+
+
+def create_pause_menu():
+    from ui.pause_menu.pause_menu import PauseMenu
+    return PauseMenu(screen)
+
+
+def create_tasks_panel():
+    from ui.pause_menu.task_panel import TasksPanel
+    return TasksPanel(screen)
+
+
+def create_inventory_panel():
+    from ui.pause_menu.inventory_panel import InventoryPanel
+    return InventoryPanel(screen)
+
+
+def create_toast():
+    from src.ui.elements.toast import Toast
+    return Toast()
+
+
+def create_death_screen():
+    from src.ui.elements.death_screen import DeathScreen
+    return DeathScreen(screen.get_width(), screen.get_height())
+
+
+def create_dialogue_box():
+    from src.ui.elements.dialogue_box import DialogueBox
+    return DialogueBox(screen)
+
+
+def create_rain():
+    from src.ui.weather import Rain
+    return Rain(screen, intensity=100)
+
+
+def create_fog():
+    from src.ui.weather import Fog
+    return Fog(screen, density=30)
+
+
+def create_brightness_menu():
+    from src.ui.menu.sub_menus import BrightnessMenu
+    return BrightnessMenu(screen)
+
+
+def create_key_settings_menu():
+    from src.ui.menu.sub_menus import KeySettingsMenu
+    return KeySettingsMenu(screen)
 
-    menu.screen = screen
-    menu.recalculate_layout()
 
-    main_option.screen = screen
-    main_option.recalculate_layout()
+def create_game_options_menu():
+    from src.ui.menu.sub_menus import GameOptionsMenu
+    return GameOptionsMenu(screen)
 
-    pause_option.screen = screen
-    pause_option.recalculate_layout()
 
-    pause_menu.screen = screen
-    pause_menu.recalculate_layout()
+def create_network_menu():
+    from src.ui.menu.sub_menus import PlaceholderMenu
+    return PlaceholderMenu(screen, "Network Settings")
 
-    tasks_panel.screen = screen
-    inventory_panel.screen = screen
 
-    death_screen.w = screen.get_width()
-    death_screen.h = screen.get_height()
+def create_pc_menu():
+    from src.ui.menu.sub_menus import PlaceholderMenu
+    return PlaceholderMenu(screen, "PC Settings")
 
-    dialogue_box.screen = screen
-    dialogue_box.y = screen.get_height() - dialogue_box.height
 
-    rain.screen = screen
-    rain.recalculate_layout()
+def create_intro_cutscene():
+    from src.ui.cutscene import Cutscene
+    return Cutscene(screen, cutscene_scenes)
 
-    fog.screen = screen
-    fog.recalculate_layout()
 
-    brightness_menu.screen = screen
-    brightness_menu.recalculate_layout()
-    key_settings_menu.screen = screen
-    key_settings_menu.recalculate_layout()
-    game_options_menu.screen = screen
-    game_options_menu.recalculate_layout()
-    network_menu.screen = screen
-    network_menu.recalculate_layout()
-    pc_menu.screen = screen
-    pc_menu.recalculate_layout()
+def create_upgrade_menu():
+    from src.ui.menu.upgrade_menu import UpgradeMenu
+    return UpgradeMenu()
 
-    intro_cutscene.screen = screen
 
-    game.screen = screen
+def create_save_manager():
+    from core.save_manager import SaveManager
+    return SaveManager()
+
+
+def create_sounds():
+    try:
+        return pygame.mixer.Sound("save.wav"), pygame.mixer.Sound("level.wav")
+    except Exception:
+        return None, None
+
+
+def create_checkpoints():
+    from src.world.сheckpoint import Checkpoint
+    checkpoints = [
+        Checkpoint(5, 5),
+        Checkpoint(70, 5)
+    ]
+
+    save_sound, level_sound = ui.sounds
+    for cp in checkpoints:
+        cp.set_sounds(save_sound, level_sound)
+    return checkpoints
+
+
+def create_level_streamer():
+    from src.world.level_streaming import LevelStreamer
+    from src.world.map_format import load_location
+    locations = {"port": partial(load_location, "port"), "village": partial(load_location, "village")}
+    return LevelStreamer(locations, NEIGHBOURS)
+
+
+def create_level_transition():
+    from src.ui.transition import FadeTransition
+    return FadeTransition(250)
+
+
+def create_game():
+    from engine import Game
+    from src.world.map_format import load_location
+    seeds = None
+    if settings.record_replays:
+        from src.core.replay import seed_session
+        seeds = seed_session()
+    new_game = Game(screen, load_location(current_map_name), profiler=profiler)
+    new_game.set_dialogue_system(ui.dialogue_box)
+
+    if ui.save_manager.load(new_game.player):
+
+        for cp in ui.checkpoints:
+            if cp.x == new_game.player.respawn_x and cp.y == new_game.player.respawn_y:
+                cp.bonfire_lit = True
+
+    if seeds is not None:
+        start_recording(new_game, seeds)
+    return new_game
+
+
+def start_recording(game, seeds):
+    from src.core.replay import ReplayRecorder, replay_path
+    ReplayRecorder.start(game, current_map_name, seeds, replay_path(settings.replay_dir, current_map_name))
+
+
+def stop_recording():
+    if ui.is_loaded("game") and ui.game.recorder is not None:
+        ui.game.recorder.stop(ui.game)
+
+
+ui.register("main_option", create_main_option, refresh_layout)
+ui.register("pause_option", create_pause_option, refresh_layout)
+ui.register("pause_menu", create_pause_menu, refresh_layout)
+ui.register("tasks_panel", create_tasks_panel, refresh_screen)
+ui.register("inventory_panel", create_inventory_panel, refresh_screen)
+ui.register("toast", create_toast)
+ui.register("death_screen", create_death_screen, refresh_death_screen)
+ui.register("dialogue_box", create_dialogue_box, refresh_dialogue_box)
+ui.register("rain", create_rain, refresh_layout)
+ui.register("fog", create_fog, refresh_layout)
+ui.register("brightness_menu", create_brightness_menu, refresh_layout)
+ui.register("key_settings_menu", create_key_settings_menu, refresh_layout)
+ui.register("game_options_menu", create_game_options_menu, refresh_layout)
+ui.register("network_menu", create_network_menu, refresh_layout)
+ui.register("pc_menu", create_pc_menu, refresh_layout)
+ui.register("intro_cutscene", create_intro_cutscene, refresh_screen)
+ui.register("upgrade_menu", create_upgrade_menu)
+ui.register("save_manager", create_save_manager)
+ui.register("sounds", create_sounds)
+ui.register("checkpoints", create_checkpoints)
+ui.register("level_streamer", create_level_streamer)
+ui.register("level_transition", create_level_transition)
+ui.register("game", create_game, refresh_screen)
+
+
+def get_neighbour_spawn(map_name):
+    return get_spawn_point(map_name, ENTRY_POINTS[current_map_name])
+
+
+def load_map(map_name, entry_point="default"):
+    global current_map_name
+    game = ui.game
+    previous_map_name = current_map_name
+    previous_map = game.map
+    current_map_name = map_name
+
+    spawn_x, spawn_y = get_spawn_point(map_name, entry_point)
+
+    if previous_map_name == map_name:
+        new_map = previous_map
+    else:
+        new_map = ui.level_streamer.take(map_name)
+        ui.level_streamer.store(previous_map_name, previous_map)
+
+    game.set_map(new_map, spawn_x, spawn_y)
+
+    game.clear_enemies()
+
+    if map_name == "village":
+        from src.entities.enemies.men_of_leng import ManOfLeng
+        enemy = ManOfLeng(game, (25, 25))
+        game.add_enemy(enemy)
+    elif map_name == "port":
+        pass
+
+    if game.recorder is not None:
+        seeds = game.recorder.replay.seeds
+        game.recorder.stop(game)
+        start_recording(game, seeds)
+
+    ui.toast.show(f"Entered {map_name.capitalize()}", 2000)
+
+
+def update_screen_references(new_screen):
+    global screen
+    if screen is not None and new_screen.get_size() != screen.get_size():
+        surface_pool.invalidate()
+    screen = new_screen
+
+    menu.screen = screen
+    menu.recalculate_layout()
+
+    ui.resize(screen)
 
 
 def toggle_fullscreen():
@@ -206,23 +335,21 @@ def toggle_fullscreen():
         update_screen_references(new_screen)
 
 
-if save_manager.load(game.player):
-
-    for cp in checkpoints:
-        if cp.x == game.player.respawn_x and cp.y == game.player.respawn_y:
-            cp.bonfire_lit = True
-
 running = True
 while running:
     if not pygame.display.get_surface():
         new_screen = safe_set_mode((initial_screen_width, initial_screen_height), pygame.RESIZABLE)
         update_screen_references(new_screen)
 
+    profiler.begin_frame()
+
     events = pygame.event.get()
     keys = pygame.key.get_pressed()
     now = pygame.time.get_ticks()
     real_dt = clock.get_time()
 
+    profiler.handle_events(events)
+
     for event in events:
         if event.type == pygame.QUIT:
             running = False
@@ -231,13 +358,14 @@ while running:
 
     if current_state == "cutscene":
         for event in events:
-            intro_cutscene.handle_event(event)
+            ui.intro_cutscene.handle_event(event)
 
-        if not intro_cutscene.update(real_dt):
+        if not ui.intro_cutscene.update(real_dt):
             current_state = "game"
+            ui.intro_cutscene.release()
             load_map("port")
 
-        intro_cutscene.draw()
+        ui.intro_cutscene.draw()
 
     elif current_state == "menu":
         action = menu.handle_ev(events)
@@ -247,22 +375,22 @@ while running:
         elif action == "options":
             current_state = "main_options"
             previous_state = "menu"
-            main_option.show()
+            ui.main_option.show()
         elif action == "quit":
             running = False
         menu.draw()
 
     elif current_state == "main_options":
-        action = main_option.handle_ev(events)
+        action = ui.main_option.handle_ev(events)
         if action == "back":
             current_state = "menu"
-            main_option.hide()
+            ui.main_option.hide()
         elif action == "change_resolution":
             settings.current_resolution_index = (settings.current_resolution_index + 1) % len(settings.screen_resolutions)
             new_width, new_height = settings.screen_resolutions[settings.current_resolution_index]
             new_screen = safe_set_mode((new_width, new_height), pygame.RESIZABLE)
             update_screen_references(new_screen)
-            main_option.recalculate_layout()
+            ui.main_option.recalculate_layout()
         elif action == "game_options":
             current_state = "game_options"
             previous_state = "main_options"
@@ -278,55 +406,56 @@ while running:
         elif action == "pc_settings":
             current_state = "pc_settings"
             previous_state = "main_options"
-        main_option.draw()
+        ui.main_option.draw()
 
     elif current_state == "game_options":
         for event in events:
-            res = game_options_menu.handle_ev(event)
+            res = ui.game_options_menu.handle_ev(event)
             if res == "back":
                 current_state = "main_options"
-        game_options_menu.draw()
+        ui.game_options_menu.draw()
 
     elif current_state == "brightness":
         for event in events:
-            res = brightness_menu.handle_ev(event)
+            res = ui.brightness_menu.handle_ev(event)
             if res == "back":
                 current_state = "main_options"
-        brightness_menu.draw()
+        ui.brightness_menu.draw()
 
     elif current_state == "key_settings":
         for event in events:
-            res = key_settings_menu.handle_ev(event)
+            res = ui.key_settings_menu.handle_ev(event)
             if res == "back":
                 current_state = "main_options"
-        key_settings_menu.draw()
+        ui.key_settings_menu.draw()
 
     elif current_state == "network_settings":
         for event in events:
-            res = network_menu.handle_ev(event)
+            res = ui.network_menu.handle_ev(event)
             if res == "back":
                 current_state = "main_options"
-        network_menu.draw()
+        ui.network_menu.draw()
 
     elif current_state == "pc_settings":
         for event in events:
-            res = pc_menu.handle_ev(event)
+            res = ui.pc_menu.handle_ev(event)
             if res == "back":
                 current_state = "main_options"
-        pc_menu.draw()
+        ui.pc_menu.draw()
 
     elif current_state == "game":
+        game = ui.game
         mouse_clicked = False
         shoot = False
         shoot_dir_right = True
         lock_pressed = False
         activate_checkpoint = False
 
-        any_menu_open = any(cp.menu_open or cp.upgrade_open for cp in checkpoints)
-        dialogue_active = dialogue_box.active
+        any_menu_open = any(cp.menu_open or cp.upgrade_open for cp in ui.checkpoints)
+        dialogue_active = ui.dialogue_box.active
 
         if dialogue_active:
-            dialogue_box.handle_input(events)
+            ui.dialogue_box.handle_input(events)
         else:
             for event in events:
                 if event.type == pygame.MOUSEBUTTONDOWN:
@@ -334,7 +463,7 @@ while running:
                         mouse_clicked = True
                     elif event.button == 3:
                         if any_menu_open:
-                            for cp in checkpoints:
+                            for cp in ui.checkpoints:
                                 cp.close_all()
                         else:
                             shoot = True
@@ -349,7 +478,7 @@ while running:
                         activate_checkpoint = True
                     elif event.key == pygame.K_ESCAPE:
                         handled_by_cp = False
-                        for cp in checkpoints:
+                        for cp in ui.checkpoints:
                             if cp.upgrade_open:
                                 cp.upgrade_open = False
                                 cp.menu_open = True
@@ -361,141 +490,160 @@ while running:
                         if not handled_by_cp:
                             current_state = "pause"
                             previous_state = "game"
-                            pause_menu.show()
+                            ui.pause_menu.show()
 
         game.handle_events(events)
 
-        if not any_menu_open and not dialogue_active:
-            game.update(keys, mouse_clicked, shoot, shoot_dir_right, lock_pressed)
+        if ui.level_transition.active:
+            ui.level_transition.update(real_dt)
+        elif not any_menu_open and not dialogue_active:
+            with profiler.scope("game.update"):
+                game.run_frame(real_dt, keys, mouse_clicked, shoot, shoot_dir_right, lock_pressed)
 
             if game.map.check_trigger(game.player.x, game.player.y):
-                if current_map_name == "port":
-                    load_map("village", entry_point="from_port")
-                elif current_map_name == "village":
-                    load_map("port", entry_point="from_village")
+                target_map = NEIGHBOURS.get(current_map_name)
+                if target_map is not None:
+                    entry = ENTRY_POINTS[current_map_name]
+                    ui.level_transition.start(lambda target=target_map, entry=entry: load_map(target, entry_point=entry))
+
+        with profiler.scope("level_streaming"):
+            ui.level_streamer.update(current_map_name, game.map, game.player.x, game.player.y, get_neighbour_spawn)
 
         if not dialogue_active:
             for fnpc in game.friendly_npcs:
                 fnpc.handle_input(events)
 
-        for cp in checkpoints:
-            cp.update(game.player, now)
-            if activate_checkpoint and cp.active:
-                cp.open_menu(game.player)
-
-        game.draw()
-
-        rain.update()
-        rain.draw()
-
-        fog.update()
-        fog.draw()
-
-        if brightness_menu.brightness < 1.0:
-            darkness = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
-            alpha = int((1.0 - brightness_menu.brightness) * 255)
-            darkness.fill((0, 0, 0, alpha))
-            screen.blit(darkness, (0, 0))
-
-        for cp in checkpoints:
-            btns = cp.draw(screen, game.camera_x, game.camera_y, font, font_small)
-            if cp.menu_open and not cp.upgrade_open:
-                cp.handle_menu_keys(game.player, toast, game, keys, now)
-                cp.handle_menu_mouse(game.player, toast, game, btns, now)
-            if cp.upgrade_open:
-                cb, bb = upgrade_menu.draw(screen, game.player, font, font_small)
-                res = upgrade_menu.handle_input(game.player, events, keys, cb, bb, toast, level_sound)
-                if res == "close":
-                    cp.close_all()
-                elif res == "back":
-                    cp.upgrade_open = False
-                    cp.menu_open = True
-
-        dialogue_box.update(real_dt)
-        dialogue_box.draw()
-
-        toast.draw(screen, font_small)
-
-        if not game.player.alive:
-            death_screen.show()
-            death_screen.update()
-            death_screen.draw(screen)
-            if keys[pygame.K_r]:
-                game.player.restart()
-                game.respawn_enemies()
-                death_screen.hide()
-        else:
-            death_screen.hide()
+        with profiler.scope("checkpoints.update"):
+            for cp in ui.checkpoints:
+                cp.update(game.player, now)
+                if activate_checkpoint and cp.active:
+                    cp.open_menu(game.player)
+
+        with profiler.scope("game.draw"):
+            game.draw()
+
+        with profiler.scope("rain"):
+            ui.rain.update()
+            ui.rain.draw()
+
+        with profiler.scope("fog"):
+            ui.fog.update()
+            ui.fog.draw()
+
+        with profiler.scope("brightness"):
+            if ui.brightness_menu.brightness < 1.0:
+                alpha = int((1.0 - ui.brightness_menu.brightness) * 255)
+                screen.blit(get_scrim(screen.get_size(), (0, 0, 0), alpha), (0, 0))
+
+        with profiler.scope("checkpoints.draw"):
+            for cp in ui.checkpoints:
+                btns = cp.draw(screen, game.camera_x, game.camera_y, font, font_small)
+                if cp.menu_open and not cp.upgrade_open:
+                    cp.handle_menu_keys(game.player, ui.toast, game, keys, now)
+                    cp.handle_menu_mouse(game.player, ui.toast, game, btns, now)
+                if cp.upgrade_open:
+                    cb, bb = ui.upgrade_menu.draw(screen, game.player, font, font_small)
+                    res = ui.upgrade_menu.handle_input(game.player, events, keys, cb, bb, ui.toast, ui.sounds[1])
+                    if res == "close":
+                        cp.close_all()
+                    elif res == "back":
+                        cp.upgrade_open = False
+                        cp.menu_open = True
+
+        ui.level_transition.draw(screen)
+
+        with profiler.scope("ui"):
+            ui.dialogue_box.update(real_dt)
+            ui.dialogue_box.draw()
+
+            ui.toast.draw(screen, font_small)
+
+            if not game.player.alive:
+                ui.death_screen.show()
+                ui.death_screen.update()
+                ui.death_screen.draw(screen)
+                if keys[pygame.K_r]:
+                    game.restart()
+                    ui.death_screen.hide()
+            else:
+                ui.death_screen.hide()
 
         if not any_menu_open and not dialogue_active and keys[pygame.K_F5]:
-            save_manager.save(game.player)
-            toast.show("Updated checkpoint.", 1200)
+            ui.save_manager.save(game.player)
+            ui.toast.show("Updated checkpoint.", 1200)
 
     elif current_state == "pause":
         for event in events:
             if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_p):
                 current_state = "game"
-                pause_menu.hide()
+                ui.pause_menu.hide()
 
-        action = pause_menu.handle_ev(events)
+        action = ui.pause_menu.handle_ev(events)
         if action == "settings":
             current_state = "pause_options"
             previous_state = "pause"
-            pause_option.show()
+            ui.pause_option.show()
         elif action == "tasks":
             current_state = "tasks"
             previous_state = "pause"
-            pause_menu.hide()
-            tasks_panel.show()
-            inventory_panel.hide()
+            ui.pause_menu.hide()
+            ui.tasks_panel.show()
+            ui.inventory_panel.hide()
         elif action == "inventory":
             current_state = "inventory"
             previous_state = "pause"
-            pause_menu.hide()
-            inventory_panel.show()
-            tasks_panel.hide()
+            ui.pause_menu.hide()
+            ui.inventory_panel.show()
+            ui.tasks_panel.hide()
         elif action == "menu":
             current_state = "menu"
             previous_state = "pause"
-            pause_menu.hide()
-            tasks_panel.hide()
-            inventory_panel.hide()
+            ui.pause_menu.hide()
+            ui.tasks_panel.hide()
+            ui.inventory_panel.hide()
 
-        game.draw()
-        pause_menu.draw()
+        ui.game.draw()
+        ui.pause_menu.draw()
 
     elif current_state == "pause_options":
-        action = pause_option.handle_ev(events)
+        action = ui.pause_option.handle_ev(events)
         if action == "back":
             current_state = "pause"
-            pause_option.hide()
+            ui.pause_option.hide()
         elif action == "toggle_fullscreen":
             toggle_fullscreen()
 
-        game.draw()
-        pause_option.draw()
+        ui.game.draw()
+        ui.pause_option.draw()
 
     elif current_state == "tasks":
-        game.draw()
-        tasks_panel.draw()
-        res = tasks_panel.handle_ev(events)
+        ui.game.draw()
+        ui.tasks_panel.draw()
+        res = ui.tasks_panel.handle_ev(events)
         if res == "back":
-            tasks_panel.hide()
+            ui.tasks_panel.hide()
             current_state = "pause"
             previous_state = "tasks"
-            pause_menu.show()
+            ui.pause_menu.show()
 
     elif current_state == "inventory":
-        game.draw()
-        inventory_panel.draw()
-        res = inventory_panel.handle_ev(events)
+        ui.game.draw()
+        ui.inventory_panel.draw()
+        res = ui.inventory_panel.handle_ev(events)
         if res == "back":
-            inventory_panel.hide()
+            ui.inventory_panel.hide()
             current_state = "pause"
             previous_state = "inventory"
-            pause_menu.show()
+            ui.pause_menu.show()
+
+    profiler.draw(screen)
+
+    with profiler.scope("flip"):
+        pygame.display.flip()
+    profiler.end_frame()
+    startup.first_frame()
 
-    pygame.display.flip()
-    clock.tick(60)
+    clock.tick(settings.fps)
 
+stop_recording()
 pygame.quit()
@@ -1,12 +1,15 @@
 import pygame
 import os
+from src.core.text_cache import get_font, render_text, reveal_lines, wrap_text
+from src.core.surface_pool import get_scrim
+from src.core.assets import assets
 
 
 class Cutscene:
     def __init__(self, screen, scenes, font_size=32, color=(200, 200, 200), speed=1.5):
         self.screen = screen
         self.scenes = scenes
-        self.font = pygame.font.SysFont("timesnewroman", font_size)
+        self.font = get_font("timesnewroman", font_size)
         self.color = color
         self.speed = speed
 
@@ -16,8 +19,13 @@ class Cutscene:
         self.is_line_complete = False
 
         self.images = {}
+        self.scaled_images = {}
+        self.image_paths = {}
         self.load_images()
 
+        self.continue_icon = pygame.Surface((10, 10), pygame.SRCALPHA)
+        pygame.draw.polygon(self.continue_icon, (200, 200, 200), [(0, 0), (10, 5), (0, 10)])
+
         self.state = "FADING_IN"
         self.fade_alpha = 255
         self.fade_speed = 3
@@ -26,19 +34,43 @@ class Cutscene:
         for i, scene in enumerate(self.scenes):
             path = scene.get("image")
             if path and os.path.exists(path):
-                try:
-                    self.images[i] = pygame.image.load(path).convert()
-                except pygame.error as e:
-                    print(f"Failed to load cutscene image: {path}. Error: {e}")
-                    self.images[i] = self.create_placeholder(f"Image {i+1} not found")
+                self.image_paths[i] = path
             else:
                 self.images[i] = self.create_placeholder(f"Scene {i+1}")
+        assets.preload(self.image_paths.values())
+
+    def release(self):
+        for path in self.image_paths.values():
+            assets.unload(path)
+        self.scaled_images = {}
+
+    def get_scaled_image(self, index):
+        size = self.screen.get_size()
+        path = self.image_paths.get(index)
+        if path is not None:
+            image = assets.get_image(path, alpha=False, size=size)
+            if image is not None:
+                return image
+            self.image_paths.pop(index)
+            self.images[index] = self.create_placeholder(f"Image {index+1} not found")
+
+        image = self.images.get(index)
+        if image is None:
+            return None
+
+        key = (index, size)
+        scaled = self.scaled_images.get(key)
+        if scaled is None:
+            if len(self.scaled_images) >= len(self.images):
+                self.scaled_images = {k: v for k, v in self.scaled_images.items() if k[1] == size}
+            scaled = pygame.transform.scale(image, size)
+            self.scaled_images[key] = scaled
+        return scaled
 
     def create_placeholder(self, text):
         surf = pygame.Surface(self.screen.get_size())
         surf.fill((10, 10, 10))
-        font = pygame.font.SysFont("arial", 40)
-        text_surf = font.render(text, True, (50, 50, 50))
+        text_surf = render_text(get_font("arial", 40), text, True, (50, 50, 50))
         rect = text_surf.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
         surf.blit(text_surf, rect)
         return surf
@@ -90,57 +122,37 @@ class Cutscene:
         if not self.is_active:
             return
 
-        bg_image = self.images.get(self.scene_index)
-        if bg_image:
-            scaled_bg = pygame.transform.scale(bg_image, self.screen.get_size())
+        scaled_bg = self.get_scaled_image(self.scene_index)
+        if scaled_bg:
             self.screen.blit(scaled_bg, (0, 0))
         else:
             self.screen.fill((0, 0, 0))
 
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 120))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(get_scrim(self.screen.get_size(), (0, 0, 0), 120), (0, 0))
 
         if self.state == "TEXT_DISPLAY":
-            current_line_text = self.scenes[self.scene_index]["text"]
-            visible_text = current_line_text[:int(self.char_index)]
-            self.draw_text_wrapped(visible_text)
+            self.draw_text_wrapped(self.scenes[self.scene_index]["text"], int(self.char_index))
 
             if self.is_line_complete:
-                icon_surf = pygame.Surface((10, 10), pygame.SRCALPHA)
-                pygame.draw.polygon(icon_surf, (200, 200, 200), [(0, 0), (10, 5), (0, 10)])
-                self.screen.blit(icon_surf, (self.screen.get_width() - 40, self.screen.get_height() - 40))
+                self.screen.blit(self.continue_icon, (self.screen.get_width() - 40, self.screen.get_height() - 40))
 
         if self.state in ["FADING_IN", "FADING_OUT"]:
-            fade_surface = pygame.Surface(self.screen.get_size())
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(self.fade_alpha)
-            self.screen.blit(fade_surface, (0, 0))
-
-    def draw_text_wrapped(self, text):
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        max_width = self.screen.get_width() * 0.8
-
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            w, h = self.font.size(test_line)
-            if w < max_width:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        lines.append(' '.join(current_line))
+            self.screen.blit(get_scrim(self.screen.get_size(), (0, 0, 0), self.fade_alpha), (0, 0))
+
+    def draw_text_wrapped(self, text, visible_chars):
+        lines = wrap_text(self.font, text, self.screen.get_width() * 0.8)
 
         total_height = len(lines) * self.font.get_height()
         start_y = self.screen.get_height() - total_height - 60
 
-        for i, line in enumerate(lines):
-            shadow_surf = self.font.render(line, True, (0, 0, 0))
+        # Whole lines are rendered once and clipped to the typed prefix, so the typewriter does not fill the text
+        # cache with a surface per character.
+        for i, (line, width) in enumerate(reveal_lines(self.font, lines, visible_chars)):
+            shadow_surf = render_text(self.font, line, True, (0, 0, 0))
+            area = pygame.Rect(0, 0, width, shadow_surf.get_height()) if width is not None else None
             shadow_rect = shadow_surf.get_rect(center=(self.screen.get_width() // 2 + 2, start_y + i * self.font.get_height() + 2))
-            self.screen.blit(shadow_surf, shadow_rect)
+            self.screen.blit(shadow_surf, shadow_rect, area)
 
-            surf = self.font.render(line, True, self.color)
+            surf = render_text(self.font, line, True, self.color)
             rect = surf.get_rect(center=(self.screen.get_width() // 2, start_y + i * self.font.get_height()))
-            self.screen.blit(surf, rect)
+            self.screen.blit(surf, rect, area)
@@ -1,4 +1,5 @@
 import pygame
+from src.core.surface_pool import get_scrim
 
 
 class DeathScreen:
@@ -22,6 +23,8 @@ class DeathScreen:
         self.text_surf = self.font_large.render("YOU DIED", True, (180, 20, 20))
         self.text_rect = self.text_surf.get_rect(center=(self.w // 2, self.h // 2))
 
+        self.shadow_surf = self.font_large.render("YOU DIED", True, (0, 0, 0))
+
         self.restart_surf = self.font_small.render("Press R to Restart", True, (200, 200, 200))
         self.restart_rect = self.restart_surf.get_rect(center=(self.w // 2, self.h // 2 + 80))
 
@@ -57,29 +60,24 @@ class DeathScreen:
         if not self.active:
             return
 
-        overlay = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, int(self.bg_alpha)))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_scrim((self.w, self.h), (0, 0, 0), self.bg_alpha), (0, 0))
 
         if self.text_alpha > 0:
-            temp_surf = self.text_surf.copy()
-            temp_surf.set_alpha(int(self.text_alpha))
+            self.text_surf.set_alpha(int(self.text_alpha))
 
-            shadow_surf = self.font_large.render("YOU DIED", True, (0, 0, 0))
-            shadow_surf.set_alpha(int(self.text_alpha * 0.8))
-            screen.blit(shadow_surf, (self.text_rect.x + 4, self.text_rect.y + 4))
+            self.shadow_surf.set_alpha(int(self.text_alpha * 0.8))
+            screen.blit(self.shadow_surf, (self.text_rect.x + 4, self.text_rect.y + 4))
 
-            screen.blit(temp_surf, self.text_rect)
+            screen.blit(self.text_surf, self.text_rect)
 
             if self.text_alpha > 50:
                 line_w = int(self.w * (self.text_alpha / 255.0))
                 line_h = 2
-                line_surf = pygame.Surface((line_w, line_h), pygame.SRCALPHA)
-                line_surf.fill((100, 0, 0, int(self.text_alpha * 0.5)))
-                line_rect = line_surf.get_rect(center=(self.w // 2, self.h // 2))
-                screen.blit(line_surf, line_rect)
+                line_surf = get_scrim((self.w, line_h), (100, 0, 0), int(self.text_alpha * 0.5))
+                line_rect = pygame.Rect(0, 0, line_w, line_h)
+                line_rect.center = (self.w // 2, self.h // 2)
+                screen.blit(line_surf, line_rect, (0, 0, line_w, line_h))
 
         if self.restart_alpha > 0:
-            temp_restart = self.restart_surf.copy()
-            temp_restart.set_alpha(int(self.restart_alpha))
-            screen.blit(temp_restart, self.restart_rect)
+            self.restart_surf.set_alpha(int(self.restart_alpha))
+            screen.blit(self.restart_surf, self.restart_rect)
@@ -1,5 +1,6 @@
 import pygame
-from src.core.settings import screen_width, screen_height
+from src.core.text_cache import get_font, render_text, reveal_lines, wrap_text
+from src.core.surface_pool import get_panel
 
 
 class DialogueBox:
@@ -16,13 +17,13 @@ class DialogueBox:
         self.margin_bottom = 30
 
         try:
-            self.font_text = pygame.font.SysFont("timesnewroman", 28)
-            self.font_choice = pygame.font.SysFont("timesnewroman", 26, bold=True)
-            self.font_name = pygame.font.SysFont("timesnewroman", 30, bold=True)
+            self.font_text = get_font("timesnewroman", 28)
+            self.font_choice = get_font("timesnewroman", 26, bold=True)
+            self.font_name = get_font("timesnewroman", 30, bold=True)
         except:
-            self.font_text = pygame.font.SysFont(None, 28)
-            self.font_choice = pygame.font.SysFont(None, 26)
-            self.font_name = pygame.font.SysFont(None, 30)
+            self.font_text = get_font(None, 28)
+            self.font_choice = get_font(None, 26)
+            self.font_name = get_font(None, 30)
 
         self.text_to_render = ""
         self.current_char = 0
@@ -137,20 +138,17 @@ class DialogueBox:
         x = (current_w - width) // 2
         y = current_h - self.height - self.margin_bottom
 
-        s = pygame.Surface((width, self.height), pygame.SRCALPHA)
-        s.fill((15, 15, 20, 230))
-        self.screen.blit(s, (x, y))
+        self.screen.blit(get_panel((width, self.height), (15, 15, 20, 230)), (x, y))
 
         pygame.draw.rect(self.screen, (180, 150, 90), (x, y, width, self.height), 2)
 
-        name_surf = self.font_name.render(self.npc_name, True, (200, 180, 100))
+        name_surf = render_text(self.font_name, self.npc_name, True, (200, 180, 100))
         self.screen.blit(name_surf, (x + self.padding, y + 15))
 
         text_start_y = y + 50
-        visible_text = self.text_to_render[:int(self.current_char)]
-
         text_end_y = self.draw_text_wrapped(
-            visible_text,
+            self.text_to_render,
+            int(self.current_char),
             x + self.padding,
             text_start_y,
             width - self.padding * 2
@@ -172,7 +170,7 @@ class DialogueBox:
                     color = (255, 255, 255)
                     indicator_visible = True
 
-                txt_surf = self.font_choice.render(choice['text'], True, color)
+                txt_surf = render_text(self.font_choice, choice['text'], True, color)
                 rect = txt_surf.get_rect(center=(x + width // 2, choice_y))
 
                 if choice_y + txt_surf.get_height() < y + self.height:
@@ -183,26 +181,16 @@ class DialogueBox:
 
                 choice_y += txt_surf.get_height() + 10
 
-    def draw_text_wrapped(self, text, x, y, max_width):
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            w, h = self.font_text.size(test_line)
-            if w < max_width:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        lines.append(' '.join(current_line))
+    def draw_text_wrapped(self, text, visible_chars, x, y, max_width):
+        lines = wrap_text(self.font_text, text, max_width)
 
         line_height = self.font_text.get_height() + 5
         current_y = y
 
-        for line in lines:
-            surf = self.font_text.render(line, True, (220, 220, 220))
-            self.screen.blit(surf, (x, current_y))
+        for line, width in reveal_lines(self.font_text, lines, visible_chars):
+            surf = render_text(self.font_text, line, True, (220, 220, 220))
+            area = pygame.Rect(0, 0, width, surf.get_height()) if width is not None else None
+            self.screen.blit(surf, (x, current_y), area)
             current_y += line_height
 
         return current_y
@@ -1,5 +1,7 @@
 import pygame
 import time
+from src.core.text_cache import render_text
+from src.core.surface_pool import get_panel
 
 
 class Toast:
@@ -15,10 +17,9 @@ class Toast:
         now = int(time.time() * 1000)
         if now > self.until or not self.message:
             return
-        t = font_small.render(self.message, True, (255, 255, 255))
+        t = render_text(font_small, self.message, True, (255, 255, 255))
         pad = 10
-        surf = pygame.Surface((t.get_width() + pad * 2, t.get_height() + pad * 2), pygame.SRCALPHA)
-        surf.fill((0, 0, 0, 180))
+        surf = get_panel((t.get_width() + pad * 2, t.get_height() + pad * 2), (0, 0, 0, 180))
         x = screen.get_width() // 2 - surf.get_width() // 2
         y = 30
         screen.blit(surf, (x, y))
@@ -1,4 +1,5 @@
 import pygame
+from src.core.surface_pool import get_scrim, get_panel
 import src.core.settings as settings
 
 
@@ -59,13 +60,8 @@ class MainOption:
     def draw(self):
         if not self.visible: return
 
-        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
-
-        panel = pygame.Surface((self.panel_w, self.panel_h), pygame.SRCALPHA)
-        panel.fill((20, 20, 20, 230))
-        self.screen.blit(panel, (self.panel_x, self.panel_y))
+        self.screen.blit(get_scrim(self.screen.get_size(), (0, 0, 0), 150), (0, 0))
+        self.screen.blit(get_panel((self.panel_w, self.panel_h), (20, 20, 20, 230)), (self.panel_x, self.panel_y))
 
         pygame.draw.rect(self.screen, (100, 100, 100), (self.panel_x, self.panel_y, self.panel_w, self.panel_h), 2)
         pygame.draw.rect(self.screen, (50, 50, 50),
@@ -1,6 +1,11 @@
 import pygame
-import random
-from src.core.settings import screen_width, screen_height
+from src.core.text_cache import get_font, render_text
+from src.core.runtime import prepare_surface
+from src.core.assets import assets
+from src.core.rng import get_sampler
+
+MENU_BACKGROUND = "src/assets/images/Background_Images/bggame.png"
+ash_rng = get_sampler("menu.ash")
 
 
 class AshParticle:
@@ -8,16 +13,19 @@ class AshParticle:
         self.w = w
         self.h = h
         self.reset()
-        self.x = random.randint(0, w)
-        self.y = random.randint(0, h)
+        self.x = ash_rng.randint(0, w)
+        self.y = ash_rng.randint(0, h)
 
     def reset(self):
-        self.x = random.randint(0, self.w)
-        self.y = random.randint(self.h, self.h + 100)
-        self.speed = random.uniform(0.5, 2.0)
-        self.drift = random.uniform(-0.5, 0.5)
-        self.size = random.randint(1, 3)
-        self.alpha = random.randint(50, 150)
+        self.x = ash_rng.randint(0, self.w)
+        self.y = ash_rng.randint(self.h, self.h + 100)
+        self.speed = ash_rng.uniform(0.5, 2.0)
+        self.drift = ash_rng.uniform(-0.5, 0.5)
+        self.size = ash_rng.randint(1, 3)
+        self.alpha = ash_rng.randint(50, 150)
+        self.surface = pygame.Surface((self.size, self.size))
+        self.surface.fill((200, 200, 200))
+        self.surface.set_alpha(self.alpha)
 
     def update(self):
         self.y -= self.speed
@@ -26,9 +34,7 @@ class AshParticle:
             self.reset()
 
     def draw(self, surface):
-        s = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        s.fill((200, 200, 200, self.alpha))
-        surface.blit(s, (int(self.x), int(self.y)))
+        surface.blit(self.surface, (int(self.x), int(self.y)))
 
 
 class Menu:
@@ -38,66 +44,72 @@ class Menu:
         self.selected = 0
 
         try:
-            self.font_title = pygame.font.SysFont("timesnewroman", 72, bold=True)
-            self.font_option = pygame.font.SysFont("timesnewroman", 36)
+            self.font_title = get_font("timesnewroman", 72, bold=True)
+            self.font_option = get_font("timesnewroman", 36)
         except:
-            self.font_title = pygame.font.SysFont(None, 80)
-            self.font_option = pygame.font.SysFont(None, 40)
+            self.font_title = get_font(None, 80)
+            self.font_option = get_font(None, 40)
 
-        try:
-            img = pygame.image.load("src/assets/images/Background_Images/bggame.png").convert_alpha()
-            self.bg_image_original = img
-            self.bg_image = pygame.transform.scale(img, (screen.get_width(), screen.get_height()))
-        except Exception as e:
-            print("Background load failed:", e)
-            self.bg_image_original = None
-            self.bg_image = None
+        self.bg_path = MENU_BACKGROUND
+        self.bg_image = None
+        if assets.get_image(self.bg_path) is None:
+            print("Background load failed:", self.bg_path)
 
         self.particles = [AshParticle(screen.get_width(), screen.get_height()) for _ in range(50)]
 
         self.spacing = 60
+        self.background = None
         self.recalculate_layout()
 
     def recalculate_layout(self):
         current_w, current_h = self.screen.get_size()
 
-        if self.bg_image_original:
-            self.bg_image = pygame.transform.scale(self.bg_image_original, (current_w, current_h))
+        self.bg_image = assets.get_image(self.bg_path, size=(current_w, current_h))
+        assets.drop_variants(self.bg_path, keep_size=(current_w, current_h))
 
         self.particles = [AshParticle(current_w, current_h) for _ in range(50)]
 
         self.start_y = int(current_h * 0.6)
         self.option_rects = []
         for i, option in enumerate(self.options):
-            text = self.font_option.render(option, True, (255, 255, 255))
+            text = render_text(self.font_option, option, True, (255, 255, 255))
             rect = text.get_rect(center=(current_w // 2, self.start_y + i * self.spacing))
             self.option_rects.append(rect)
 
-    def draw(self):
-        current_w, current_h = self.screen.get_size()
+        self.background = self.compose_background(current_w, current_h)
+
+    def compose_background(self, current_w, current_h):
+        background = prepare_surface(pygame.Surface((current_w, current_h)), alpha=False)
 
         if self.bg_image:
-            self.screen.blit(self.bg_image, (0, 0))
+            background.blit(self.bg_image, (0, 0))
         else:
-            self.screen.fill((10, 10, 10))
+            background.fill((10, 10, 10))
+
+        if current_h > 0:
+            column = pygame.Surface((1, current_h), pygame.SRCALPHA)
+            for y in range(current_h):
+                column.set_at((0, y), (0, 0, 0, int((y / current_h) * 150)))
+            background.blit(pygame.transform.scale(column, (current_w, current_h)), (0, 0))
 
-        overlay = pygame.Surface((current_w, current_h), pygame.SRCALPHA)
+        title_surf = render_text(self.font_title, "BEBEBE", True, (200, 200, 200))
+        shadow_surf = render_text(self.font_title, "BEBEBE", True, (0, 0, 0))
+        title_rect = title_surf.get_rect(center=(current_w // 2, current_h * 0.25))
+        background.blit(shadow_surf, (title_rect.x + 4, title_rect.y + 4))
+        background.blit(title_surf, title_rect)
+
+        return background
+
+    def draw(self):
+        if self.background is None or self.background.get_size() != self.screen.get_size():
+            self.recalculate_layout()
 
-        for y in range(current_h):
-            alpha = int((y / current_h) * 150)
-            pygame.draw.line(overlay, (0, 0, 0, alpha), (0, y), (current_w, y))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.background, (0, 0))
 
         for p in self.particles:
             p.update()
             p.draw(self.screen)
 
-        title_surf = self.font_title.render("BEBEBE", True, (200, 200, 200))
-        shadow_surf = self.font_title.render("BEBEBE", True, (0, 0, 0))
-        title_rect = title_surf.get_rect(center=(current_w // 2, current_h * 0.25))
-        self.screen.blit(shadow_surf, (title_rect.x + 4, title_rect.y + 4))
-        self.screen.blit(title_surf, title_rect)
-
         mouse_pos = pygame.mouse.get_pos()
         for i, option in enumerate(self.options):
             rect = self.option_rects[i]
@@ -114,12 +126,11 @@ class Menu:
                 ]
                 pygame.draw.polygon(self.screen, (200, 50, 50), indicator_points)
 
-                glow_surf = self.font_option.render(option, True, (200, 200, 200))
-                glow_surf.set_alpha(50)
+                glow_surf = render_text(self.font_option, option, True, (200, 200, 200), alpha=50)
                 self.screen.blit(glow_surf, (rect.x - 2, rect.y - 2))
                 self.screen.blit(glow_surf, (rect.x + 2, rect.y + 2))
 
-            text_surf = self.font_option.render(option, True, color)
+            text_surf = render_text(self.font_option, option, True, color)
             self.screen.blit(text_surf, rect)
 
     def handle_ev(self, events):
@@ -1,5 +1,5 @@
 import pygame
-from src.core.settings import screen_width, screen_height
+from src.core.surface_pool import get_scrim, get_panel
 
 
 class BaseSubMenu:
@@ -28,13 +28,8 @@ class BaseSubMenu:
 
         current_w, current_h = self.screen.get_size()
 
-        overlay = pygame.Surface((current_w, current_h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
-
-        panel = pygame.Surface((self.panel_w, self.panel_h), pygame.SRCALPHA)
-        panel.fill((20, 20, 20, 240))
-        self.screen.blit(panel, (self.panel_x, self.panel_y))
+        self.screen.blit(get_scrim((current_w, current_h), (0, 0, 0), 150), (0, 0))
+        self.screen.blit(get_panel((self.panel_w, self.panel_h), (20, 20, 20, 240)), (self.panel_x, self.panel_y))
 
         pygame.draw.rect(self.screen, (100, 100, 100), (self.panel_x, self.panel_y, self.panel_w, self.panel_h), 2)
 
@@ -1,4 +1,6 @@
 import pygame
+from src.core.text_cache import render_text
+from src.core.surface_pool import get_scrim
 
 
 class UpgradeMenu:
@@ -70,17 +72,13 @@ class UpgradeMenu:
     def draw(self, screen, player, font, font_small):
         w = screen.get_width()
         h = screen.get_height()
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_scrim((w, h), (0, 0, 0), 200), (0, 0))
         panel_w = 680
         panel_h = 420
         panel_x = w // 2 - panel_w // 2
         panel_y = h // 2 - panel_h // 2
-        panel = pygame.Surface((panel_w, panel_h))
-        panel.fill((24, 24, 24))
-        screen.blit(panel, (panel_x, panel_y))
-        title = font.render("Level Up", True, (255, 255, 255))
+        screen.fill((24, 24, 24), (panel_x, panel_y, panel_w, panel_h))
+        title = render_text(font, "Level Up", True, (255, 255, 255))
         screen.blit(title, (panel_x + 20, panel_y + 16))
         left_w = 260
         right_w = panel_w - left_w - 40
@@ -90,7 +88,7 @@ class UpgradeMenu:
         for i, name in enumerate(self.attributes):
             r = pygame.Rect(list_x, list_y + i * 50, left_w, 44)
             pygame.draw.rect(screen, sel_color if i == self.selected_index else (40, 40, 40), r, 0, 6)
-            t = font_small.render(name, True, (255, 255, 255))
+            t = render_text(font_small, name, True, (255, 255, 255))
             screen.blit(t, (r.x + 12, r.y + 10))
         vals = self.current_values(player)
         next_vals = self.next_values(player)
@@ -98,12 +96,12 @@ class UpgradeMenu:
         cost = self.cost_for(player, attr)
         currency = getattr(player, "currency", 0)
         right_x = list_x + left_w + 20
-        name_t = font.render(attr, True, (255, 255, 255))
+        name_t = render_text(font, attr, True, (255, 255, 255))
         screen.blit(name_t, (right_x, list_y))
-        cv = font_small.render(f"Current: {vals[attr]}", True, (220, 220, 220))
-        nv = font_small.render(f"Next: {next_vals[attr]}", True, (220, 255, 220))
-        cc = font_small.render(f"Cost: {cost}", True, (255, 232, 102))
-        cur = font_small.render(f"Currency: {currency}", True, (144, 238, 144))
+        cv = render_text(font_small, f"Current: {vals[attr]}", True, (220, 220, 220))
+        nv = render_text(font_small, f"Next: {next_vals[attr]}", True, (220, 255, 220))
+        cc = render_text(font_small, f"Cost: {cost}", True, (255, 232, 102))
+        cur = render_text(font_small, f"Currency: {currency}", True, (144, 238, 144))
         screen.blit(cv, (right_x, list_y + 50))
         screen.blit(nv, (right_x, list_y + 90))
         screen.blit(cc, (right_x, list_y + 130))
@@ -115,11 +113,11 @@ class UpgradeMenu:
         can_afford = currency >= cost
         pygame.draw.rect(screen, (144, 238, 144) if can_afford else (120, 120, 120), confirm, 0, 8)
         pygame.draw.rect(screen, (255, 232, 102), back, 0, 8)
-        ctext = font_small.render("Confirm", True, (0, 0, 0))
-        btext = font_small.render("Back", True, (0, 0, 0))
+        ctext = render_text(font_small, "Confirm", True, (0, 0, 0))
+        btext = render_text(font_small, "Back", True, (0, 0, 0))
         screen.blit(ctext, (confirm.centerx - ctext.get_width() // 2, confirm.centery - ctext.get_height() // 2))
         screen.blit(btext, (back.centerx - btext.get_width() // 2, back.centery - btext.get_height() // 2))
-        hint = font_small.render("Esc to close", True, (220, 220, 220))
+        hint = render_text(font_small, "Esc to close", True, (220, 220, 220))
         screen.blit(hint, (panel_x + panel_w - hint.get_width() - 16, panel_y + 16))
         return confirm, back
 
@@ -1,4 +1,5 @@
 import pygame
+from src.core.surface_pool import get_scrim
 from src.core.settings import WHITE
 
 
@@ -31,9 +32,7 @@ class InventoryPanel:
         if not self.visible: return
         current_w, current_h = self.screen.get_size()
 
-        overlay = pygame.Surface((current_w, current_h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(get_scrim((current_w, current_h), (0, 0, 0), 180), (0, 0))
 
         title = self.font_title.render("Inventory", True, WHITE)
         self.screen.blit(title, title.get_rect(center=(current_w // 2, 120)))
@@ -1,5 +1,5 @@
 import pygame
-from src.core.settings import screen_width, screen_height
+from src.core.surface_pool import get_scrim, get_panel
 
 
 class PauseMenu:
@@ -44,13 +44,8 @@ class PauseMenu:
 
         current_w, current_h = self.screen.get_size()
 
-        overlay = pygame.Surface((current_w, current_h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
-
-        bar_surf = pygame.Surface((current_w, self.top_bar_height), pygame.SRCALPHA)
-        bar_surf.fill((20, 20, 20, 230))
-        self.screen.blit(bar_surf, (0, 40))
+        self.screen.blit(get_scrim((current_w, current_h), (0, 0, 0), 150), (0, 0))
+        self.screen.blit(get_panel((current_w, self.top_bar_height), (20, 20, 20, 230)), (0, 40))
 
         pygame.draw.line(self.screen, (100, 100, 100), (0, 40), (current_w, 40), 2)
         pygame.draw.line(self.screen, (100, 100, 100), (0, 40 + self.top_bar_height),
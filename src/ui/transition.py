@@ -0,0 +1,47 @@
+from src.core.surface_pool import get_scrim
+
+
+class FadeTransition:
+    def __init__(self, duration_ms=250, color=(0, 0, 0)):
+        self.duration_ms = duration_ms
+        self.color = color
+        self.phase = None
+        self.timer = 0
+        self.on_swap = None
+        self.active = False
+
+    def start(self, on_swap):
+        if self.active:
+            return
+        self.phase = "out"
+        self.timer = 0
+        self.on_swap = on_swap
+        self.active = True
+
+    def update(self, dt):
+        if not self.active:
+            return
+
+        self.timer += dt
+        if self.phase == "out" and self.timer >= self.duration_ms:
+            on_swap = self.on_swap
+            self.on_swap = None
+            if on_swap:
+                on_swap()
+            self.phase = "in"
+            self.timer = 0
+        elif self.phase == "in" and self.timer >= self.duration_ms:
+            self.phase = None
+            self.active = False
+
+    def alpha(self):
+        progress = min(1.0, self.timer / self.duration_ms) if self.duration_ms > 0 else 1.0
+        if self.phase == "out":
+            return int(255 * progress)
+        if self.phase == "in":
+            return int(255 * (1.0 - progress))
+        return 0
+
+    def draw(self, screen):
+        if self.active:
+            screen.blit(get_scrim(screen.get_size(), self.color, self.alpha()), (0, 0))
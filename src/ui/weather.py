@@ -1,96 +1,143 @@
 import pygame
-import random
-from src.core.settings import screen_width, screen_height
+from array import array
+from operator import add
+from src.core.runtime import prepare_surface
+from src.core.rng import get_sampler
 
-
-class RainDrop:
-    def __init__(self, w, h):
-        self.w = w
-        self.h = h
-        self.reset()
-        self.y = random.randint(0, h)
-
-    def reset(self):
-        self.x = random.randint(0, self.w)
-        self.y = random.randint(-50, -10)
-        self.speed = random.randint(10, 20)
-        self.length = random.randint(10, 20)
-        self.thickness = random.randint(1, 2)
-        self.wind = 2
-
-    def update(self):
-        self.y += self.speed
-        self.x += self.wind
-        if self.y > self.h:
-            self.reset()
-
-    def draw(self, screen):
-        pygame.draw.line(screen, (150, 150, 180, 100), (self.x, self.y), (self.x + self.wind, self.y + self.length),
-                         self.thickness)
+RAIN_COLOR = (150, 150, 180)
+RAIN_COLORKEY = (0, 0, 0)
+FOG_COLOR = (200, 200, 220)
+FOG_SIZE_STEP = 10
+FOG_ALPHA_STEP = 4
 
 
 class Rain:
-    def __init__(self, screen, intensity=100):
+    def __init__(self, screen, intensity=100, wind=2):
         self.screen = screen
-        self.drops = [RainDrop(screen.get_width(), screen.get_height()) for _ in range(intensity)]
+        self.w, self.h = screen.get_size()
+        self.wind = wind
+        self.count = intensity
+        self.rng = get_sampler("weather.rain")
+
+        self.pad = 2
+        self.offset_x = self.pad if wind >= 0 else self.pad - wind
+        self.offset_y = self.pad
+
+        self.x = array("i", [0]) * intensity
+        self.y = array("i", [0]) * intensity
+        self.speed = array("i", [0]) * intensity
+        self.sprite_index = array("B", [0]) * intensity
+
+        self.sprites = []
+        self.sprite_keys = {}
+        self.build_sprites()
+
+        self.respawn(range(intensity))
+        for i, y in enumerate(self.rng.randints(0, self.h, intensity)):
+            self.y[i] = y - self.offset_y
+
+    def build_sprites(self):
+        for length in range(10, 21):
+            for thickness in (1, 2):
+                size = (abs(self.wind) + self.pad * 2 + 1, length + self.pad * 2 + 1)
+                sprite = prepare_surface(pygame.Surface(size), alpha=False)
+                sprite.fill(RAIN_COLORKEY)
+                start = (self.offset_x, self.offset_y)
+                end = (self.offset_x + self.wind, self.offset_y + length)
+                pygame.draw.line(sprite, RAIN_COLOR, start, end, thickness)
+                sprite.set_colorkey(RAIN_COLORKEY, pygame.RLEACCEL)
+                self.sprite_keys[(length, thickness)] = len(self.sprites)
+                self.sprites.append(sprite)
+
+    def respawn(self, indices):
+        count = len(indices)
+        rng = self.rng
+        columns = zip(indices, rng.randints(0, self.w, count), rng.randints(-50, -10, count),
+                      rng.randints(10, 20, count), rng.randints(10, 20, count), rng.randints(1, 2, count))
+        for i, x, y, speed, length, thickness in columns:
+            self.x[i] = x - self.offset_x
+            self.y[i] = y - self.offset_y
+            self.speed[i] = speed
+            self.sprite_index[i] = self.sprite_keys[(length, thickness)]
 
     def update(self):
-        for drop in self.drops:
-            drop.update()
+        self.y = array("i", map(add, self.y, self.speed))
+        self.x = array("i", map((self.wind).__add__, self.x))
+
+        limit = self.h - self.offset_y
+        if max(self.y, default=limit) > limit:
+            self.respawn([i for i, y in enumerate(self.y) if y > limit])
 
     def draw(self):
-        for drop in self.drops:
-            drop.draw(self.screen)
+        if self.count:
+            sprites = map(self.sprites.__getitem__, self.sprite_index)
+            self.screen.blits(zip(sprites, zip(self.x, self.y)), doreturn=False)
 
     def recalculate_layout(self):
-        w, h = self.screen.get_size()
-        for drop in self.drops:
-            drop.w = w
-            drop.h = h
-
-
-class FogParticle:
-    def __init__(self, w, h):
-        self.w = w
-        self.h = h
-        self.reset()
-        self.x = random.randint(0, w)
-        self.y = random.randint(0, h)
-
-    def reset(self):
-        self.x = -100
-        self.y = random.randint(0, self.h)
-        self.speed = random.uniform(0.2, 0.8)
-        self.size = random.randint(100, 300)
-        self.alpha = random.randint(20, 60)
-
-    def update(self):
-        self.x += self.speed
-        if self.x > self.w + 100:
-            self.reset()
-            self.x = -100
-
-    def draw(self, screen):
-        s = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        pygame.draw.circle(s, (200, 200, 220, self.alpha), (self.size // 2, self.size // 2), self.size // 2)
-        screen.blit(s, (int(self.x), int(self.y)))
+        self.w, self.h = self.screen.get_size()
 
 
 class Fog:
-    def __init__(self, screen, density=20):
+    def __init__(self, screen, density=20, max_sprites=64):
         self.screen = screen
-        self.particles = [FogParticle(screen.get_width(), screen.get_height()) for _ in range(density)]
+        self.w, self.h = screen.get_size()
+        self.count = density
+        self.max_sprites = max_sprites
+        self.rng = get_sampler("weather.fog")
+
+        self.x = array("f", [0.0]) * density
+        self.y = array("i", [0]) * density
+        self.speed = array("f", [0.0]) * density
+        self.size = array("H", [0]) * density
+        self.alpha = array("B", [0]) * density
+
+        self.atlas = {}
+
+        for i in range(density):
+            self.reset(i)
+        for i, (x, y) in enumerate(zip(self.rng.randints(0, self.w, density), self.rng.randints(0, self.h, density))):
+            self.x[i] = x
+            self.y[i] = y
+
+    def reset(self, i):
+        self.x[i] = -100
+        rng = self.rng
+        self.y[i] = rng.randint(0, self.h)
+        self.speed[i] = rng.uniform(0.2, 0.8)
+        self.size[i] = round(rng.randint(100, 300) / FOG_SIZE_STEP) * FOG_SIZE_STEP
+        self.alpha[i] = round(rng.randint(20, 60) / FOG_ALPHA_STEP) * FOG_ALPHA_STEP
+
+        if len(self.atlas) > self.max_sprites:
+            in_use = {(self.size[j], self.alpha[j]) for j in range(self.count)}
+            self.atlas = {key: sprite for key, sprite in self.atlas.items() if key in in_use}
+
+    def get_sprite(self, size, alpha):
+        key = (size, alpha)
+        sprite = self.atlas.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, FOG_COLOR + (alpha,), (size // 2, size // 2), size // 2)
+            sprite = prepare_surface(sprite)
+            self.atlas[key] = sprite
+        return sprite
 
     def update(self):
-        for p in self.particles:
-            p.update()
+        xs, speeds = self.x, self.speed
+        limit = self.w + 100
+        for i in range(self.count):
+            x = xs[i] + speeds[i]
+            if x > limit:
+                self.reset(i)
+            else:
+                xs[i] = x
 
     def draw(self):
-        for p in self.particles:
-            p.draw(self.screen)
+        xs, ys, sizes, alphas = self.x, self.y, self.size, self.alpha
+        blit_list = []
+        for i in range(self.count):
+            blit_list.append((self.get_sprite(sizes[i], alphas[i]), (int(xs[i]), ys[i])))
+        if blit_list:
+            self.screen.blits(blit_list, doreturn=False)
 
     def recalculate_layout(self):
-        w, h = self.screen.get_size()
-        for p in self.particles:
-            p.w = w
-            p.h = h
+        self.w, self.h = self.screen.get_size()
@@ -0,0 +1,109 @@
+import heapq
+import math
+from array import array
+
+NEIGHBORS = (
+    (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+    (1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)), (-1, 1, math.sqrt(2)), (-1, -1, math.sqrt(2)),
+)
+
+
+class FlowField:
+    def __init__(self, max_distance=None, min_interval=0):
+        self.map = None
+        self.max_distance = max_distance
+        self.min_interval = min_interval
+        self.target = None
+        self.map_version = None
+        self.built_at = None
+        self.distance = array("d")
+        self.next_step = array("l")
+
+    def update(self, game_map, target_x, target_y, now=None):
+        target = (int(target_x), int(target_y))
+        if game_map is self.map and game_map.version == self.map_version:
+            if target == self.target:
+                return False
+            # A field a tile or two behind the player still leads chasers the right way, so it is not rebuilt more
+            # often than min_interval while the player runs across tiles.
+            if now is not None and self.built_at is not None and now - self.built_at < self.min_interval:
+                return False
+
+        self.map = game_map
+        self.target = target
+        self.map_version = game_map.version
+        self.built_at = now
+        self.rebuild()
+        return True
+
+    def rebuild(self):
+        width = self.map.width_tiles
+        height = self.map.height_tiles
+        walkable = self.map.walkable
+        size = width * height
+
+        self.distance = array("d", [math.inf]) * size
+        self.next_step = array("l", [-1]) * size
+
+        tx, ty = self.target
+        if not (0 <= tx < width and 0 <= ty < height):
+            return
+
+        max_distance = self.max_distance if self.max_distance is not None else math.inf
+        distance = self.distance
+        next_step = self.next_step
+
+        target_index = ty * width + tx
+        distance[target_index] = 0.0
+        open_heap = [(0.0, target_index)]
+
+        while open_heap:
+            dist, current = heapq.heappop(open_heap)
+            if dist > distance[current]:
+                continue
+
+            cx = current % width
+            cy = current // width
+            for dx, dy, step_cost in NEIGHBORS:
+                nx = cx + dx
+                ny = cy + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbor = ny * width + nx
+                if not walkable[neighbor]:
+                    continue
+                if dx and dy and not (walkable[cy * width + nx] and walkable[ny * width + cx]):
+                    continue
+
+                new_dist = dist + step_cost
+                if new_dist < distance[neighbor] and new_dist <= max_distance:
+                    distance[neighbor] = new_dist
+                    next_step[neighbor] = current
+                    heapq.heappush(open_heap, (new_dist, neighbor))
+
+    def next_tile(self, x, y):
+        if self.map is None:
+            return None
+
+        tile_x = int(x)
+        tile_y = int(y)
+        width = self.map.width_tiles
+        if not (0 <= tile_x < width and 0 <= tile_y < self.map.height_tiles):
+            return None
+
+        step = self.next_step[tile_y * width + tile_x]
+        if step < 0:
+            return None
+        return step % width, step // width
+
+    def direction_from(self, x, y):
+        next_tile = self.next_tile(x, y)
+        if next_tile is None:
+            return None
+
+        dx = next_tile[0] + 0.5 - x
+        dy = next_tile[1] + 0.5 - y
+        length = math.hypot(dx, dy)
+        if length == 0:
+            return None
+        return dx / length, dy / length
@@ -1,77 +1,114 @@
 import pygame
-import random
 import math
-import os
+from array import array
 from src.core.settings import tile_size
+from src.world.pathfinding import Pathfinder
+from src.core.runtime import prepare_surface
+from src.core.assets import assets
+from src.core.atlas import TextureAtlas
 
+CHUNK_SIZE = 16
+WALKABLE_GROUND = frozenset((1, 2, 3, 9))
 
-class Tile:
-    def __init__(self, tile_type, height=0):
-        self.type = tile_type
+GROUND_TEXTURES = {
+    0: ("src/assets/images/textures/ground/water.png", (20, 30, 70)),
+    1: ("src/assets/images/textures/ground/grass.png", (50, 60, 40)),
+    2: ("src/assets/images/textures/ground/wood.png", (130, 110, 90)),
+    3: ("src/assets/images/textures/ground/path.png", (80, 70, 60)),
+    4: ("src/assets/images/textures/ground/wather_grass.png", (30, 45, 55)),
+    5: ("src/assets/images/textures/ground/wood_aside.png", (20, 30, 70)),
+}
+
+
+class TileLayer:
+    def __init__(self, width, height, data=None):
+        self.width = width
         self.height = height
-        self.building_id = None
+        self.data = data if data is not None else array("B", bytes(width * height))
+
+    @classmethod
+    def from_rows(cls, rows, width, height):
+        layer = cls(width, height)
+        for y, row in enumerate(rows[:height]):
+            row = row[:width]
+            try:
+                values = array("B", row)
+            except TypeError:
+                values = array("B", [cell or 0 for cell in row])
+            offset = y * width
+            layer.data[offset:offset + len(values)] = values
+        return layer
+
+    def get(self, x, y):
+        return self.data[y * self.width + x]
+
+    def set(self, x, y, tile_type):
+        self.data[y * self.width + x] = tile_type
+
+    def row(self, y, start=0, end=None):
+        offset = y * self.width
+        if end is None:
+            end = self.width
+        return self.data[offset + start:offset + end]
 
 
 class Map:
-    def __init__(self, map_data_dict=None):
+    def __init__(self, map_data_dict=None, load_graphics=True):
         if map_data_dict:
-            self.height_tiles = len(map_data_dict["water"])
-            self.width_tiles = len(map_data_dict["water"][0]) if self.height_tiles > 0 else 0
-
-            self.layer_water = []
-            for y in range(self.height_tiles):
-                row = map_data_dict["water"][y] if y < len(map_data_dict["water"]) else []
-                new_row = [Tile(row[x]) if x < len(row) else Tile(0) for x in range(self.width_tiles)]
-                self.layer_water.append(new_row)
-
-            self.layer_ground = []
-            for y in range(self.height_tiles):
-                row = map_data_dict["ground"][y] if y < len(map_data_dict["ground"]) else []
-                new_row = [Tile(cell) if cell is not None and x < len(row) else None for x, cell in enumerate(row)]
-                new_row = new_row[:self.width_tiles] + [None] * (self.width_tiles - len(new_row))
-                self.layer_ground.append(new_row)
-            while len(self.layer_ground) < self.height_tiles:
-                self.layer_ground.append([None] * self.width_tiles)
-
-
-            self.layer_objects = []
-            for y in range(self.height_tiles):
-                row = map_data_dict["objects"][y] if y < len(map_data_dict["objects"]) else []
-                new_row = [Tile(cell) if cell is not None and x < len(row) else None for x, cell in enumerate(row)]
-                new_row = new_row[:self.width_tiles] + [None] * (self.width_tiles - len(new_row))
-                self.layer_objects.append(new_row)
-            while len(self.layer_objects) < self.height_tiles:
-                self.layer_objects.append([None] * self.width_tiles)
-
+            water = map_data_dict["water"]
+            if hasattr(water, "width"):
+                self.height_tiles = water.height
+                self.width_tiles = water.width
+            else:
+                self.height_tiles = len(water)
+                self.width_tiles = len(water[0]) if self.height_tiles > 0 else 0
         else:
+            map_data_dict = {"water": [], "ground": [], "objects": []}
             self.width_tiles = 20
             self.height_tiles = 20
-            self.layer_water = [[Tile(0) for _ in range(self.width_tiles)] for _ in range(self.height_tiles)]
-            self.layer_ground = [[None for _ in range(self.width_tiles)] for _ in range(self.height_tiles)]
-            self.layer_objects = [[None for _ in range(self.width_tiles)] for _ in range(self.height_tiles)]
+
+        self.layer_water = self.make_layer(map_data_dict["water"])
+        self.layer_ground = self.make_layer(map_data_dict["ground"])
+        self.layer_objects = self.make_layer(map_data_dict["objects"])
+        self.layers = {"water": self.layer_water, "ground": self.layer_ground, "objects": self.layer_objects}
+
+        self.walkable = bytearray(self.width_tiles * self.height_tiles)
+        self.rebuild_walkability()
+        self.find_trigger_tiles()
+        self.version = 0
+        self.pathfinder = Pathfinder(self)
 
         self.width = self.width_tiles * tile_size
         self.height = self.height_tiles * tile_size
 
+        self.background_color = (30, 30, 30)
+        self.chunk_pixels = CHUNK_SIZE * tile_size
+        self.chunks_w = (self.width_tiles + CHUNK_SIZE - 1) // CHUNK_SIZE
+        self.chunks_h = (self.height_tiles + CHUNK_SIZE - 1) // CHUNK_SIZE
+        self.chunks = {}
+
         self.textures = {}
+        self.atlas = None
+        self.graphics_loaded = False
+        if load_graphics:
+            self.load_graphics()
+
+    def make_layer(self, source):
+        if hasattr(source, "width"):
+            return source
+        return TileLayer.from_rows(source, self.width_tiles, self.height_tiles)
+
+    def load_graphics(self):
+        if self.graphics_loaded:
+            return
         self.load_textures()
+        self.build_atlas()
+        self.graphics_loaded = True
 
     def load_textures(self):
-        def get_texture(path, fallback_color):
-            if os.path.exists(path):
-                try:
-                    img = pygame.image.load(path).convert_alpha()
-                    return pygame.transform.scale(img, (tile_size, tile_size))
-                except:
-                    pass
-            return self.create_texture(fallback_color)
-
-        self.textures[0] = get_texture("src/assets/images/textures/ground/water.png", (20, 30, 70))
-        self.textures[1] = get_texture("src/assets/images/textures/ground/grass.png", (50, 60, 40))
-        self.textures[2] = get_texture("src/assets/images/textures/ground/wood.png", (130, 110, 90))
-        self.textures[3] = get_texture("src/assets/images/textures/ground/path.png", (80, 70, 60))
-        self.textures[4] = get_texture("src/assets/images/textures/ground/wather_grass.png", (30, 45, 55))
-        self.textures[5] = get_texture("src/assets/images/textures/ground/wood_aside.png", (20, 30, 70))
+        for tile_type, (path, fallback_color) in GROUND_TEXTURES.items():
+            texture = assets.get_image(path, size=(tile_size, tile_size))
+            self.textures[tile_type] = texture if texture is not None else self.create_texture(fallback_color)
 
         self.textures[6] = self.create_texture((20, 50, 20))
         self.textures[7] = self.create_texture((100, 80, 60))
@@ -80,12 +117,28 @@ class Map:
 
         self.textures[9] = self.create_texture((200, 150, 50))
 
+    def build_atlas(self):
+        self.atlas = TextureAtlas(page_size=(tile_size * 8, tile_size * 8), padding=0)
+        for tile_type, texture in self.textures.items():
+            self.atlas.add(tile_type, texture)
+        self.tile_regions = {tile_type: self.atlas.get(tile_type) for tile_type in self.textures}
+
     def create_texture(self, color):
         s = pygame.Surface((tile_size, tile_size))
         s.fill(color)
         s.set_alpha(100)
         return s
 
+    def rebuild_walkability(self):
+        self.walkable = bytearray(
+            1 if obj_type == 0 and ground_type in WALKABLE_GROUND else 0
+            for ground_type, obj_type in zip(self.layer_ground.data, self.layer_objects.data)
+        )
+
+    def update_walkability(self, tile_x, tile_y):
+        walkable = self.layer_objects.get(tile_x, tile_y) == 0 and self.layer_ground.get(tile_x, tile_y) in WALKABLE_GROUND
+        self.walkable[tile_y * self.width_tiles + tile_x] = 1 if walkable else 0
+
     def is_walkable(self, x, y):
         tile_x = int(x)
         tile_y = int(y)
@@ -93,41 +146,143 @@ class Map:
         if not (0 <= tile_x < self.width_tiles and 0 <= tile_y < self.height_tiles):
             return False
 
-        obj_tile = self.layer_objects[tile_y][tile_x]
-        if obj_tile and obj_tile.type != 0:
-            return False
+        return self.walkable[tile_y * self.width_tiles + tile_x] == 1
 
-        ground_tile = self.layer_ground[tile_y][tile_x]
-        if ground_tile is None:
-            return False
+    def are_walkable(self, cells):
+        width, height, walkable = self.width_tiles, self.height_tiles, self.walkable
+        return [
+            0 <= x < width and 0 <= y < height and walkable[y * width + x] == 1
+            for x, y in cells
+        ]
+
+    def is_segment_walkable(self, x0, y0, x1, y1):
+        tile_x, tile_y = int(x0), int(y0)
+        end_x, end_y = int(x1), int(y1)
+        dx = x1 - x0
+        dy = y1 - y0
+
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        t_delta_x = abs(1 / dx) if dx else math.inf
+        t_delta_y = abs(1 / dy) if dy else math.inf
+        t_max_x = ((tile_x + (step_x > 0)) - x0) / dx if dx else math.inf
+        t_max_y = ((tile_y + (step_y > 0)) - y0) / dy if dy else math.inf
 
-        return ground_tile.type in [1, 2, 3, 9]
+        for _ in range(abs(end_x - tile_x) + abs(end_y - tile_y) + 1):
+            if not self.is_walkable(tile_x, tile_y):
+                return False
+            if tile_x == end_x and tile_y == end_y:
+                break
+            if t_max_x < t_max_y:
+                t_max_x += t_delta_x
+                tile_x += step_x
+            else:
+                t_max_y += t_delta_y
+                tile_y += step_y
+
+        return self.is_walkable(x1, y1)
+
+    def find_trigger_tiles(self):
+        width = self.width_tiles
+        self.trigger_tiles = [(i % width, i // width) for i, tile_type in enumerate(self.layer_ground.data) if tile_type == 9]
+
+    def distance_to_trigger(self, x, y):
+        if not self.trigger_tiles:
+            return math.inf
+        return min(math.hypot(tx + 0.5 - x, ty + 0.5 - y) for tx, ty in self.trigger_tiles)
 
     def check_trigger(self, x, y):
         tile_x = int(x)
         tile_y = int(y)
         if 0 <= tile_x < self.width_tiles and 0 <= tile_y < self.height_tiles:
-            ground_tile = self.layer_ground[tile_y][tile_x]
-            if ground_tile and ground_tile.type == 9:
+            if self.layer_ground.get(tile_x, tile_y) == 9:
                 return True
         return False
 
+    def set_tile(self, layer, x, y, tile_type):
+        if not (0 <= x < self.width_tiles and 0 <= y < self.height_tiles):
+            return
+
+        self.layers[layer].set(x, y, tile_type or 0)
+        self.update_walkability(x, y)
+        if layer == "ground":
+            self.find_trigger_tiles()
+        self.invalidate_chunk(x, y)
+        self.version += 1
+
+    def invalidate_chunk(self, tile_x, tile_y):
+        self.chunks.pop((tile_x // CHUNK_SIZE, tile_y // CHUNK_SIZE), None)
+
+    def invalidate_all_chunks(self):
+        self.chunks.clear()
+
+    def build_chunk(self, cx, cy):
+        start_x = cx * CHUNK_SIZE
+        start_y = cy * CHUNK_SIZE
+        end_x = min(self.width_tiles, start_x + CHUNK_SIZE)
+        end_y = min(self.height_tiles, start_y + CHUNK_SIZE)
+
+        surface = pygame.Surface(((end_x - start_x) * tile_size, (end_y - start_y) * tile_size))
+        surface = prepare_surface(surface, alpha=False)
+        surface.fill(self.background_color)
+
+        regions = self.tile_regions
+        default_region = regions.get(0)
+        blit_list = []
+        for y in range(start_y, end_y):
+            water_row = self.layer_water.row(y, start_x, end_x)
+            ground_row = self.layer_ground.row(y, start_x, end_x)
+            objects_row = self.layer_objects.row(y, start_x, end_x)
+
+            for i in range(end_x - start_x):
+                pos = (i * tile_size, (y - start_y) * tile_size)
+
+                page, area = regions.get(water_row[i], default_region)
+                blit_list.append((page, pos, area))
+
+                if ground_row[i] != 0:
+                    page, area = regions.get(ground_row[i], default_region)
+                    blit_list.append((page, pos, area))
+
+                if objects_row[i] != 0:
+                    page, area = regions.get(objects_row[i], default_region)
+                    blit_list.append((page, pos, area))
+
+        surface.blits(blit_list, doreturn=False)
+        return surface
+
+    def get_chunk(self, cx, cy):
+        chunk = self.chunks.get((cx, cy))
+        if chunk is None:
+            chunk = self.build_chunk(cx, cy)
+            self.chunks[(cx, cy)] = chunk
+        return chunk
+
+    def prebuild_chunks(self, tile_x, tile_y, radius=1, budget=2):
+        self.load_graphics()
+        center_cx = int(tile_x) // CHUNK_SIZE
+        center_cy = int(tile_y) // CHUNK_SIZE
+
+        missing = [
+            (abs(cx - center_cx) + abs(cy - center_cy), cx, cy)
+            for cy in range(max(0, center_cy - radius), min(self.chunks_h, center_cy + radius + 1))
+            for cx in range(max(0, center_cx - radius), min(self.chunks_w, center_cx + radius + 1))
+            if (cx, cy) not in self.chunks
+        ]
+        missing.sort()
+        for _, cx, cy in missing[:budget]:
+            self.get_chunk(cx, cy)
+        return len(missing) <= budget
+
     def draw(self, screen, camera_x, camera_y):
-        start_col = max(0, int(camera_x // tile_size))
-        end_col = min(self.width_tiles, int((camera_x + screen.get_width()) // tile_size) + 2)
-        start_row = max(0, int(camera_y // tile_size))
-        end_row = min(self.height_tiles, int((camera_y + screen.get_height()) // tile_size) + 2)
-
-        for y in range(start_row, end_row):
-            for x in range(start_col, end_col):
-                
-                water_tile = self.layer_water[y][x]
-                screen.blit(self.textures.get(water_tile.type, self.textures.get(0)), (x * tile_size - camera_x, y * tile_size - camera_y))
-
-                ground_tile = self.layer_ground[y][x]
-                if ground_tile and ground_tile.type != 0:
-                    screen.blit(self.textures.get(ground_tile.type, self.textures.get(0)), (x * tile_size - camera_x, y * tile_size - camera_y))
-
-                obj_tile = self.layer_objects[y][x]
-                if obj_tile and obj_tile.type != 0:
-                    screen.blit(self.textures.get(obj_tile.type, self.textures.get(0)), (x * tile_size - camera_x, y * tile_size - camera_y))
+        self.load_graphics()
+        start_cx = max(0, int(camera_x // self.chunk_pixels))
+        end_cx = min(self.chunks_w, int((camera_x + screen.get_width()) // self.chunk_pixels) + 1)
+        start_cy = max(0, int(camera_y // self.chunk_pixels))
+        end_cy = min(self.chunks_h, int((camera_y + screen.get_height()) // self.chunk_pixels) + 1)
+
+        screen.blits([
+            (self.get_chunk(cx, cy), (cx * self.chunk_pixels - camera_x, cy * self.chunk_pixels - camera_y))
+            for cy in range(start_cy, end_cy)
+            for cx in range(start_cx, end_cx)
+        ], doreturn=False)
@@ -0,0 +1,81 @@
+import threading
+
+from src.world.level_manager import Map
+
+
+class LevelStreamer:
+    def __init__(self, locations, neighbours, preload_distance=8, chunk_budget=2):
+        self.locations = locations
+        self.neighbours = neighbours
+        self.preload_distance = preload_distance
+        self.chunk_budget = chunk_budget
+
+        self.lock = threading.Lock()
+        self.ready = {}
+        self.workers = {}
+        self.spawn_hints = {}
+
+    def request(self, name, spawn=None):
+        if spawn is not None:
+            self.spawn_hints[name] = spawn
+
+        with self.lock:
+            if name in self.ready or name in self.workers or name not in self.locations:
+                return
+            thread = threading.Thread(target=self.build, args=(name,), name=f"level-{name}", daemon=True)
+            self.workers[name] = thread
+        thread.start()
+
+    def load_data(self, name):
+        source = self.locations[name]
+        return source() if callable(source) else source
+
+    def build(self, name):
+        new_map = Map(self.load_data(name), load_graphics=False)
+        with self.lock:
+            self.ready[name] = new_map
+            self.workers.pop(name, None)
+
+    def is_ready(self, name):
+        with self.lock:
+            return name in self.ready
+
+    def update(self, current_name, game_map, player_x, player_y, spawn_for=None):
+        neighbour = self.neighbours.get(current_name)
+        if neighbour is not None and game_map.distance_to_trigger(player_x, player_y) <= self.preload_distance:
+            self.request(neighbour, spawn_for(neighbour) if spawn_for else None)
+        self.finish_pending()
+
+    def finish_pending(self):
+        with self.lock:
+            pending = list(self.ready.items())
+
+        for name, pending_map in pending:
+            if not pending_map.graphics_loaded:
+                pending_map.load_graphics()
+                return
+
+            spawn = self.spawn_hints.get(name)
+            if spawn is not None and not pending_map.prebuild_chunks(spawn[0], spawn[1], budget=self.chunk_budget):
+                return
+
+    def take(self, name):
+        with self.lock:
+            thread = self.workers.get(name)
+        if thread is not None:
+            thread.join()
+
+        with self.lock:
+            new_map = self.ready.pop(name, None)
+        if new_map is None:
+            new_map = Map(self.load_data(name), load_graphics=False)
+        new_map.load_graphics()
+        return new_map
+
+    def store(self, name, game_map):
+        with self.lock:
+            self.ready[name] = game_map
+
+    def discard(self, name):
+        with self.lock:
+            self.ready.pop(name, None)
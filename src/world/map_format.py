@@ -0,0 +1,113 @@
+import argparse
+import importlib
+import mmap
+import os
+import struct
+
+from src.world.level_manager import TileLayer
+
+MAGIC = b"GMAP"
+VERSION = 1
+LAYER_NAMES = ("water", "ground", "objects")
+HEADER = struct.Struct("<4sHHHH")
+LAYER_NAME_SIZE = 16
+LOCATIONS_DIR = os.path.join("src", "world", "locations")
+
+
+class MapFormatError(ValueError):
+    pass
+
+
+def encode_map(map_data):
+    height = len(map_data["water"])
+    width = len(map_data["water"][0]) if height > 0 else 0
+
+    parts = [HEADER.pack(MAGIC, VERSION, width, height, len(LAYER_NAMES))]
+    for name in LAYER_NAMES:
+        parts.append(name.encode("ascii").ljust(LAYER_NAME_SIZE, b"\0"))
+    for name in LAYER_NAMES:
+        source = map_data[name]
+        layer = source if isinstance(source, TileLayer) else TileLayer.from_rows(source, width, height)
+        parts.append(bytes(layer.data))
+    return b"".join(parts)
+
+
+def write_map(path, map_data):
+    with open(path, "wb") as f:
+        f.write(encode_map(map_data))
+
+
+def decode_header(buffer):
+    if len(buffer) < HEADER.size:
+        raise MapFormatError("file is too short for a map header")
+
+    magic, version, width, height, layer_count = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise MapFormatError(f"bad magic {magic!r}")
+    if version != VERSION:
+        raise MapFormatError(f"unsupported map version {version}")
+
+    names = []
+    offset = HEADER.size
+    for _ in range(layer_count):
+        names.append(bytes(buffer[offset:offset + LAYER_NAME_SIZE]).rstrip(b"\0").decode("ascii"))
+        offset += LAYER_NAME_SIZE
+
+    expected = offset + layer_count * width * height
+    if len(buffer) < expected:
+        raise MapFormatError(f"truncated map: {len(buffer)} bytes, expected {expected}")
+
+    return width, height, names, offset
+
+
+def layers_from_buffer(buffer):
+    width, height, names, offset = decode_header(buffer)
+    plane_size = width * height
+
+    map_data = {}
+    for name in names:
+        map_data[name] = TileLayer(width, height, buffer[offset:offset + plane_size])
+        offset += plane_size
+
+    for name in LAYER_NAMES:
+        if name not in map_data:
+            map_data[name] = TileLayer(width, height)
+    return map_data
+
+
+def read_map(path):
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    return layers_from_buffer(memoryview(mapped))
+
+
+def location_path(name):
+    return os.path.join(LOCATIONS_DIR, f"{name}.gmap")
+
+
+def load_location(name):
+    path = location_path(name)
+    if os.path.exists(path):
+        return read_map(path)
+    return importlib.import_module(f"src.world.locations.{name}").map_data
+
+
+def convert_location(name):
+    map_data = importlib.import_module(f"src.world.locations.{name}").map_data
+    path = location_path(name)
+    write_map(path, map_data)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert location modules to binary .gmap files.")
+    parser.add_argument("locations", nargs="+", help="location module names, e.g. port village")
+    args = parser.parse_args()
+
+    for name in args.locations:
+        path = convert_location(name)
+        print(f"{name}: wrote {path} ({os.path.getsize(path)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import heapq
+from collections import OrderedDict
+
+DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+
+
+class Pathfinder:
+    def __init__(self, game_map, frame_budget=3000, cache_size=256, max_pending=8):
+        self.map = game_map
+        self.frame_budget = frame_budget
+        self.nodes_left = frame_budget
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.cache_version = game_map.version
+        self.max_pending = max_pending
+        self.pending = OrderedDict()
+
+    def begin_frame(self):
+        self.nodes_left = self.frame_budget
+
+    def invalidate(self):
+        self.cache.clear()
+        self.pending.clear()
+        self.cache_version = self.map.version
+
+    def find_path(self, start, goal):
+        if start == goal:
+            return ()
+
+        if self.cache_version != self.map.version:
+            self.invalidate()
+
+        key = (start, goal)
+        path = self.cache.get(key)
+        if path is not None:
+            self.cache.move_to_end(key)
+            return path
+
+        if self.nodes_left <= 0:
+            return None
+
+        path = self.search(start, goal)
+        if path is None:
+            return None
+        self.cache[key] = path
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return path
+
+    def search(self, start, goal):
+        width = self.map.width_tiles
+        height = self.map.height_tiles
+        walkable = self.map.walkable
+        sx, sy = start
+        gx, gy = goal
+
+        if not (0 <= sx < width and 0 <= sy < height and 0 <= gx < width and 0 <= gy < height):
+            return ()
+        goal_index = gy * width + gx
+        if not walkable[goal_index]:
+            return ()
+
+        start_index = sy * width + sx
+        key = (start, goal)
+        state = self.pending.pop(key, None)
+        if state is None:
+            state = ({start_index: -1}, {start_index: 0}, [(abs(sx - gx) + abs(sy - gy), 0, start_index)])
+        came_from, cost, open_heap = state
+        budget = self.nodes_left
+        expanded = 0
+
+        while open_heap:
+            if expanded >= budget:
+                # Out of nodes for this frame: park the open and closed sets and pick the search up again next frame.
+                self.nodes_left = 0
+                self.pending[key] = state
+                if len(self.pending) > self.max_pending:
+                    self.pending.popitem(last=False)
+                return None
+
+            _, neg_g, current = heapq.heappop(open_heap)
+            if current == goal_index:
+                break
+            g = -neg_g
+            if g > cost[current]:
+                continue
+
+            expanded += 1
+            cx = current % width
+            cy = current // width
+            for dx, dy in DIRECTIONS:
+                nx = cx + dx
+                ny = cy + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbor = ny * width + nx
+                if not walkable[neighbor]:
+                    continue
+                new_cost = g + 1
+                if new_cost < cost.get(neighbor, new_cost + 1):
+                    cost[neighbor] = new_cost
+                    came_from[neighbor] = current
+                    heapq.heappush(open_heap, (new_cost + abs(nx - gx) + abs(ny - gy), -new_cost, neighbor))
+
+        self.nodes_left -= expanded
+
+        if goal_index not in came_from:
+            return ()
+
+        path = []
+        current = goal_index
+        while current != start_index:
+            path.append((current % width, current // width))
+            current = came_from[current]
+        path.reverse()
+        return tuple(path)
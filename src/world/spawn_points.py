@@ -0,0 +1,11 @@
+SPAWN_POINTS = {
+    "port": {"default": (32, 30), "from_village": (32, 2)},
+    "village": {"default": (20, 38), "from_port": (20, 38)},
+}
+
+
+def get_spawn_point(map_name, entry_point="default"):
+    points = SPAWN_POINTS.get(map_name)
+    if points is None:
+        return None
+    return points.get(entry_point, points["default"])
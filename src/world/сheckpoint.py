@@ -1,6 +1,12 @@
 import pygame
-import random
 from src.core.settings import tile_size
+from src.core.particles import ParticleSystem
+from src.core.text_cache import render_text
+from src.core.surface_pool import get_scrim, get_panel
+from src.core.rng import get_sampler
+
+FIRE_COLORS = [(255, 140, 0), (255, 80, 0), (255, 180, 0)]
+fire_rng = get_sampler("checkpoint.fire")
 
 
 class Checkpoint(pygame.sprite.Sprite):
@@ -11,7 +17,7 @@ class Checkpoint(pygame.sprite.Sprite):
         self.image = pygame.Surface((tile_size * 2, tile_size * 2), pygame.SRCALPHA)
         self.rect = self.image.get_rect(center=(self.x * tile_size + tile_size / 2, self.y * tile_size + tile_size / 2))
 
-        self.fire_particles = []
+        self.fire_particles = ParticleSystem(capacity=50, shrink=0.25)
         self.bonfire_lit = False
         self.base_color = (40, 40, 40)
         self.base_radius = tile_size // 2
@@ -45,24 +51,17 @@ class Checkpoint(pygame.sprite.Sprite):
         self.active = self.is_player_near(player)
 
     def update_fire_particles(self):
+        if self.bonfire_lit and len(self.fire_particles) < self.fire_particles.capacity:
+            self.emit_particle()
 
-        if self.bonfire_lit:
-            if len(self.fire_particles) < 50:
-                self.fire_particles.append(self.create_particle())
-
-        for particle in self.fire_particles:
-            particle['pos'][0] += particle['vel'][0]
-            particle['pos'][1] += particle['vel'][1]
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.fire_particles.remove(particle)
+        self.fire_particles.update()
 
-    def create_particle(self):
-        pos = [self.rect.centerx, self.rect.centery]
-        vel = [random.uniform(-0.5, 0.5), random.uniform(-1, -0.2)]
-        color = random.choice([(255, 140, 0), (255, 80, 0), (255, 180, 0)])
-        life = random.randint(20, 40)
-        return {'pos': pos, 'vel': vel, 'life': life, 'color': color}
+    def emit_particle(self):
+        vx = fire_rng.uniform(-0.5, 0.5)
+        vy = fire_rng.uniform(-1, -0.2)
+        color = fire_rng.choice(FIRE_COLORS)
+        life = fire_rng.randint(20, 40)
+        self.fire_particles.emit(self.rect.centerx, self.rect.centery, vx, vy, life, life / 4, color)
 
     def open_menu(self, player):
         self.menu_open = True
@@ -99,9 +98,7 @@ class Checkpoint(pygame.sprite.Sprite):
         base_pos = (self.rect.centerx - camera_x, self.rect.centery - camera_y)
         pygame.draw.circle(screen, self.base_color, base_pos, self.base_radius)
 
-        for particle in self.fire_particles:
-            pos = (int(particle['pos'][0] - camera_x), int(particle['pos'][1] - camera_y))
-            pygame.draw.circle(screen, particle['color'], pos, int(particle['life'] / 4))
+        self.fire_particles.draw(screen, camera_x, camera_y)
 
         self.draw_prompt(screen, camera_x, camera_y, font_small)
 
@@ -118,15 +115,13 @@ class Checkpoint(pygame.sprite.Sprite):
             self.prompt_dir *= -1
 
         prompt_text = "Light Bonfire" if not self.bonfire_lit else "Rest at Bonfire"
-        text = font_small.render(f"Press E to {prompt_text}", True, (255, 255, 255))
-        s = pygame.Surface(text.get_size(), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 120))
+        text = render_text(font_small, f"Press E to {prompt_text}", True, (255, 255, 255), alpha=self.prompt_alpha)
+        s = get_panel(text.get_size(), (0, 0, 0, 120))
 
         px = int(self.rect.centerx - camera_x - text.get_width() // 2)
         py = int(self.rect.top - camera_y - 30)
 
         screen.blit(s, (px, py))
-        text.set_alpha(self.prompt_alpha)
         screen.blit(text, (px, py))
 
     def draw_menu(self, screen, font, font_small):
@@ -134,25 +129,21 @@ class Checkpoint(pygame.sprite.Sprite):
             return
 
         w, h = screen.get_width(), screen.get_height()
-        overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        screen.blit(overlay, (0, 0))
+        screen.blit(get_scrim((w, h), (0, 0, 0), 180), (0, 0))
 
         title_text = "Bonfire"
         b1_text = "Rest"
         b2_text = "Level Up"
 
-        title = font.render(title_text, True, (255, 255, 255))
-        b1 = font.render(b1_text, True, (0, 0, 0))
-        b2 = font.render(b2_text, True, (0, 0, 0))
-        hint = font_small.render("Esc or Right Mouse Button to close", True, (220, 220, 220))
+        title = render_text(font, title_text, True, (255, 255, 255))
+        b1 = render_text(font, b1_text, True, (0, 0, 0))
+        b2 = render_text(font, b2_text, True, (0, 0, 0))
+        hint = render_text(font_small, "Esc or Right Mouse Button to close", True, (220, 220, 220))
 
         panel_w, panel_h = 420, 280
         panel_x, panel_y = w // 2 - panel_w // 2, h // 2 - panel_h // 2
 
-        panel = pygame.Surface((panel_w, panel_h))
-        panel.fill((24, 24, 24))
-        screen.blit(panel, (panel_x, panel_y))
+        screen.fill((24, 24, 24), (panel_x, panel_y, panel_w, panel_h))
         screen.blit(title, (panel_x + panel_w // 2 - title.get_width() // 2, panel_y + 20))
 
         btn_w, btn_h = 320, 60